@@ -7,6 +7,12 @@ class Admin::CoverLettersController < Admin::BaseController
     @cover_letter = CoverLetter.find(params[:id])
   end
 
+  # 전체 자소서 점수 재계산 (백그라운드 잡으로 배치 단위 처리)
+  def rescore
+    CoverLetterRescoreJob.perform_later
+    redirect_to admin_cover_letters_path, notice: "자소서 점수 재계산을 시작했습니다. 완료까지 시간이 걸릴 수 있습니다."
+  end
+
   def destroy
     @cover_letter = CoverLetter.find(params[:id])
     @cover_letter.destroy
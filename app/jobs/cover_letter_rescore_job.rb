@@ -0,0 +1,20 @@
+class CoverLetterRescoreJob < ApplicationJob
+  queue_as :default
+
+  BATCH_SIZE = 500
+
+  # 전체 자소서 점수 재계산 - 배치마다 파이썬 일괄 채점 한 번 + 저장 (배치 단위로 커밋)
+  # 중간에 실패해도 이미 저장한 배치의 점수는 남음
+  def perform(batch_size: BATCH_SIZE)
+    service = PythonAnalysisService.new
+    scored = 0
+
+    CoverLetter.where.not(content: [ nil, "" ])
+               .select(:id, :content, :company_name, :deep_analysis_data)
+               .find_in_batches(batch_size: batch_size) do |cover_letters|
+      scored += CoverLetter.rescore_batch(cover_letters, service: service)
+    end
+
+    Rails.logger.info "자소서 점수 재계산 완료: #{scored}건"
+  end
+end
@@ -7,6 +7,28 @@ class CoverLetter < ApplicationRecord
   # Validations - PDF 업로드 시에는 content 없이도 저장 가능
   validates :content, presence: true, unless: :has_pdf_content?
 
+  # 자소서 묶음 점수 재계산 - 파이썬 배치 채점 한 번으로 계산해 deep_analysis_data["scores"]에 저장
+  # (CoverLetterRescoreJob이 find_in_batches 배치마다 호출) 반환값은 채점한 자소서 수
+  def self.rescore_batch(cover_letters, service: PythonAnalysisService.new)
+    return 0 if cover_letters.empty?
+
+    scores = service.score_cover_letters(cover_letters.map { |letter| { text: letter.content, company: letter.company_name } })
+    now = Time.current
+    scored_at = now.iso8601
+
+    # update_all은 updated_at을 갱신하지 않으므로 직접 지정 (캐시 키/최근 수정 목록 반영)
+    transaction do
+      cover_letters.zip(scores).each do |letter, score|
+        where(id: letter.id).update_all(
+          deep_analysis_data: (letter.deep_analysis_data || {}).merge("scores" => score.merge("scored_at" => scored_at)),
+          updated_at: now
+        )
+      end
+    end
+
+    cover_letters.size
+  end
+
   private
 
   def has_pdf_content?
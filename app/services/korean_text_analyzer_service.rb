@@ -69,6 +69,71 @@ class KoreanTextAnalyzerService
       []
     end
 
+    # 여러 GPT 응답을 하나의 파이프로 스트리밍 파싱 (--jsonl 모드)
+    # 요청 한 줄을 쓰고 결과 한 줄을 읽으므로 전체를 메모리에 모으지 않음
+    def parse_numbered_items_batch(texts)
+      return [] if texts.blank?
+
+      Open3.popen2('python3', PYTHON_SCRIPT_PATH, '--jsonl') do |stdin, stdout, _wait_thread|
+        results = texts.map do |text|
+          stdin.puts({ action: 'parse_numbered_items', text: text.to_s }.to_json)
+          stdin.flush
+
+          line = stdout.gets
+          raise 'Python process closed the stream' if line.nil?
+
+          result = JSON.parse(line)
+          result['success'] ? result['items'].map { |item| item.transform_keys(&:to_sym) } : fallback_parse_items(text)
+        end
+
+        stdin.close
+        results
+      end
+    rescue => e
+      Rails.logger.error "Korean text batch parsing failed: #{e.message}"
+      texts.map { |text| fallback_parse_items(text) }
+    end
+
+    # 스트리밍 GPT 응답을 조각 단위로 파싱 (--stream 모드)
+    # 항목(### N. **제목**)이 닫히는 즉시 블록으로 넘기므로 응답이 끝나기 전에 앞 항목을 그릴 수 있음
+    # 반환값은 전체 항목 (parse_numbered_items(전체 응답)과 같음)
+    def parse_numbered_items_stream(chunks)
+      items = []
+      text = +''
+
+      Open3.popen2('python3', PYTHON_SCRIPT_PATH, '--stream') do |stdin, stdout, _wait_thread|
+        receive = lambda do |request|
+          stdin.puts(request.to_json)
+          stdin.flush
+
+          line = stdout.gets
+          raise 'Python process closed the stream' if line.nil?
+
+          result = JSON.parse(line)
+          raise result['error'].to_s unless result['success']
+
+          result['items'].each do |item|
+            item = item.transform_keys(&:to_sym)
+            items << item
+            yield item if block_given?
+          end
+        end
+
+        chunks.each do |chunk|
+          text << chunk.to_s
+          receive.call({ chunk: chunk.to_s })
+        end
+        receive.call({ done: true })
+
+        stdin.close
+      end
+
+      items
+    rescue => e
+      Rails.logger.error "Korean text stream parsing failed: #{e.message}"
+      items.presence || fallback_parse_items(text)
+    end
+
     private
 
     def execute_python_command(command, input_text)
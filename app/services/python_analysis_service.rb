@@ -1,3 +1,6 @@
+require "open3"
+require "socket"
+
 class PythonAnalysisService
   include ActiveModel::Model
   include ActiveModel::Attributes
@@ -149,6 +152,55 @@ class PythonAnalysisService
     end
   end
   
+  # 여러 텍스트 품질 분석을 한 번의 프로세스 실행으로 처리 (야간 재채점 등)
+  # 결과는 입력 순서와 같은 배열이며, 실패한 항목은 error를 담은 응답
+  def analyze_text_quality_batch(texts, company_name = nil)
+    Rails.logger.info "=== 파이썬 텍스트 품질 배치 분석 (#{texts.size}건) ==="
+
+    records = texts.map do |text|
+      {
+        text: text.to_s.gsub(/\r\n/, "\n").gsub(/ +/, " ").gsub('"', "'").strip,
+        company: company_name || "",
+        mode: "analyze_only"
+      }
+    end
+
+    execute_python_batch("analyze_quality", records).map do |parsed_result|
+      if parsed_result["error"]
+        create_error_response(parsed_result["error"])
+      else
+        create_success_response(parsed_result)
+      end
+    end
+  rescue => e
+    Rails.logger.error "파이썬 배치 분석 오류: #{e.message}"
+    texts.map { create_error_response(e.message) }
+  end
+
+  # 자소서 여러 건 점수를 한 번의 파이썬 실행으로 계산 (numpy 배치 채점, 관리자 전체 재채점 등)
+  # documents: [{ text:, company: }] → 입력 순서대로 { "advanced" => ..., "interactive" => ..., "quality" => ... }
+  # 점수는 analyze_advanced/analyze_quality 를 한 건씩 실행한 결과와 같음
+  def score_cover_letters(documents)
+    Rails.logger.info "=== 파이썬 자소서 일괄 채점 (#{documents.size}건) ==="
+    return [] if documents.empty?
+
+    input = { documents: documents.map { |document| { text: document[:text].to_s, company: document[:company].to_s } } }.to_json
+    output, error, status = Open3.capture3(
+      python_env_path, "rails_integration.py", "score_cover_letters", "-",
+      stdin_data: input, chdir: scripts_path
+    )
+
+    unless status.success?
+      raise "파이썬 일괄 채점 실패 (exit code: #{status.exitstatus}): #{error}"
+    end
+
+    # 문장이 없는 문서의 평균값은 NaN (문서별 경로와 같음)
+    parsed_result = JSON.parse(output, allow_nan: true)
+    raise parsed_result["error"].to_s unless parsed_result["success"]
+
+    parsed_result["scores"]
+  end
+
   # AI 패턴만 제거 (최소한의 변경)
   def remove_ai_patterns_only(text)
     Rails.logger.info "=== AI 패턴 제거 ==="
@@ -257,6 +309,10 @@ class PythonAnalysisService
   end
 
   def execute_python_script(command, json_input)
+    # 상주 분석 서버가 떠 있으면 소켓으로 요청 (프로세스 생성/import 비용 없음)
+    server_result = execute_via_analysis_server(command, json_input)
+    return server_result if server_result
+
     script_path = File.join(scripts_path, "rails_integration.py")
 
     # 임시 파일에 JSON 데이터 저장 (긴 데이터 처리를 위해)
@@ -283,6 +339,56 @@ class PythonAnalysisService
     end
   end
 
+  # <command>_batch 로 JSONL을 stdin에 흘려보내고 결과를 한 줄씩 읽음
+  def execute_python_batch(command, records)
+    input = records.map(&:to_json).join("\n")
+
+    output, error, status = Open3.capture3(
+      python_env_path, "rails_integration.py", "#{command}_batch",
+      stdin_data: input, chdir: scripts_path
+    )
+
+    unless status.success?
+      raise "파이썬 배치 실행 실패 (exit code: #{status.exitstatus}): #{error}"
+    end
+
+    output.each_line.map { |line| JSON.parse(line) }
+  end
+
+  def analysis_server_socket_path
+    ENV.fetch("PYTHON_ANALYSIS_SOCKET") { Rails.root.join("tmp/sockets/python_analysis.sock").to_s }
+  end
+
+  # 서버 응답 대기 시간 (초) - 서버 작업 타임아웃(기본 60초)보다 조금 길게
+  def analysis_server_timeout
+    ENV.fetch("PYTHON_ANALYSIS_SERVER_TIMEOUT", "65").to_f
+  end
+
+  # rails_integration.py serve 로 띄운 서버에 NDJSON 요청을 보냄
+  # 서버가 없거나 통신에 실패하면(응답 시간 초과 포함) nil을 반환해 기존 프로세스 실행 방식으로 폴백
+  def execute_via_analysis_server(command, json_input)
+    socket_path = analysis_server_socket_path
+    return nil unless File.socket?(socket_path)
+
+    request_id = SecureRandom.uuid
+    request = { id: request_id, command: command, data: JSON.parse(json_input) }
+
+    response_line = UNIXSocket.open(socket_path) do |socket|
+      socket.timeout = analysis_server_timeout
+      socket.write(request.to_json + "\n")
+      socket.gets
+    end
+    return nil if response_line.nil?
+
+    response = JSON.parse(response_line)
+    return nil unless response["id"] == request_id
+
+    response["result"].to_json
+  rescue SystemCallError, IOError, IO::TimeoutError, JSON::ParserError => e
+    Rails.logger.warn "분석 서버 요청 실패, 프로세스 실행으로 폴백: #{e.message}"
+    nil
+  end
+
   def validate_job_data(data)
     {
       company_name: data[:company_name] || data["company_name"] || "",
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+파이썬 분석 계층 벤치마크: 공개 진입점별 지연 시간 분위수, 처리량, 최대 RSS
+
+대상 (진입점 → 코퍼스 파일):
+  analyze_job_posting   rails_integration.execute_command   job_postings.jsonl
+  analyze_company       rails_integration.execute_command   companies.jsonl
+  enhance_rewrite       rails_integration.execute_command   cover_letters.jsonl
+  analyze_only          rails_integration.execute_command   cover_letters.jsonl  (analyze_quality 커맨드)
+  parse_numbered_items  KoreanTextAnalyzer                  analyses.jsonl
+  extract_from_file     EnhancedPdfExtractor                documents.jsonl (pdfs/)
+  smart_split           PdfCoverLetterExtractor             documents.jsonl (페이지 텍스트)
+
+진입점마다 새 프로세스(spawn)에서 실행해 최대 RSS 가 서로 섞이지 않게 함
+- 결과 캐시(ANALYSIS_CACHE=0)와 PDF 추출 캐시는 끄고 측정
+- 가장 작은 입력으로 한 번 먼저 실행 (import/사전 로딩) → 이때 RSS 를 base_rss_mb 로 기록
+- peak_rss_mb 는 프로세스 전체 최대값 (PDF 병렬 추출 워커는 children_peak_rss_mb)
+
+코퍼스는 corpus_builder.py 로 생성 (--corpus 디렉토리에 manifest.json 이 없으면 그 자리에 생성,
+--corpus 가 없으면 임시 디렉토리에 생성 후 삭제)
+
+기준선:
+  python benchmarks/analysis_bench.py --repeat 5 --baseline benchmarks/baseline.json
+  → 지연 시간/RSS 가 --threshold(기본 10%) 넘게 늘거나 처리량이 그만큼 줄면 regressions 에 기록하고 종료 코드 1
+  benchmarks/baseline.json 은 기본 코퍼스(seed 42, 기본 크기)와 --repeat 5 로 생성한 것
+  (반복 1회는 진입점당 호출 12번이라 p99 가 실행마다 10% 안팎으로 흔들림)
+  - 측정한 머신/설정은 파일의 environment 에 기록 (python, platform, cpus, 선택 의존성 설치 여부)
+  - 커밋된 기준선은 공유 1코어 x86_64 컨테이너(Python 3.11, kiwi/okt 없음 → 정규식 백엔드)에서 측정
+    이 환경은 실행마다 10%를 넘게 흔들리므로 회귀 판정에는 전용 머신 또는 --threshold 0.3 정도 사용
+  - 절대 시간은 머신마다 다르므로 environment 가 다르면 warnings 에 표시됨
+    → 다른 머신에서는 변경 전 코드로 먼저 --save-baseline 해서 그 머신의 기준선과 비교
+  - 기준선 갱신: python benchmarks/analysis_bench.py --repeat 5 --save-baseline benchmarks/baseline.json
+
+사용법:
+  python benchmarks/analysis_bench.py
+  python benchmarks/analysis_bench.py --texts 10 --pdfs 4 --max-kb 256 --max-pages 50
+  python benchmarks/analysis_bench.py --corpus tmp/bench_corpus --entries analyze_only,smart_split --repeat 3
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).parent.parent
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus_builder import build_corpus, load_jsonl  # noqa: E402
+
+# 진입점 → 코퍼스 파일
+ENTRIES = {
+    'analyze_job_posting': 'job_postings.jsonl',
+    'analyze_company': 'companies.jsonl',
+    'enhance_rewrite': 'cover_letters.jsonl',
+    'analyze_only': 'cover_letters.jsonl',
+    'parse_numbered_items': 'analyses.jsonl',
+    'extract_from_file': 'documents.jsonl',
+    'smart_split': 'documents.jsonl',
+}
+
+# 설치 여부에 따라 측정 경로가 달라지는 선택 의존성 (kiwi/okt 없으면 정규식 백엔드, PDF 라이브러리별 추출 경로)
+OPTIONAL_MODULES = ['kiwipiepy', 'konlpy', 'PyPDF2', 'pdfplumber', 'fitz']
+
+# 기준선 비교 지표 (True: 클수록 나쁨, False: 작을수록 나쁨)
+COMPARED_METRICS = {
+    'p50_ms': True,
+    'p90_ms': True,
+    'p99_ms': True,
+    'peak_rss_mb': True,
+    'docs_per_s': False,
+    'mb_per_s': False,
+}
+
+def _text_bytes(text: str) -> int:
+    return len(text.encode('utf-8'))
+
+def _prepare(entry: str, corpus: Path) -> Tuple[Callable[[Dict], object], Callable[[Dict], int]]:
+    """진입점 → (레코드 하나 실행 함수, 레코드 입력 바이트 수)"""
+    if entry in ('analyze_job_posting', 'analyze_company', 'enhance_rewrite', 'analyze_only'):
+        from rails_integration import execute_command
+
+        if entry in ('analyze_job_posting', 'analyze_company'):
+            return (lambda record: execute_command(entry, record['data']),
+                    lambda record: _text_bytes(json.dumps(record['data'], ensure_ascii=False)))
+
+        command = 'analyze_quality' if entry == 'analyze_only' else entry
+        return (lambda record: execute_command(command, {'text': record['text'], 'company': record['company']}),
+                lambda record: _text_bytes(record['text']))
+
+    if entry == 'parse_numbered_items':
+        from korean_text_analyzer import KoreanTextAnalyzer
+
+        analyzer = KoreanTextAnalyzer()
+        return (lambda record: analyzer.parse_numbered_items(record['text']),
+                lambda record: _text_bytes(record['text']))
+
+    if entry == 'extract_from_file':
+        from pdf_extractor_enhanced import EnhancedPdfExtractor
+
+        extractor = EnhancedPdfExtractor(use_cache=False)
+        return (lambda record: extractor.extract_from_file(str(corpus / record['file'])),
+                lambda record: (corpus / record['file']).stat().st_size)
+
+    if entry == 'smart_split':
+        from pdf_extractor import PdfCoverLetterExtractor
+
+        extractor = PdfCoverLetterExtractor()
+        return (lambda record: extractor.smart_split(record['pages']),
+                lambda record: sum(_text_bytes(page) for page in record['pages']))
+
+    raise ValueError(f'Unknown entry: {entry}')
+
+def _max_rss_mb(who: int) -> float:
+    """ru_maxrss → MB (Linux는 KB, macOS는 바이트 단위)"""
+    import resource
+
+    rss = resource.getrusage(who).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+def _is_error(result) -> bool:
+    return isinstance(result, dict) and (bool(result.get('error')) or result.get('success', True) is False)
+
+def percentile(values: List[float], q: float) -> float:
+    """선형 보간 분위수 (q: 0~100)"""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def run_entry(entry: str, corpus_dir: str, repeat: int) -> Dict:
+    """하위 프로세스에서 진입점 하나 측정"""
+    import resource
+
+    # 결과는 프로세스 간 파이프로 돌려주므로 라이브러리 출력이 JSON 결과에 섞이지 않게 stdout → stderr
+    sys.stdout.flush()
+    os.dup2(2, 1)
+    os.environ['ANALYSIS_CACHE'] = '0'
+    sys.path.insert(0, str(ROOT / 'lib' / 'python'))
+    sys.path.insert(0, str(ROOT / 'python_analysis'))
+
+    corpus = Path(corpus_dir)
+    records = load_jsonl(corpus / ENTRIES[entry])
+    if not records:
+        return {'skipped': 'empty corpus'}
+
+    try:
+        call, size = _prepare(entry, corpus)
+    except ImportError as e:
+        return {'skipped': f'{type(e).__name__}: {e}'}
+
+    sizes = [size(record) for record in records]
+    call(records[sizes.index(min(sizes))])
+    base_rss = _max_rss_mb(resource.RUSAGE_SELF)
+
+    latencies = []
+    errors = 0
+    first_error = None
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for record in records:
+            call_started = time.perf_counter()
+            result = call(record)
+            latencies.append(time.perf_counter() - call_started)
+            if _is_error(result):
+                errors += 1
+                if first_error is None:
+                    first_error = {'id': record.get('id'), 'error': result.get('error')}
+    elapsed = time.perf_counter() - started
+
+    total_bytes = sum(sizes) * repeat
+    latencies_ms = [latency * 1000 for latency in latencies]
+    report = {
+        'calls': len(latencies),
+        'input_mb': round(total_bytes / (1024 * 1024), 3),
+        'p50_ms': round(percentile(latencies_ms, 50), 3),
+        'p90_ms': round(percentile(latencies_ms, 90), 3),
+        'p99_ms': round(percentile(latencies_ms, 99), 3),
+        'max_ms': round(max(latencies_ms), 3),
+        'mean_ms': round(sum(latencies_ms) / len(latencies_ms), 3),
+        'docs_per_s': round(len(latencies) / elapsed, 3),
+        'mb_per_s': round(total_bytes / (1024 * 1024) / elapsed, 3),
+        'base_rss_mb': round(base_rss, 1),
+        'peak_rss_mb': round(_max_rss_mb(resource.RUSAGE_SELF), 1),
+        'errors': errors
+    }
+    children_rss = _max_rss_mb(resource.RUSAGE_CHILDREN)
+    if children_rss:
+        report['children_peak_rss_mb'] = round(children_rss, 1)
+    if first_error is not None:
+        report['first_error'] = first_error
+    return report
+
+def measure(entry: str, corpus: Path, repeat: int) -> Dict:
+    """진입점마다 새 spawn 프로세스 (이전 진입점의 메모리/모듈이 남지 않게)"""
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as executor:
+        try:
+            return executor.submit(run_entry, entry, str(corpus), repeat).result()
+        except Exception as e:
+            return {'failed': f'{type(e).__name__}: {e}'}
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> Dict:
+    """기준선 대비 변화율과 회귀 목록"""
+    changes = {}
+    regressions = []
+    for entry, metrics in current['entries'].items():
+        before = baseline.get('entries', {}).get(entry)
+        if not before or 'skipped' in before or 'failed' in before or 'skipped' in metrics or 'failed' in metrics:
+            continue
+        entry_changes = {}
+        for metric, higher_is_worse in COMPARED_METRICS.items():
+            old, new = before.get(metric), metrics.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            entry_changes[metric] = {'baseline': old, 'current': new, 'change': round(change, 4)}
+            if (change > threshold) if higher_is_worse else (change < -threshold):
+                regressions.append(f'{entry}.{metric}: {old} → {new} ({change:+.1%})')
+        changes[entry] = entry_changes
+
+    warnings = []
+    for key in ('seed', 'params'):
+        if baseline.get('corpus', {}).get(key) != current['corpus'].get(key):
+            warnings.append(f'corpus {key} differs from baseline')
+    if baseline.get('repeat') != current['repeat']:
+        warnings.append('repeat differs from baseline')
+    for key in ('cpus', 'machine', 'python', 'optional_modules'):
+        if baseline.get('environment', {}).get(key) != current['environment'].get(key):
+            warnings.append(f'environment {key} differs from baseline')
+
+    return {'threshold': threshold, 'changes': changes, 'regressions': regressions, 'warnings': warnings}
+
+def environment() -> Dict:
+    """측정 머신/설정"""
+    from importlib.util import find_spec
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+        'optional_modules': {name: find_spec(name) is not None for name in OPTIONAL_MODULES},
+        'morph_backend': os.environ.get('MORPH_BACKEND', 'auto')
+    }
+
+def load_corpus(args, workdir: Optional[str]) -> Tuple[Path, Dict]:
+    corpus = Path(args.corpus) if args.corpus else Path(workdir)
+    manifest_path = corpus / 'manifest.json'
+    if manifest_path.exists():
+        return corpus, json.loads(manifest_path.read_text(encoding='utf-8'))
+    return corpus, build_corpus(corpus, args.seed, args.texts, args.pdfs, args.min_kb, args.max_kb,
+                                args.min_pages, args.max_pages)
+
+def main():
+    parser = argparse.ArgumentParser(description='파이썬 분석 계층 벤치마크')
+    parser.add_argument('--corpus', help='코퍼스 디렉토리 (manifest.json 이 없으면 생성)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--texts', type=int, default=12, help='텍스트 코퍼스별 건수')
+    parser.add_argument('--pdfs', type=int, default=4, help='PDF 건수')
+    parser.add_argument('--min-kb', type=float, default=1)
+    parser.add_argument('--max-kb', type=float, default=1024)
+    parser.add_argument('--min-pages', type=int, default=1)
+    parser.add_argument('--max-pages', type=int, default=200)
+    parser.add_argument('--entries', default=','.join(ENTRIES), help='측정할 진입점 (쉼표 구분)')
+    parser.add_argument('--repeat', type=int, default=1, help='코퍼스 반복 횟수')
+    parser.add_argument('--save-baseline', help='결과를 기준선 파일로 저장')
+    parser.add_argument('--baseline', help='비교할 기준선 파일')
+    parser.add_argument('--threshold', type=float, default=0.10, help='회귀 판정 변화율 (0.10 = 10%%)')
+    args = parser.parse_args()
+
+    entries = [entry for entry in args.entries.split(',') if entry]
+    unknown = [entry for entry in entries if entry not in ENTRIES]
+    if unknown:
+        print(f"Error: 알 수 없는 진입점 {', '.join(unknown)} (가능: {', '.join(ENTRIES)})", file=sys.stderr)
+        sys.exit(1)
+
+    with tempfile.TemporaryDirectory(prefix='analysis_bench_') as workdir:
+        corpus, manifest = load_corpus(args, workdir)
+        results = {
+            'corpus': {'seed': manifest.get('seed'), 'params': manifest.get('params'), 'files': manifest.get('files')},
+            'environment': environment(),
+            'repeat': args.repeat,
+            'entries': {entry: measure(entry, corpus, args.repeat) for entry in entries}
+        }
+
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding='utf-8')
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding='utf-8'))
+        results['comparison'] = compare(results, baseline, args.threshold)
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+    if args.baseline and results['comparison']['regressions']:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
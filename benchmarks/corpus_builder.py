@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+벤치마크용 합성 코퍼스 생성기 (시드 고정 → 같은 시드면 같은 코퍼스)
+
+create_test_pdf.py 처럼 PDF 구조를 직접 쓰되 (reportlab/폰트 파일 불필요)
+한글은 Type0 CID 글꼴(HYSMyeongJo-Medium, UniKS-UCS2-H)로 기록해
+pdfplumber/PyMuPDF 가 표준 Adobe-Korea1 매핑으로 텍스트를 그대로 추출할 수 있게 만든다.
+(ToUnicode 는 넣지 않음: pdfminer 는 ToUnicode 를 CID 에 적용해 글자가 깨짐)
+
+생성물 (out 디렉토리):
+  manifest.json        시드, 파라미터, 파일별 건수/크기
+  cover_letters.jsonl  {"id", "bytes", "text", "company"}   자소서 본문 (analyze_only, enhance_rewrite)
+  analyses.jsonl       {"id", "bytes", "text"}              GPT 분석 결과 마크다운 (parse_numbered_items)
+  job_postings.jsonl   {"id", "bytes", "data"}              채용공고 (analyze_job_posting)
+  companies.jsonl      {"id", "bytes", "data"}              기업 정보 (analyze_company)
+  documents.jsonl      {"id", "pages", "file"}              이력서+자소서 페이지 텍스트 (smart_split)
+  pdfs/doc_000.pdf     documents.jsonl 과 같은 내용의 PDF (extract_from_file)
+
+크기는 범위 안에서 로그 균등 분포 (건수가 2 이상이면 양 끝값을 항상 포함)
+
+사용법:
+  python benchmarks/corpus_builder.py --out tmp/bench_corpus --seed 42
+  python benchmarks/corpus_builder.py --out tmp/bench_corpus --texts 20 --pdfs 10 --max-pages 200 --max-kb 1024
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+CORPUS_FILES = ('cover_letters.jsonl', 'analyses.jsonl', 'job_postings.jsonl', 'companies.jsonl', 'documents.jsonl')
+
+COMPANIES = ['삼성전자', 'LG화학', '현대자동차', 'SK하이닉스', '카카오', '네이버', '쿠팡', '토스', '배달의민족', '한화시스템']
+POSITIONS = ['백엔드 개발자', '프론트엔드 개발자', '데이터 분석가', '마케팅 기획', '영업 관리', 'UX 디자이너', '서비스 기획자']
+TECH = ['Python', 'Java', 'Spring', 'Django', 'React', 'AWS', 'Kubernetes', 'MySQL', 'Redis', 'Kafka', 'TensorFlow']
+SECTION_TITLES = ['지원 동기', '성장 과정', '직무 관련 경험', '성격의 장단점', '입사 후 포부', '협업 경험', '문제 해결 경험']
+ANALYSIS_TITLES = ['고객 중심적 사고와 실질적 성과 도출 능력', '데이터 기반 문제 해결 역량', '협업을 통한 목표 달성 경험',
+                   '주도적인 개선 제안과 실행력', '기술 학습에 대한 꾸준한 태도']
+
+SUBJECTS = ['저는', '제가', '저희 팀은', '당시 저는', '프로젝트에서 저는', '인턴 기간 동안 저는']
+SITUATIONS = ['서비스 응답 속도가 느려 고객 불만이 늘어나던 상황에서', '신규 기능 출시 일정이 촉박했던 당시',
+              '팀원 간 의견 차이로 프로젝트가 지연되던 때', '매출이 정체되어 새로운 전략이 필요했던 시기에',
+              '데이터가 흩어져 있어 분석이 어려웠던 환경에서']
+ACTIONS = ['원인을 분석하고 개선안을 직접 설계했습니다', '매주 회의를 열어 목표를 다시 정리하고 역할을 나누었습니다',
+           '사용자 인터뷰를 진행해 핵심 문제를 정의했습니다', '자동화 도구를 도입해 반복 작업을 줄였습니다',
+           '데이터 파이프라인을 새로 구축해 지표를 한곳에 모았습니다']
+RESULTS = ['그 결과 처리 시간을 {n}% 단축했습니다', '결과적으로 고객 만족도가 {n}점 향상되었습니다',
+           '{n}개월 만에 목표 매출을 달성했습니다', '이 경험을 통해 협업의 중요성을 배웠습니다',
+           '팀의 배포 주기가 {n}배 빨라졌습니다']
+CLOSINGS = ['이러한 경험을 바탕으로 귀사에서도 성과를 내겠습니다', '입사 후에는 이 역량으로 서비스 성장에 기여하고 싶습니다',
+            '앞으로도 끊임없이 배우며 성장하겠습니다']
+
+def _sentence(rng: random.Random) -> str:
+    parts = [rng.choice(SUBJECTS), rng.choice(SITUATIONS), rng.choice(ACTIONS) + '.']
+    if rng.random() < 0.7:
+        parts.append(rng.choice(RESULTS).format(n=rng.randint(2, 90)) + '.')
+    if rng.random() < 0.2:
+        parts.append(f'{rng.choice(TECH)}와 {rng.choice(TECH)}를 활용했습니다.')
+    if rng.random() < 0.15:
+        parts.append(rng.choice(CLOSINGS) + '.')
+    return ' '.join(parts)
+
+def _paragraph(rng: random.Random) -> str:
+    return ' '.join(_sentence(rng) for _ in range(rng.randint(2, 5)))
+
+def _fill(rng: random.Random, target_bytes: int, block) -> str:
+    """block(rng, index) 를 이어 붙여 UTF-8 target_bytes 근처까지 (넘으면 문자 단위로 자름)"""
+    blocks = []
+    size = 0
+    index = 0
+    while size < target_bytes:
+        text = block(rng, index)
+        blocks.append(text)
+        size += len(text.encode('utf-8'))
+        index += 1
+    return _truncate('\n'.join(blocks), target_bytes)
+
+def _truncate(text: str, target_bytes: int) -> str:
+    encoded = text.encode('utf-8')
+    if len(encoded) <= target_bytes:
+        return text
+    return encoded[:target_bytes].decode('utf-8', errors='ignore')
+
+def cover_letter_text(rng: random.Random, target_bytes: int) -> str:
+    """번호 제목 + 문단으로 된 자소서"""
+    def block(rng, index):
+        title = SECTION_TITLES[index % len(SECTION_TITLES)]
+        return f'{index + 1}. {title}\n' + '\n'.join(_paragraph(rng) for _ in range(rng.randint(1, 3))) + '\n'
+    return _fill(rng, target_bytes, block)
+
+def analysis_text(rng: random.Random, target_bytes: int) -> str:
+    """GPT 분석 결과 형식 (### N. **제목** / 소제목 / 구분선)"""
+    def block(rng, index):
+        title = ANALYSIS_TITLES[index % len(ANALYSIS_TITLES)]
+        lines = [f'### {index + 1}. **{title}**', '**(자소서 인용 및 첫인상)**', _paragraph(rng), '',
+                 '#### 2) HR 관점에서 왜 좋은지', _paragraph(rng), '']
+        if rng.random() < 0.3:
+            lines += ['---', '']
+        return '\n'.join(lines)
+    return _fill(rng, target_bytes, block)
+
+def job_posting(rng: random.Random, target_bytes: int) -> Dict:
+    """채용공고 데이터 (본문 content 가 target_bytes 근처)"""
+    position = rng.choice(POSITIONS)
+    stack = rng.sample(TECH, 4)
+    def block(rng, index):
+        return (f'[{rng.choice(["주요 업무", "자격 요건", "우대 사항", "복리후생"])}]\n'
+                f'- {", ".join(rng.sample(TECH, 3))} 경험 {rng.randint(1, 10)}년 이상\n- {_sentence(rng)}\n')
+    return {
+        'title': f'{position} 채용 ({", ".join(stack)})',
+        'company_name': rng.choice(COMPANIES),
+        'position': position,
+        'location': rng.choice(['서울 강남구', '경기 성남시', '부산 해운대구']),
+        'salary': f'연봉 {rng.randint(30, 90) * 100}만원',
+        'requirements': f'{stack[0]} 경력 {rng.randint(1, 7)}년 이상',
+        'content': _fill(rng, target_bytes, block)
+    }
+
+def company(rng: random.Random, target_bytes: int) -> Dict:
+    """기업 데이터 (설명 + 뉴스, 합계가 target_bytes 근처)"""
+    name = rng.choice(COMPANIES)
+    description = _fill(rng, max(target_bytes // 2, 200), lambda rng, i: _paragraph(rng))
+    news = []
+    size = len(description.encode('utf-8'))
+    while size < target_bytes:
+        item = {'title': f'{name}, {rng.choice(["신규 투자 유치", "실적 개선", "채용 확대", "신사업 진출"])}',
+                'content': _paragraph(rng)}
+        news.append(item)
+        size += len(item['title'].encode('utf-8')) + len(item['content'].encode('utf-8'))
+    return {
+        'name': name,
+        'industry': rng.choice(['IT', '제조', '금융', '유통']),
+        'employees': str(rng.randint(50, 100000)),
+        'description': description,
+        'news_data': news,
+        'job_postings': [{'title': rng.choice(POSITIONS)} for _ in range(rng.randint(1, 10))]
+    }
+
+def resume_page(rng: random.Random) -> str:
+    lines = ['이 력 서', f'성명 {rng.choice(["홍길동", "김철수", "이영희"])}', '학력사항']
+    year = rng.randint(2005, 2015)
+    lines.append(f'{year}.03 - {year + 4}.02 한국대학교 {rng.choice(["컴퓨터공학과", "경영학과", "산업공학과"])}')
+    lines.append('경력사항')
+    for _ in range(rng.randint(2, 6)):
+        start = rng.randint(year + 4, 2023)
+        lines.append(f'{start}.{rng.randint(1, 12):02d} - {start + rng.randint(1, 3)}.{rng.randint(1, 12):02d} '
+                     f'(주){rng.choice(COMPANIES)} {rng.choice(POSITIONS)}')
+    lines.append(f'자격증 정보처리기사 {rng.randint(2010, 2023)}.{rng.randint(1, 12):02d}')
+    lines.append('Skills: ' + ', '.join(rng.sample(TECH, 5)))
+    return '\n'.join(lines)
+
+def cover_letter_page(rng: random.Random, index: int) -> str:
+    heading = '자기소개서\n' if index == 0 else ''
+    return heading + cover_letter_text(rng, rng.randint(1000, 1600))
+
+def portfolio_page(rng: random.Random) -> str:
+    return '포트폴리오\n' + '\n'.join(f'Project {chr(65 + i)} - {rng.choice(ANALYSIS_TITLES)} ({rng.choice(TECH)})'
+                                  for i in range(rng.randint(2, 6)))
+
+def document_pages(rng: random.Random, page_count: int) -> List[str]:
+    """이력서 → 자소서 → 포트폴리오 순서의 페이지 (한 장이면 자소서만)"""
+    if page_count == 1:
+        return [cover_letter_page(rng, 0)]
+    resume_count = max(1, page_count // 5)
+    trailing = page_count // 10
+    cover_count = max(1, page_count - resume_count - trailing)
+    pages = [resume_page(rng) for _ in range(resume_count)]
+    pages += [cover_letter_page(rng, i) for i in range(cover_count)]
+    pages += [portfolio_page(rng) for _ in range(page_count - len(pages))]
+    return pages
+
+def _wrap(text: str, width: int = 42) -> List[str]:
+    lines = []
+    for line in text.split('\n'):
+        while len(line) > width:
+            lines.append(line[:width])
+            line = line[width:]
+        lines.append(line)
+    return lines
+
+def write_pdf(path: Path, pages: List[str]):
+    """페이지 텍스트를 한글 CID 글꼴 PDF 로 기록 (페이지 하나에 텍스트 한 장, 42자마다 줄바꿈)"""
+    objects = []   # 1부터 번호
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    catalog = add(b'')          # 나중에 채움
+    pages_id = add(b'')
+    descendant = add(b'<< /Type /Font /Subtype /CIDFontType0 /BaseFont /HYSMyeongJo-Medium '
+                     b'/CIDSystemInfo << /Registry (Adobe) /Ordering (Korea1) /Supplement 1 >> '
+                     b'/FontDescriptor << /Type /FontDescriptor /FontName /HYSMyeongJo-Medium /Flags 6 '
+                     b'/FontBBox [-28 -148 1001 880] /ItalicAngle 0 /Ascent 880 /Descent -148 /CapHeight 880 '
+                     b'/StemV 60 >> /DW 1000 >>')
+    font = add(b'<< /Type /Font /Subtype /Type0 /BaseFont /HYSMyeongJo-Medium /Encoding /UniKS-UCS2-H '
+               b'/DescendantFonts [%d 0 R] >>' % descendant)
+
+    page_ids = []
+    for text in pages:
+        commands = [b'BT /F1 10 Tf 13 TL 40 800 Td']
+        for line in _wrap(text):
+            encoded = ''.join(f'{ord(char):04X}' for char in line if ord(char) <= 0xFFFF)
+            commands.append(b'<%s> Tj T*' % encoded.encode('ascii'))
+        commands.append(b'ET')
+        stream = b'\n'.join(commands)
+        content = add(b'<< /Length %d >>\nstream\n%s\nendstream' % (len(stream), stream))
+        page_ids.append(add(b'<< /Type /Page /Parent %d 0 R /MediaBox [0 0 595 842] '
+                            b'/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>' % (pages_id, font, content)))
+
+    objects[catalog - 1] = b'<< /Type /Catalog /Pages %d 0 R >>' % pages_id
+    objects[pages_id - 1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (
+        b' '.join(b'%d 0 R' % page_id for page_id in page_ids), len(page_ids))
+
+    output = bytearray(b'%PDF-1.4\n%\xc7\xec\x8f\xa2\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(output))
+        output += b'%d 0 obj\n%s\nendobj\n' % (number, body)
+    xref = len(output)
+    output += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    output += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    output += b'trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, catalog, xref)
+    path.write_bytes(bytes(output))
+
+def log_uniform(rng: random.Random, low: float, high: float, count: int, integer: bool = False) -> List:
+    """low~high 로그 균등 분포 count 개 (2개 이상이면 양 끝값 포함)"""
+    values = [math.exp(rng.uniform(math.log(low), math.log(high))) for _ in range(count)]
+    if count >= 2:
+        values[0], values[-1] = low, high
+    return [int(round(value)) for value in values] if integer else values
+
+def build_corpus(out: Path, seed: int = 42, texts: int = 20, pdfs: int = 8, min_kb: float = 1, max_kb: float = 1024,
+                 min_pages: int = 1, max_pages: int = 200) -> Dict:
+    """코퍼스 생성 후 manifest 반환"""
+    rng = random.Random(seed)
+    out.mkdir(parents=True, exist_ok=True)
+    (out / 'pdfs').mkdir(exist_ok=True)
+
+    sizes = [int(kb * 1024) for kb in log_uniform(rng, min_kb, max_kb, texts)]
+    files = {}
+
+    def write_jsonl(name: str, records: Iterator[Dict]):
+        count = 0
+        total = 0
+        with open(out / name, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                count += 1
+                total += record.get('bytes', 0)
+        files[name] = {'records': count, 'bytes': total}
+
+    write_jsonl('cover_letters.jsonl', ({'id': i, 'bytes': size, 'text': cover_letter_text(rng, size),
+                                         'company': rng.choice(COMPANIES)} for i, size in enumerate(sizes)))
+    write_jsonl('analyses.jsonl', ({'id': i, 'bytes': size, 'text': analysis_text(rng, size)}
+                                   for i, size in enumerate(sizes)))
+    write_jsonl('job_postings.jsonl', ({'id': i, 'bytes': size, 'data': job_posting(rng, size)}
+                                       for i, size in enumerate(sizes)))
+    write_jsonl('companies.jsonl', ({'id': i, 'bytes': size, 'data': company(rng, size)}
+                                    for i, size in enumerate(sizes)))
+
+    def documents():
+        for i, page_count in enumerate(log_uniform(rng, min_pages, max_pages, pdfs, integer=True)):
+            pages = document_pages(rng, page_count)
+            file = f'pdfs/doc_{i:03d}.pdf'
+            write_pdf(out / file, pages)
+            yield {'id': i, 'bytes': (out / file).stat().st_size, 'page_count': page_count, 'file': file,
+                   'pages': pages}
+    write_jsonl('documents.jsonl', documents())
+
+    manifest = {
+        'seed': seed,
+        'params': {'texts': texts, 'pdfs': pdfs, 'min_kb': min_kb, 'max_kb': max_kb,
+                   'min_pages': min_pages, 'max_pages': max_pages},
+        'files': files
+    }
+    (out / 'manifest.json').write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding='utf-8')
+    return manifest
+
+def load_jsonl(path: Path) -> List[Dict]:
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def main():
+    parser = argparse.ArgumentParser(description='벤치마크 합성 코퍼스 생성')
+    parser.add_argument('--out', required=True, help='출력 디렉토리')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--texts', type=int, default=20, help='텍스트 코퍼스별 건수')
+    parser.add_argument('--pdfs', type=int, default=8, help='PDF 건수')
+    parser.add_argument('--min-kb', type=float, default=1)
+    parser.add_argument('--max-kb', type=float, default=1024)
+    parser.add_argument('--min-pages', type=int, default=1)
+    parser.add_argument('--max-pages', type=int, default=200)
+    args = parser.parse_args()
+
+    if args.min_kb <= 0 or args.max_kb < args.min_kb or args.min_pages < 1 or args.max_pages < args.min_pages:
+        print('Error: 크기/페이지 범위가 잘못되었습니다', file=sys.stderr)
+        sys.exit(1)
+
+    manifest = build_corpus(Path(args.out), args.seed, args.texts, args.pdfs, args.min_kb, args.max_kb,
+                            args.min_pages, args.max_pages)
+    print(json.dumps(manifest, ensure_ascii=False, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+페이지 분류 마이크로벤치마크: 패턴 문자열별 re.search (이전 구현) vs PatternRegistry 컴파일 패턴
+
+대상:
+  EnhancedPdfExtractor._classify_page (pdf_extractor_enhanced.py)
+  PdfCoverLetterExtractor.analyze_page_type (pdf_extractor.py)
+
+사용법:
+  python benchmarks/page_classify_bench.py --corpus pages.jsonl   # {"text": ...} 한 줄에 한 페이지
+  python benchmarks/page_classify_bench.py --corpus pages/         # .txt 파일 디렉토리 (파일 하나가 한 페이지)
+  python benchmarks/page_classify_bench.py --thrash                # 페이지마다 re 캐시 비우기 (다른 모듈과 함께 실행되는 상황)
+
+두 구현의 점수가 모든 페이지에서 같은지도 확인
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'lib' / 'python'))
+
+from pdf_extractor import PdfCoverLetterExtractor  # noqa: E402
+from pdf_extractor_enhanced import EnhancedPdfExtractor  # noqa: E402
+
+SAMPLE_PAGES = [
+    '''이 력 서
+성명 홍길동
+학력사항
+2015.03 - 2019.02 한국대학교 컴퓨터공학과
+경력사항
+2019.03 - 2021.12 (주)테크 백엔드 개발
+2022.01 - 현재 (주)스타트업 서버 개발
+자격증 정보처리기사 2018.11
+Skills: Java, Spring, AWS
+''',
+    '''자기소개서
+1. 지원 동기
+저는 사용자에게 가치를 전달하는 서비스를 만들고 싶어 지원하게 되었습니다. 제가 대학 시절부터 관심을 가진 분야는
+대용량 트래픽 처리였고, 저의 경험을 바탕으로 귀사의 플랫폼 성장에 기여하고자 합니다.
+
+2. 성장 과정
+저는 어려서부터 문제를 끝까지 파고드는 성격이었습니다. 제가 처음 프로그래밍을 접한 것은 고등학교 때였습니다.
+
+3. 입사 후 포부
+입사 후에는 팀과 협업하며 서비스 안정성을 높이고, 저에게 주어진 역할 이상을 해내겠습니다.
+''',
+    '''포트폴리오
+Project A - 실시간 채팅 서버 (Go, Redis)
+Project B - 추천 시스템 파이프라인 (Python, Spark)
+https://github.com/example
+''',
+]
+
+def load_corpus(path: str) -> List[str]:
+    """JSONL(text) 파일 또는 .txt 디렉토리에서 페이지 텍스트 로드"""
+    if not path:
+        return SAMPLE_PAGES * 300
+
+    corpus_path = Path(path)
+    if corpus_path.is_dir():
+        return [file.read_text(encoding='utf-8') for file in sorted(corpus_path.glob('*.txt'))]
+
+    pages = []
+    with open(corpus_path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                pages.append(json.loads(line).get('text', ''))
+    return pages
+
+def legacy_enhanced_scores(extractor: EnhancedPdfExtractor) -> Callable[[str], tuple]:
+    """이전 _classify_page 의 패턴 점수 (패턴 문자열마다 re.search)"""
+    def scores(text: str) -> tuple:
+        cover_score = 0
+        resume_score = 0
+        for pattern in extractor.strong_indicators:
+            if re.search(pattern, text[:500], re.IGNORECASE):
+                cover_score += 10
+        for pattern in extractor.section_patterns:
+            if re.search(pattern, text, re.IGNORECASE | re.MULTILINE):
+                cover_score += 2
+        for pattern in extractor.resume_indicators:
+            if re.search(pattern, text, re.IGNORECASE):
+                resume_score += 3
+        first_person = len(re.findall(r'저는|제가|저의|저에게|제게', text))
+        dates = len(re.findall(r'\d{4}[\.\-년]\s*\d{1,2}', text))
+        return cover_score, resume_score, first_person, dates
+    return scores
+
+def registry_enhanced_scores(extractor: EnhancedPdfExtractor) -> Callable[[str], tuple]:
+    """현재 _classify_page 의 패턴 점수 (PatternRegistry)"""
+    def scores(text: str) -> tuple:
+        found = extractor.patterns.counts(text)
+        return (found['strong'] * 10 + found['section'] * 2, found['resume'] * 3,
+                len(extractor.first_person_pattern.findall(text)), len(extractor.date_pattern.findall(text)))
+    return scores
+
+def legacy_basic_scores(extractor: PdfCoverLetterExtractor) -> Callable[[str], tuple]:
+    """이전 analyze_page_type 의 마커 점수"""
+    def scores(text: str) -> tuple:
+        normalized = re.sub(r'\s+', ' ', text)
+        cover_score = sum(2 for pattern in extractor.cover_letter_markers
+                          if re.search(pattern, normalized, re.IGNORECASE))
+        resume_score = sum(2 for pattern in extractor.resume_markers
+                           if re.search(pattern, normalized, re.IGNORECASE))
+        return cover_score, resume_score
+    return scores
+
+def registry_basic_scores(extractor: PdfCoverLetterExtractor) -> Callable[[str], tuple]:
+    """현재 analyze_page_type 의 마커 점수"""
+    def scores(text: str) -> tuple:
+        found = extractor.markers.counts(extractor.whitespace_pattern.sub(' ', text))
+        return found['cover_letter'] * 2, found['resume'] * 2
+    return scores
+
+def run(func: Callable[[str], tuple], corpus: List[str], repeat: int, thrash: bool) -> Dict:
+    func(corpus[0])  # 워밍업
+
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in corpus:
+            if thrash:
+                re.purge()
+            func(text)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    return {
+        'pages': len(corpus),
+        'best_seconds': round(best, 4),
+        'us_per_page': round(best / len(corpus) * 1e6, 1)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='페이지 분류 정규식 벤치마크')
+    parser.add_argument('--corpus', default=None, help='JSONL 파일 또는 .txt 디렉토리')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--thrash', action='store_true', help='페이지마다 re 모듈 캐시 비우기')
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    if not corpus:
+        print('Error: 빈 코퍼스', file=sys.stderr)
+        sys.exit(1)
+
+    enhanced = EnhancedPdfExtractor(use_cache=False)
+    basic = PdfCoverLetterExtractor()
+
+    results = []
+    for name, legacy, registry in [
+        ('EnhancedPdfExtractor._classify_page', legacy_enhanced_scores(enhanced), registry_enhanced_scores(enhanced)),
+        ('PdfCoverLetterExtractor.analyze_page_type', legacy_basic_scores(basic), registry_basic_scores(basic)),
+    ]:
+        mismatches = sum(1 for text in corpus if legacy(text) != registry(text))
+        before = run(legacy, corpus, args.repeat, args.thrash)
+        after = run(registry, corpus, args.repeat, args.thrash)
+        results.append({
+            'classifier': name,
+            'thrash': args.thrash,
+            'before': before,
+            'after': after,
+            'speedup': round(before['best_seconds'] / after['best_seconds'], 2) if after['best_seconds'] else None,
+            'score_mismatches': mismatches
+        })
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+if __name__ == '__main__':
+    main()
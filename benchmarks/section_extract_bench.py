@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+섹션 추출 벤치마크: 이전 정규식 구현 vs section_splitter (줄 단위 선형 분리)
+
+이전 패턴은 게으른 제목([가-힣\\s]+?, [^\\n]+?)과 게으른 본문({100,}?)이 겹쳐 있어
+종결 조건(다음 제목 또는 \\Z)을 만족하지 못하는 입력에서 제목 길이마다 본문을 끝까지 다시 훑음 (O(n^2) 이상)
+
+입력:
+  normal         정상 자소서를 크기만큼 반복
+  numbered_tail  "1. " + 한글/공백 + 끝에 숫자 하나 (번호 패턴 종결 실패)
+  qa_tail        "Q1. " + 공백 섞인 영문 + 끝에 'Q' 하나 (Q&A 패턴 종결 실패)
+  keyword_sparse 제목 없음 + 키워드 줄 + 한글이 거의 없는 본문 (키워드 대체 경로)
+
+이전 구현은 하위 프로세스에서 --timeout 초까지만 실행 (초과하면 timeout)
+
+사용법:
+  python benchmarks/section_extract_bench.py
+  python benchmarks/section_extract_bench.py --sizes 10000,100000,1000000 --timeout 10
+"""
+
+import argparse
+import json
+import multiprocessing
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'lib' / 'python'))
+
+from section_splitter import keyword_section, split_sections  # noqa: E402
+
+SAMPLE_LETTER = '''1. 지원 동기
+저는 사용자에게 가치를 전달하는 서비스를 만들고 싶어 지원하게 되었습니다. 제가 대학 시절부터 관심을 가진 분야는
+대용량 트래픽 처리였고, 2019년부터 3년간 쌓은 경험을 바탕으로 귀사의 플랫폼 성장에 기여하고자 합니다.
+
+2. 성장 과정
+저는 어려서부터 문제를 끝까지 파고드는 성격이었습니다. 제가 처음 프로그래밍을 접한 것은 고등학교 때였고,
+그때부터 작은 도구를 직접 만들어 쓰며 개발의 즐거움을 알게 되었습니다. 이후 동아리 활동을 이끌었습니다.
+
+Q3. 협업 경험을 기술하시오
+팀 프로젝트에서 백엔드를 맡아 API 설계와 배포 자동화를 담당했습니다. 일정이 촉박했지만 매일 짧게 진행 상황을
+공유하면서 병목을 빨리 찾았고, 결과적으로 예정보다 일주일 먼저 서비스를 출시할 수 있었습니다. 감사합니다.
+
+'''
+
+LEGACY_ENHANCED_PATTERNS = [
+    r'(\d+)[\.\)]\s*([가-힣\s]+?)[\s\n]+([^\d]{100,}?)(?=\d+[\.\)]|\Z)',
+    r'(Q\d+)[\.:]\s*([^\n]+?)[\s\n]+([^Q]{100,}?)(?=Q\d+|\Z)',
+    r'\[([^\]]+)\]\s*\n+([^\[]{100,}?)(?=\[|\Z)',
+    r'^([가-힣]{2,10})\s*\n[-=]+\n+([^\n]{100,}?)(?=^[가-힣]{2,10}\s*\n[-=]|\Z)'
+]
+
+LEGACY_BASIC_PATTERNS = [
+    r'(\d+[\.\)]\s*)([가-힣\s]+)[\s\n]+([^0-9]{100,}?)(?=\d+[\.\)]|\Z)',
+    r'(Q\d+[\.:]\s*)([^\n]+)[\s\n]+([^Q]{100,}?)(?=Q\d+|\Z)',
+    r'([가-힣]{2,10})\s*\n+([^가-힣\d]{100,}?)(?=[가-힣]{2,10}\s*\n|\Z)'
+]
+
+KEYWORDS = ['지원동기', '성장과정', '성격', '장점', '단점', '협업', '입사후']
+
+def build_input(kind: str, size: int) -> str:
+    """kind 종류의 입력을 size 글자 안팎으로 생성"""
+    if kind == 'normal':
+        return (SAMPLE_LETTER * (size // len(SAMPLE_LETTER) + 1))[:size]
+    if kind == 'numbered_tail':
+        return '1. ' + '가 ' * (size // 2) + '9'
+    if kind == 'qa_tail':
+        return 'Q1. ' + 'ab ' * (size // 3) + 'Q'
+    if kind == 'keyword_sparse':
+        return '지원동기에 대하여\n' + ('x' * 99 + '가') * (size // 100) + '\n'
+    raise ValueError(f'unknown input kind: {kind}')
+
+def legacy_sections(text: str) -> int:
+    """이전 EnhancedPdfExtractor._extract_sections + PdfCoverLetterExtractor.extract_sections 매칭 수"""
+    count = 0
+    for pattern in LEGACY_ENHANCED_PATTERNS + LEGACY_BASIC_PATTERNS:
+        count += sum(1 for _ in re.finditer(pattern, text, re.MULTILINE | re.DOTALL))
+    if count == 0 and len(text) > 500:
+        for keyword in KEYWORDS:
+            if re.search(rf'({keyword}[^\n]*)\n+([^가-힣]*(?:[가-힣][^가-힣]*){{20,}})', text, re.IGNORECASE):
+                count += 1
+    return count
+
+def current_sections(text: str) -> int:
+    """현재 구현의 같은 작업 (두 추출기의 제목 종류 + 키워드 대체 경로)"""
+    count = len(split_sections(text)) + len(split_sections(text, ('numbered', 'qa', 'underlined', 'title_line')))
+    if count == 0 and len(text) > 500:
+        count += sum(1 for keyword in KEYWORDS if keyword_section(text, keyword))
+    return count
+
+def _timed(func: Callable[[str], int], text: str, queue):
+    started = time.perf_counter()
+    func(text)
+    queue.put(time.perf_counter() - started)
+
+def run_with_timeout(func: Callable[[str], int], text: str, timeout: float) -> Dict:
+    """하위 프로세스에서 실행 (시간 초과면 종료)"""
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_timed, args=(func, text, queue))
+    process.start()
+    process.join(timeout)
+    if process.is_alive():
+        process.terminate()
+        process.join()
+        return {'seconds': None, 'timeout': True}
+    return {'seconds': round(queue.get(), 4), 'timeout': False}
+
+def run_inline(func: Callable[[str], int], text: str, repeat: int) -> Dict:
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(text)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return {'seconds': round(best, 4), 'ns_per_char': round(best / max(len(text), 1) * 1e9, 1)}
+
+def main():
+    parser = argparse.ArgumentParser(description='섹션 추출 정규식 벤치마크')
+    parser.add_argument('--sizes', default='10000,100000,1000000', help='입력 크기 (글자 수, 쉼표 구분)')
+    parser.add_argument('--kinds', default='normal,numbered_tail,qa_tail,keyword_sparse')
+    parser.add_argument('--timeout', type=float, default=5.0, help='이전 구현 실행 제한 (초)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--skip-legacy', action='store_true', help='이전 구현 실행 생략')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',') if size]
+    results: List[Dict] = []
+
+    for kind in [kind for kind in args.kinds.split(',') if kind]:
+        for size in sizes:
+            text = build_input(kind, size)
+            result = {
+                'input': kind,
+                'chars': len(text),
+                'after': run_inline(current_sections, text, args.repeat)
+            }
+            if not args.skip_legacy:
+                result['before'] = run_with_timeout(legacy_sections, text, args.timeout)
+            results.append(result)
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+if __name__ == '__main__':
+    main()
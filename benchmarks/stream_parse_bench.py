@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스트리밍 파싱 벤치마크: StreamingItemParser 에 긴 항목 하나를 한 줄씩 넣을 때 총 시간
+
+항목이 닫히지 않는 동안 줄마다 열린 항목 전체를 다시 인덱싱하면 줄 수에 대해 O(n^2)
+새로 완성된 줄만 훑으면 O(n) - 줄 수가 4배가 될 때 시간도 4배 안팎이어야 함
+
+입력:
+  plain       ### 1. **제목** + 본문 줄 n개 + ### 2. **제목**
+  subheaded   본문 사이에 #### N) 소제목 (항목을 닫지 않는 제목)
+  paragraphs  본문 사이에 빈 줄 하나 (빈 줄 2개가 아니므로 항목을 닫지 않음)
+
+스트리밍 결과가 parse_numbered_items(전체 응답)과 같은지도 확인
+
+사용법:
+  python benchmarks/stream_parse_bench.py
+  python benchmarks/stream_parse_bench.py --lines 1000,10000,100000
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'lib' / 'python'))
+
+from korean_text_analyzer import KoreanTextAnalyzer, StreamingItemParser  # noqa: E402
+
+def build_input(kind: str, lines: int) -> str:
+    body = []
+    for i in range(lines):
+        if kind == 'subheaded' and i % 20 == 0:
+            body.append(f'#### {i // 20 + 1}) 세부 평가\n')
+        elif kind == 'paragraphs' and i % 5 == 0:
+            body.append('\n')
+        body.append(f'지원자는 프로젝트 {i}에서 응답 시간을 {i % 90 + 10}% 줄였습니다.\n')
+    return '### 1. **고객 중심적 사고와 실질적 성과 도출 능력**\n' + ''.join(body) + '### 2. **협업 능력**\n마무리\n'
+
+def run(analyzer: KoreanTextAnalyzer, text: str) -> Dict:
+    chunks = text.splitlines(keepends=True)
+    parser = StreamingItemParser(analyzer)
+    started = time.perf_counter()
+    items: List[Dict] = []
+    for chunk in chunks:
+        items += parser.feed(chunk)
+    items += parser.close()
+    elapsed = time.perf_counter() - started
+    return {
+        'chunks': len(chunks),
+        'seconds': round(elapsed, 4),
+        'us_per_chunk': round(elapsed / len(chunks) * 1e6, 2),
+        'matches_full_parse': items == analyzer.parse_numbered_items(text)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='스트리밍 파싱 벤치마크 (한 줄씩)')
+    parser.add_argument('--lines', default='1000,10000,100000', help='항목 본문 줄 수 (쉼표 구분)')
+    parser.add_argument('--kinds', default='plain,subheaded,paragraphs')
+    args = parser.parse_args()
+
+    analyzer = KoreanTextAnalyzer()
+    results = []
+    for kind in [kind for kind in args.kinds.split(',') if kind]:
+        for lines in [int(lines) for lines in args.lines.split(',') if lines]:
+            results.append({'input': kind, 'lines': lines, **run(analyzer, build_input(kind, lines))})
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+토크나이저 벤치마크: korean_tokenizer vs NLTK punkt (sent_tokenize/word_tokenize)
+
+사용법:
+  python benchmarks/tokenizer_bench.py --corpus postings.jsonl   # {"title": ..., "content": ...} 한 줄에 하나
+  python benchmarks/tokenizer_bench.py --corpus postings/          # .txt 파일 디렉토리
+  python benchmarks/tokenizer_bench.py                             # 내장 샘플 공고
+
+NLTK 경로는 nltk가 설치돼 있을 때만 측정
+- punkt 데이터는 --nltk-data 디렉토리(기본 tmp/cache/nltk_data)에서 찾고, 없으면 그 자리에 한 번 내려받음
+- --no-nltk 로 NLTK 경로 생략
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT = Path(__file__).parent.parent
+DEFAULT_NLTK_DATA = ROOT / 'tmp' / 'cache' / 'nltk_data'
+
+sys.path.insert(0, str(ROOT / 'python_analysis'))
+
+import korean_tokenizer  # noqa: E402
+
+SAMPLE_POSTING = '''[테크기업] 백엔드 개발자 채용 (경력 3년 이상)
+주요업무
+• Java/Spring Boot 기반 API 설계 및 개발합니다.
+• 대용량 트래픽을 처리하는 분산 시스템을 운영해요.
+자격요건
+1. Python, Go, Node.js 중 하나 이상 능숙하신 분
+2. MySQL, Redis 등 데이터베이스 경험 3.5년 이상
+우대사항
+- AWS, Docker, Kubernetes 운영 경험 ▶ CI/CD 파이프라인 구축 경험
+"함께 성장할 동료를 찾습니다." 많은 지원 바랍니다!
+'''
+
+def load_corpus(path: str) -> List[str]:
+    """JSONL(title/content) 파일 또는 .txt 디렉토리에서 공고 텍스트 로드"""
+    if not path:
+        return [SAMPLE_POSTING] * 200
+
+    corpus_path = Path(path)
+    if corpus_path.is_dir():
+        return [file.read_text(encoding='utf-8') for file in sorted(corpus_path.glob('*.txt'))]
+
+    documents = []
+    with open(corpus_path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                documents.append(' '.join(str(record.get(key, '')) for key in ('title', 'content')))
+    return documents
+
+def korean_tokenizer_counts(text: str) -> Dict[str, int]:
+    sentences, words = korean_tokenizer.tokenize(text)
+    return {'sentences': len(sentences), 'words': len(words),
+            'korean_words': korean_tokenizer.count_hangul_words(text, words)}
+
+def provision_nltk(data_dir: Path):
+    """punkt 데이터를 data_dir에서만 찾도록 하고, 없으면 내려받음"""
+    import nltk
+
+    nltk.data.path[:] = [str(data_dir)]
+    try:
+        nltk.data.find('tokenizers/punkt')
+    except LookupError:
+        data_dir.mkdir(parents=True, exist_ok=True)
+        if not nltk.download('punkt', download_dir=str(data_dir), quiet=True, raise_on_error=True):
+            raise LookupError(f'failed to download NLTK punkt into {data_dir}')
+
+def load_nltk_counts(data_dir: Path) -> Callable[[str], Dict[str, int]]:
+    """NLTK 경로 (이전 _basic_text_analysis 구현), 사용할 수 없으면 None"""
+    try:
+        provision_nltk(data_dir)
+        from nltk.tokenize import sent_tokenize, word_tokenize
+    except Exception as e:
+        print(f'NLTK 경로 생략: {e}', file=sys.stderr)
+        return None
+
+    hangul = korean_tokenizer.HANGUL_WORD_PATTERN
+
+    def nltk_counts(text: str) -> Dict[str, int]:
+        sentences = sent_tokenize(text)
+        words = word_tokenize(text.lower())
+        return {'sentences': len(sentences), 'words': len(words),
+                'korean_words': sum(1 for word in words if hangul.fullmatch(word))}
+
+    return nltk_counts
+
+def run(name: str, func: Callable[[str], Dict[str, int]], corpus: List[str], repeat: int) -> Dict:
+    func(corpus[0])  # 워밍업 (모델/패턴 로드)
+
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        totals = {'sentences': 0, 'words': 0, 'korean_words': 0}
+        for text in corpus:
+            for key, value in func(text).items():
+                totals[key] += value
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    return {
+        'tokenizer': name,
+        'documents': len(corpus),
+        'best_seconds': round(best, 4),
+        'docs_per_second': round(len(corpus) / best, 1) if best else None,
+        **totals
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='korean_tokenizer vs NLTK punkt 벤치마크')
+    parser.add_argument('--corpus', default=None, help='JSONL 파일 또는 .txt 디렉토리')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--nltk-data', default=str(DEFAULT_NLTK_DATA), help='NLTK punkt 데이터 디렉토리')
+    parser.add_argument('--no-nltk', action='store_true', help='NLTK 경로 생략')
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    if not corpus:
+        print('Error: 빈 코퍼스', file=sys.stderr)
+        sys.exit(1)
+
+    results = [run('korean_tokenizer', korean_tokenizer_counts, corpus, args.repeat)]
+    nltk_counts = None if args.no_nltk else load_nltk_counts(Path(args.nltk_data))
+    if nltk_counts is not None:
+        results.append(run('nltk_punkt', nltk_counts, corpus, args.repeat))
+        results[0]['speedup_vs_nltk'] = round(results[1]['best_seconds'] / results[0]['best_seconds'], 2)
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -45,7 +45,11 @@ Rails.application.routes.draw do
     root to: "dashboard#index"
     resources :dashboard, only: [ :index ]
     resources :users, only: [ :index, :show, :edit, :update ]
-    resources :cover_letters, only: [ :index, :show, :destroy ]
+    resources :cover_letters, only: [ :index, :show, :destroy ] do
+      collection do
+        post "rescore"
+      end
+    end
     resources :payments, only: [ :index, :show ]
     get "referrals", to: "referrals#index"
     resource :analytics, only: [ :show ]
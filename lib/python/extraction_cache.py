@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PDF 추출 결과 캐시 (디스크, SQLite)
+- 키: PDF 내용 해시 (파일을 1MB씩 읽어 계산) + 추출 방법/스캔 모드 + 추출기 코드 버전
+- 값: 페이지별 추출 데이터(텍스트 포함)와 분류 결과 - 페이지 한 장이 한 행 (큰 문서도 한 장씩 읽고 씀)
+- 제거 정책: TTL 경과 항목 삭제, 전체 크기가 한도를 넘으면 오래 안 쓴 문서부터 90%까지 삭제
+- 적중/미스 횟수는 DB에 누적 (업로드마다 새 프로세스로 실행되므로)
+- 페이지 텍스트(이력서 개인정보)를 디스크에 남기므로 기본은 꺼짐:
+  경로와 유효 기간을 모두 지정해야 켜짐
+
+환경변수:
+  PDF_EXTRACTION_CACHE_PATH      SQLite 파일 경로 (필수)
+  PDF_EXTRACTION_CACHE_TTL_DAYS  유효 기간 (필수, 일 단위 - 소수 가능)
+  PDF_EXTRACTION_CACHE_MAX_MB    최대 크기 (기본 512MB)
+  PDF_EXTRACTION_CACHE=0         경로가 있어도 캐시 끄기
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+SCRIPT_DIR = Path(__file__).parent
+
+# 추출/분류 결과에 영향을 주는 소스 (바뀌면 이전 캐시는 자동으로 무효)
+VERSIONED_SOURCES = ['pdf_extractor_enhanced.py', 'page_scanner.py', 'pattern_registry.py', 'section_splitter.py']
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+_code_version = None
+
+def content_hash(pdf_path: str) -> str:
+    """PDF 내용 해시 (파일 전체를 메모리에 올리지 않고 청크 단위로 계산)"""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(pdf_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def code_version() -> str:
+    """추출기 코드 버전"""
+    global _code_version
+
+    if _code_version is None:
+        digest = hashlib.blake2b(digest_size=8)
+        for name in VERSIONED_SOURCES:
+            digest.update((SCRIPT_DIR / name).read_bytes())
+        _code_version = digest.hexdigest()
+    return _code_version
+
+class ExtractionCache:
+    """PDF 내용 해시 → 페이지별 추출/분류 결과"""
+
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 * 1024, ttl_seconds: float = 30 * 24 * 3600):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=10, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('''CREATE TABLE IF NOT EXISTS documents (
+            key TEXT PRIMARY KEY,
+            meta TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            created_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        )''')
+        self._conn.execute('''CREATE TABLE IF NOT EXISTS pages (
+            key TEXT NOT NULL,
+            idx INTEGER NOT NULL,
+            page TEXT NOT NULL,
+            page_type TEXT NOT NULL,
+            PRIMARY KEY (key, idx)
+        )''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS documents_accessed_at ON documents (accessed_at)')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)')
+
+    @staticmethod
+    def key(digest: str, method: str, full_scan: bool) -> str:
+        return f"{digest}:{method}:{'full' if full_scan else 'early'}:{code_version()}"
+
+    def lookup(self, key: str) -> Optional[Dict]:
+        """캐시된 문서 메타데이터 (없거나 만료되면 None, 적중/미스 집계)"""
+        row = self._conn.execute('SELECT meta, created_at FROM documents WHERE key = ?', (key,)).fetchone()
+        now = time.time()
+
+        if row is not None and now - row[1] > self.ttl_seconds:
+            self._delete([key])
+            row = None
+
+        if row is None:
+            self._count('misses')
+            return None
+
+        self._conn.execute('UPDATE documents SET accessed_at = ? WHERE key = ?', (now, key))
+        self._count('hits')
+        return json.loads(row[0])
+
+    def iter_pages(self, key: str) -> Iterator[Tuple[Dict, Dict]]:
+        """캐시된 (페이지 데이터, 분류 결과)를 페이지 순서대로 하나씩"""
+        cursor = self._conn.execute('SELECT page, page_type FROM pages WHERE key = ? ORDER BY idx', (key,))
+        for page, page_type in cursor:
+            yield json.loads(page), json.loads(page_type)
+
+    def store(self, key: str, meta: Dict, pages: Iterable[Tuple[Dict, Dict]]):
+        """문서 저장 (pages: (페이지 데이터, 분류 결과) - 생성기면 한 장씩 직렬화)"""
+        size = 0
+        try:
+            self._conn.execute('BEGIN')
+            self._conn.execute('DELETE FROM pages WHERE key = ?', (key,))
+            for idx, (page, page_type) in enumerate(pages):
+                page_json = json.dumps(page, ensure_ascii=False)
+                size += len(page_json.encode('utf-8'))
+                self._conn.execute('INSERT INTO pages VALUES (?, ?, ?, ?)',
+                                   (key, idx, page_json, json.dumps(page_type, ensure_ascii=False)))
+
+            now = time.time()
+            self._conn.execute('INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?)',
+                               (key, json.dumps(meta, ensure_ascii=False), size, now, now))
+            self._conn.execute('COMMIT')
+        except Exception:
+            self._conn.execute('ROLLBACK')
+            raise
+
+        self._evict()
+
+    def stats(self) -> Dict:
+        """캐시 크기/적중률"""
+        documents, size = self._conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM documents').fetchone()
+        counters = dict(self._conn.execute('SELECT name, value FROM counters').fetchall())
+        hits = counters.get('hits', 0)
+        lookups = hits + counters.get('misses', 0)
+        return {
+            'enabled': True,
+            'path': self.path,
+            'documents': documents,
+            'bytes': size,
+            'max_bytes': self.max_bytes,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': hits,
+            'misses': counters.get('misses', 0),
+            'evictions': counters.get('evictions', 0),
+            'hit_rate': round(hits / lookups, 3) if lookups else 0.0
+        }
+
+    def close(self):
+        self._conn.close()
+
+    def _count(self, name: str, amount: int = 1):
+        self._conn.execute('INSERT INTO counters VALUES (?, ?) '
+                           'ON CONFLICT(name) DO UPDATE SET value = value + excluded.value', (name, amount))
+
+    def _delete(self, keys):
+        for key in keys:
+            self._conn.execute('DELETE FROM pages WHERE key = ?', (key,))
+            self._conn.execute('DELETE FROM documents WHERE key = ?', (key,))
+
+    def _evict(self):
+        """만료 문서 삭제 후, 크기 한도를 넘으면 오래 안 쓴 문서부터 90%까지 삭제"""
+        expired = [key for key, in self._conn.execute('SELECT key FROM documents WHERE created_at < ?',
+                                                      (time.time() - self.ttl_seconds,)).fetchall()]
+        self._delete(expired)
+
+        total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM documents').fetchone()[0]
+        victims = []
+        if total > self.max_bytes:
+            target = self.max_bytes * 0.9
+            for key, size in self._conn.execute('SELECT key, size FROM documents ORDER BY accessed_at').fetchall():
+                if total <= target:
+                    break
+                victims.append(key)
+                total -= size
+            self._delete(victims)
+
+        if expired or victims:
+            self._count('evictions', len(expired) + len(victims))
+
+def open_cache() -> Optional[ExtractionCache]:
+    """환경변수 설정으로 캐시 열기 (경로/유효 기간이 지정되지 않았거나 열 수 없으면 None)"""
+    path = os.environ.get('PDF_EXTRACTION_CACHE_PATH')
+    ttl_days = os.environ.get('PDF_EXTRACTION_CACHE_TTL_DAYS')
+    if os.environ.get('PDF_EXTRACTION_CACHE', '1') == '0' or not path or not ttl_days:
+        return None
+
+    try:
+        return ExtractionCache(
+            path,
+            max_bytes=int(float(os.environ.get('PDF_EXTRACTION_CACHE_MAX_MB', '512')) * 1024 * 1024),
+            ttl_seconds=float(ttl_days) * 24 * 3600
+        )
+    except (OSError, ValueError, sqlite3.Error) as e:
+        # 캐시를 쓸 수 없어도 추출은 계속
+        print(f"Warning: extraction cache unavailable ({e})", file=sys.stderr)
+        return None
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+lib/python 모듈 공통 계측 (시간 구간/이벤트)
+- 기본은 꺼짐: span()/event()는 전역 변수 하나만 확인하고 아무것도 만들지 않는 객체를 돌려줌 (문자열 포맷 없음)
+- 요청 단위로 켬: with tracing(input_data.get('trace')) as tracer: ... → attach_trace(result, tracer)
+  (결과가 dict면 'trace' 키로, 아니면 stderr에 JSON 한 줄로)
+- 기록하는 것은 구간 이름/소요 시간/개수 같은 필드뿐 (본문 내용은 남기지 않음)
+
+레벨:
+  info   요청/단계별 구간 (파싱 단계별 시간, 찾은 항목 수)
+  debug  항목 하나하나의 세부 구간까지
+
+예:
+  with span('parse', chars=len(text)) as s:
+      items = parse(text)
+      s.set(items=len(items))
+
+  if enabled(DEBUG):      # 필드 계산 자체가 비싸면 먼저 확인
+      event('detail', ...)
+"""
+
+import json
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+OFF = 0
+INFO = 1
+DEBUG = 2
+
+LEVELS = {'off': OFF, 'info': INFO, 'debug': DEBUG}
+
+# 현재 요청의 Tracer (꺼져 있으면 None)
+_active = None
+
+class _NoopSpan:
+    """꺼져 있을 때 span()이 돌려주는 공용 객체"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set(self, **fields):
+        pass
+
+_NOOP_SPAN = _NoopSpan()
+
+class Span:
+    """시간 구간 하나 (with 블록)"""
+
+    __slots__ = ('record', '_tracer', '_started')
+
+    def __init__(self, tracer: 'Tracer', record: Dict):
+        self.record = record
+        self._tracer = tracer
+        self._started = None
+
+    def __enter__(self):
+        self._tracer._depth += 1
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.record['ms'] = round((time.perf_counter() - self._started) * 1000, 3)
+        if exc_type is not None:
+            self.record['error'] = exc_type.__name__
+        self._tracer._depth -= 1
+        return False
+
+    def set(self, **fields):
+        """구간 결과 필드 추가 (항목 수 등)"""
+        self.record.update(fields)
+
+class Tracer:
+    """요청 하나의 구간/이벤트 기록"""
+
+    def __init__(self, level: int = INFO):
+        self.level = level
+        self.records: List[Dict] = []
+        self._depth = 0
+        self._started = time.perf_counter()
+
+    def span(self, name: str, **fields) -> Span:
+        record = {'name': name, 'depth': self._depth, **fields}
+        self.records.append(record)
+        return Span(self, record)
+
+    def event(self, name: str, **fields):
+        self.records.append({'name': name, 'depth': self._depth, **fields})
+
+    def report(self) -> Dict:
+        """결과 JSON에 붙일 기록"""
+        return {
+            'level': next(name for name, value in LEVELS.items() if value == self.level),
+            'total_ms': round((time.perf_counter() - self._started) * 1000, 3),
+            'spans': self.records
+        }
+
+def parse_level(value) -> int:
+    """요청 플래그 → 레벨 (True/'info' → INFO, 'debug' → DEBUG, 없음/False/'off' → OFF)"""
+    if value is None or value is False:
+        return OFF
+    if value is True:
+        return INFO
+    if isinstance(value, int):
+        return max(OFF, min(value, DEBUG))
+    level = LEVELS.get(str(value).strip().lower())
+    if level is None:
+        raise ValueError(f'Unknown trace level: {value} (expected one of {", ".join(LEVELS)})')
+    return level
+
+@contextmanager
+def tracing(value) -> Iterator[Optional[Tracer]]:
+    """요청 하나 동안 계측 켜기 (레벨이 OFF면 None을 내주고 아무것도 하지 않음)"""
+    global _active
+
+    level = parse_level(value)
+    if level == OFF:
+        yield None
+        return
+
+    previous = _active
+    _active = Tracer(level)
+    try:
+        yield _active
+    finally:
+        _active = previous
+
+def attach_trace(result, tracer: Optional[Tracer]):
+    """계측 기록을 결과에 붙임 (켜져 있을 때만)"""
+    if tracer is None:
+        return result
+    if isinstance(result, dict):
+        result['trace'] = tracer.report()
+    else:
+        sys.stderr.write(json.dumps({'trace': tracer.report()}, ensure_ascii=False) + '\n')
+    return result
+
+def enabled(level: int = INFO) -> bool:
+    return _active is not None and _active.level >= level
+
+def span(name: str, level: int = INFO, **fields):
+    """시간 구간 (꺼져 있거나 레벨이 낮으면 공용 no-op 객체)"""
+    tracer = _active
+    if tracer is None or tracer.level < level:
+        return _NOOP_SPAN
+    return tracer.span(name, **fields)
+
+def event(name: str, level: int = INFO, **fields):
+    """시간 없는 기록 하나"""
+    tracer = _active
+    if tracer is not None and tracer.level >= level:
+        tracer.event(name, **fields)
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+프로세스 공용 Kiwi 모델
+- 모델은 처음 필요할 때 한 번만 로드 (import 시점에는 로드하지 않음)
+- 여러 텍스트는 Kiwi 배치 API로 멀티스레드 처리
+- KIWI_NUM_WORKERS 환경변수로 스레드 수 지정 (기본 1, -1: 사용 가능한 모든 코어)
+  분석 워커 풀은 워커마다 모델을 따로 가지므로 기본값은 단일 스레드 (워커 수 × 코어 수 스레드 방지)
+  단일 프로세스 CLI만 use_all_cores()로 모든 코어 사용
+"""
+
+import importlib.util
+import os
+import threading
+
+DEFAULT_NUM_WORKERS = 1
+
+_kiwi = None
+_kiwi_lock = threading.Lock()
+
+def kiwi_available() -> bool:
+    """kiwipiepy 설치 여부 (모델 로드 없이 확인)"""
+    return importlib.util.find_spec('kiwipiepy') is not None
+
+def use_all_cores():
+    """단일 프로세스 CLI용: KIWI_NUM_WORKERS가 없으면 모든 코어 사용 (모델 로드 전에 호출)"""
+    os.environ.setdefault('KIWI_NUM_WORKERS', '-1')
+
+def get_kiwi():
+    """공용 Kiwi 인스턴스"""
+    global _kiwi
+
+    if _kiwi is None:
+        with _kiwi_lock:
+            if _kiwi is None:
+                from kiwipiepy import Kiwi
+                _kiwi = Kiwi(num_workers=int(os.environ.get('KIWI_NUM_WORKERS', DEFAULT_NUM_WORKERS)))
+    return _kiwi
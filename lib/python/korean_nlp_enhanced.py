@@ -10,47 +10,47 @@ import json
 import sys
 import re
 
-try:
-    # Kiwi 사용 (순수 Python, 설치가 쉬움)
-    from kiwipiepy import Kiwi
-    kiwi = Kiwi()
-    NLP_AVAILABLE = True
-except ImportError:
-    NLP_AVAILABLE = False
+# Kiwi 사용 (순수 Python, 설치가 쉬움) - 모델은 kiwi_model에서 프로세스당 한 번만 로드
+from kiwi_model import kiwi_available, get_kiwi, use_all_cores
+
+NLP_AVAILABLE = kiwi_available()
+if not NLP_AVAILABLE:
     print("Warning: Kiwi not installed. Using regex-based parsing.", file=sys.stderr)
 
 class EnhancedKoreanAnalyzer:
     """향상된 한글 텍스트 분석기"""
     
-    def __init__(self):
-        if NLP_AVAILABLE:
-            self.kiwi = Kiwi()
+    @property
+    def kiwi(self):
+        """프로세스 공용 Kiwi 인스턴스"""
+        return get_kiwi()
     
     def extract_key_phrases(self, text):
         """핵심 구문 추출 (명사구 중심)"""
+        return self.extract_key_phrases_batch([text])[0]
+    
+    def extract_key_phrases_batch(self, texts):
+        """여러 텍스트의 핵심 구문 추출 (Kiwi 멀티스레드 배치 분석)"""
         if not NLP_AVAILABLE:
-            return self._regex_extract_phrases(text)
-        
-        result = self.kiwi.tokenize(text)
-        phrases = []
+            return [self._regex_extract_phrases(text) for text in texts]
         
-        for token in result:
-            # 명사류 추출 (NNG: 일반명사, NNP: 고유명사)
-            if token.tag.startswith('NN'):
-                phrases.append(token.form)
-        
-        return phrases
+        # 명사류 추출 (NNG: 일반명사, NNP: 고유명사)
+        return [
+            [token.form for token in tokens if token.tag.startswith('NN')]
+            for tokens in self.kiwi.tokenize(list(texts))
+        ]
     
     def correct_spacing(self, text):
         """띄어쓰기 교정"""
+        return self.correct_spacing_batch([text])[0]
+    
+    def correct_spacing_batch(self, texts):
+        """여러 텍스트 띄어쓰기 교정 (Kiwi 멀티스레드 배치 분석)"""
         if not NLP_AVAILABLE:
-            return text
+            return list(texts)
         
-        # Kiwi의 띄어쓰기 교정 기능 사용
-        result = self.kiwi.space(text)
-        if result:
-            return result[0][0]  # 가장 높은 확률의 결과 반환
-        return text
+        # Kiwi.space는 교정된 문자열을 반환 (리스트 입력 시 입력 순서대로)
+        return [spaced or text for text, spaced in zip(texts, self.kiwi.space(list(texts)))]
     
     def analyze_sentiment(self, text):
         """감정 분석 (긍정/부정/중립)"""
@@ -155,40 +155,73 @@ class EnhancedKoreanAnalyzer:
         else:
             return max(0, 100 - (avg_length - 60) * 1.5)
 
+def handle_command(analyzer, command, text):
+    """커맨드 하나 처리 (단일 실행/JSONL 모드 공통)"""
+    if command == 'extract_phrases':
+        return {'phrases': analyzer.extract_key_phrases(text)}
+    elif command == 'correct_spacing':
+        return {'text': analyzer.correct_spacing(text)}
+    elif command == 'analyze_sentiment':
+        return {'sentiment': analyzer.analyze_sentiment(text)}
+    elif command == 'extract_entities':
+        return analyzer.extract_entities(text)
+    elif command == 'analyze_quality':
+        return analyzer.analyze_document_quality(text)
+    else:
+        raise ValueError(f'Unknown command: {command}')
+
+def handle_batch_command(analyzer, command, texts):
+    """배치 커맨드 처리: 텍스트 목록을 한 번에 분석"""
+    if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+        raise ValueError('batch input must be a JSON array of strings')
+    
+    if command == 'extract_phrases_batch':
+        return {'results': [{'phrases': phrases} for phrases in analyzer.extract_key_phrases_batch(texts)]}
+    elif command == 'correct_spacing_batch':
+        return {'results': [{'text': text} for text in analyzer.correct_spacing_batch(texts)]}
+    else:
+        raise ValueError(f'Unknown command: {command}')
+
+def run_jsonl(analyzer, default_command, input_stream, output_stream):
+    """JSONL 스트리밍 모드: {"text": ..., "command": ...} 한 줄당 결과 한 줄"""
+    for line in input_stream:
+        if not line.strip():
+            continue
+        
+        try:
+            record = json.loads(line)
+            command = record.get('command', default_command)
+            result = handle_command(analyzer, command, record.get('text', ''))
+        except Exception as e:
+            result = {'error': str(e)}
+        
+        output_stream.write(json.dumps(result, ensure_ascii=False) + '\n')
+        output_stream.flush()
+
 def main():
-    if len(sys.argv) < 2:
+    args = [arg for arg in sys.argv[1:] if arg != '--jsonl']
+    jsonl_mode = len(args) < len(sys.argv) - 1
+    
+    if not args and not jsonl_mode:
         print(json.dumps({'error': 'No command provided'}))
         sys.exit(1)
     
-    command = sys.argv[1]
+    command = args[0] if args else None
+    use_all_cores()
     analyzer = EnhancedKoreanAnalyzer()
     
+    if jsonl_mode:
+        run_jsonl(analyzer, command, sys.stdin, sys.stdout)
+        return
+    
     try:
-        text = sys.stdin.read()
-        
-        if command == 'extract_phrases':
-            result = analyzer.extract_key_phrases(text)
-            print(json.dumps({'phrases': result}, ensure_ascii=False))
-            
-        elif command == 'correct_spacing':
-            result = analyzer.correct_spacing(text)
-            print(json.dumps({'text': result}, ensure_ascii=False))
-            
-        elif command == 'analyze_sentiment':
-            result = analyzer.analyze_sentiment(text)
-            print(json.dumps({'sentiment': result}, ensure_ascii=False))
-            
-        elif command == 'extract_entities':
-            result = analyzer.extract_entities(text)
-            print(json.dumps(result, ensure_ascii=False))
-            
-        elif command == 'analyze_quality':
-            result = analyzer.analyze_document_quality(text)
-            print(json.dumps(result, ensure_ascii=False))
-            
+        if command.endswith('_batch'):
+            # 배치 모드: stdin으로 텍스트 JSON 배열을 받아 한 번에 처리
+            result = handle_batch_command(analyzer, command, json.loads(sys.stdin.read()))
         else:
-            print(json.dumps({'error': f'Unknown command: {command}'}))
-            sys.exit(1)
+            text = sys.stdin.read()
+            result = handle_command(analyzer, command, text)
+        print(json.dumps(result, ensure_ascii=False))
             
     except Exception as e:
         print(json.dumps({'error': str(e)}))
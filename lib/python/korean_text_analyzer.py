@@ -4,7 +4,15 @@
 import json
 import sys
 import re
-from typing import Dict, List, Tuple, Optional
+from bisect import bisect_left
+from typing import Callable, Dict, List, Tuple, Optional
+
+from instrumentation import DEBUG, attach_trace, event, span, tracing
+from markdown_index import NUMBER_PREFIX_PATTERN, MarkdownIndex, Node
+from section_splitter import strip_span
+
+# #### 이하 제목은 GPT 출력에서 항목 안 소제목 (#### 1) 자소서 내용 인용과 첫인상) → 목록 항목을 끝내지 않음
+SUBHEADING_LEVEL = 4
 
 class KoreanTextAnalyzer:
     """한글 자소서 텍스트 구조 분석 및 파싱"""
@@ -36,224 +44,231 @@ class KoreanTextAnalyzer:
         # 한글 조사 패턴 (띄어쓰기 오류 보정용)
         self.josa_patterns = ['은', '는', '이', '가', '을', '를', '의', '에', '에서', '으로', '로', '와', '과']
         
-    def extract_sections(self, text: str) -> Dict[str, str]:
-        """텍스트에서 주요 섹션 추출"""
-        sections = {
-            'first_impression': None,
-            'strengths': None,
-            'improvements': None,
-            'hidden_gems': None,
-            'encouragement': None
+        # extract_sections 섹션별 ## 제목 패턴 (제목 줄의 # 뒤에서 매칭)
+        self.section_headings = {
+            'first_impression': [re.compile(r'1\.\s*첫\s*인상')],
+            'strengths': [re.compile(r'2\.\s*잘\s*쓴\s*부분')],
+            'improvements': [re.compile(r'3\.\s*(?:아쉬운|개선)\s*부분')],
+            'hidden_gems': [re.compile(r'4\.\s*(?:놓치고\s*있는\s*)?숨은\s*보석')],
+            'encouragement': [re.compile(r'5\.\s*격려')]
         }
         
-        # 특수문자 정리
-        cleaned_text = re.sub(r'[═─]{3,}', '', text).strip()
-        
-        # 섹션별 매칭 패턴 정의
-        section_patterns = {
-            'first_impression': [
-                r'##\s*1\.\s*첫\s*인상.*?\n(.*?)(?=##\s*2\.|$)',
-                r'첫\s*인상\s*&\s*전체.*?\n(.*?)(?=##|$)'
-            ],
-            'strengths': [
-                r'##\s*2\.\s*잘\s*쓴\s*부분.*?\n(.*?)(?=##\s*3\.|$)',
-                r'강점\s*\d+개.*?\n(.*?)(?=##|개선|$)'
-            ],
-            'improvements': [
-                r'##\s*3\.\s*(?:아쉬운|개선)\s*부분.*?\n(.*?)(?=##\s*4\.|$)'
-            ],
-            'hidden_gems': [
-                r'##\s*4\.\s*(?:놓치고\s*있는\s*)?숨은\s*보석.*?\n(.*?)(?=##\s*5\.|$)'
-            ],
-            'encouragement': [
-                r'##\s*5\.\s*격려.*?\n(.*?)(?=$)'
-            ]
+        # ## 제목이 없을 때 본문 속 섹션 표시 (패턴, 본문을 끝낼 단어)
+        self.section_markers = {
+            'first_impression': [(re.compile(r'첫\s*인상\s*&\s*전체'), None)],
+            'strengths': [(re.compile(r'강점\s*\d+개'), '개선')]
         }
         
-        for key, patterns in section_patterns.items():
-            for pattern in patterns:
-                match = re.search(pattern, cleaned_text, re.DOTALL | re.MULTILINE)
-                if match:
-                    sections[key] = match.group(1).strip() if match.lastindex else match.group(0).strip()
-                    break
+        self.box_line_pattern = re.compile(r'[═─]{3,}')
+        self.placeholder_pattern = re.compile(r'####\s*\d+\)\s*자소서[^\n]*\n+')
+        self.blank_lines_pattern = re.compile(r'\n{3,}')
+        self.colon_pattern = re.compile(r'[:：]')
         
+    def extract_sections(self, text: str) -> Dict[str, str]:
+        """텍스트에서 주요 섹션 추출"""
+        sections = {key: None for key in self.section_headings}
+
+        # 특수문자 정리
+        cleaned_text = self.box_line_pattern.sub('', text).strip()
+
+        with span('extract_sections', chars=len(cleaned_text)) as extracting:
+            index = MarkdownIndex(cleaned_text)
+            headings = index.select(lambda node: node.kind == 'heading' and node.level >= 2)
+            heading_starts = [node.start for node in headings]
+
+            for key in sections:
+                found = self._find_section(index, headings, heading_starts, key)
+                if found:
+                    sections[key] = cleaned_text[found[0]:found[1]].strip()
+            extracting.set(sections=sum(1 for value in sections.values() if value))
+
         # 섹션이 없으면 전체를 첫인상으로
         if not any(sections.values()):
             sections['first_impression'] = cleaned_text
-            
+
         return sections
-    
+
+    def _find_section(self, index: MarkdownIndex, headings: List[Node], heading_starts: List[int],
+                      key: str) -> Optional[Tuple[int, int]]:
+        """섹션 본문 범위: ## 제목이면 하위 제목 포함 전체, 본문 속 표시면 그 다음 줄부터 다음 ## 제목 직전까지"""
+        text = index.text
+
+        for pattern in self.section_headings[key]:
+            for node in headings:
+                if pattern.match(text, node.title_start, node.title_end):
+                    return node.body_start, node.end
+
+        for pattern, stop_word in self.section_markers.get(key, []):
+            match = pattern.search(text)
+            if not match:
+                continue
+            newline = text.find('\n', match.end())
+            if newline == -1:
+                continue
+
+            end = index.first_after(heading_starts, newline + 1)
+            if stop_word:
+                stop = text.find(stop_word, newline + 1, end)
+                end = stop if stop != -1 else end
+            return newline + 1, end
+
+        return None
+
     def parse_numbered_items(self, text: str) -> List[Dict[str, str]]:
         """번호가 매겨진 항목들 파싱 (GPT 응답 패턴 자동 감지)"""
         if not text:
             return []
-        
-        items = []
-        
-        # 패턴 감지 및 우선순위 결정
-        patterns = self._detect_gpt_patterns(text)
-        
-        for pattern_info in patterns:
-            pattern_type = pattern_info['type']
-            matches = pattern_info['matches']
-            
-            if matches:
-                for match in matches:
-                    if pattern_type == 'gpt41_section':
-                        # ### 1. **제목** 형식
-                        number, title, content = match
-                        items.append({
-                            'number': number,
-                            'title': title.strip(),
-                            'content': self._clean_content(content.strip())
-                        })
-                    elif pattern_type == 'gpt41_subsection':
-                        # **소제목** 형식 하위 섹션
-                        subtitle, content = match
-                        items.append({
-                            'number': str(len(items) + 1),
-                            'title': subtitle.strip(),
-                            'content': self._clean_content(content.strip())
-                        })
-                    elif pattern_type == 'legacy_numbered':
-                        # 기존 번호 매기기 형식
-                        number, title, content = match
-                        items.append({
-                            'number': number,
-                            'title': title.strip(),
-                            'content': self._clean_content(content.strip())
-                        })
-                
-                if items:  # 패턴 매칭 성공시 바로 반환
-                    break
-        
+
+        with span('parse_numbered_items', chars=len(text)) as parse:
+            # 패턴 감지 및 우선순위 결정 (구조 인덱스 한 번으로 모든 패턴 판정)
+            with span('markdown_index') as indexing:
+                index = MarkdownIndex(text)
+                indexing.set(nodes=len(index.nodes))
+
+            items = self._items(text, self._detect_gpt_patterns(index))
+            parse.set(items=len(items))
         return items
-    
-    def _detect_gpt_patterns(self, text: str) -> List[Dict]:
-        """GPT 출력 패턴 자동 감지 (실제 2025-08-31 GPT 응답 분석)"""
-        patterns = []
-        
+
+    def _items(self, text: str, spans: List[Tuple[str, str, int, int]]) -> List[Dict[str, str]]:
+        return [{
+            'number': number,
+            'title': title,
+            'content': self._clean_content(text, start, end)
+        } for number, title, start, end in spans]
+
+    @staticmethod
+    def _numbered_sections(index: MarkdownIndex) -> Tuple[List[Node], List[Node]]:
+        """### N. 제목 전체와 그중 ### N. **제목**"""
+        sections = index.select(lambda node: node.kind == 'heading' and node.level >= 3 and node.marker == '.')
+        return sections, [node for node in sections if node.bold]
+
+    def _detect_gpt_patterns(self, index: MarkdownIndex) -> List[Tuple[str, str, int, int]]:
+        """
+        GPT 출력 패턴 자동 감지 (실제 2025-08-31 GPT 응답 분석)
+
+        우선순위 (항목이 나온 첫 패턴 사용):
+          1. ### N. **제목**   본문: 다음 ### N. / --- / 빈 줄 2개 / 끝 직전까지
+          2. ### N. 제목       본문: 다음 ### N. / --- / 끝 직전까지
+          3. 첫 줄이 '...능력' (### 1. 이 생략된 경우)
+          4. N. **제목** → N. 제목 → N) 제목   본문: 같은 형식의 다음 항목 / --- / 빈 줄 2개 / 끝 직전까지
+
+        Returns:
+            [(번호, 제목, 본문 시작, 본문 끝)]
+        """
         # 실제 GPT 출력 구조:
         # ### 1. 고객 중심적 사고와 실질적 성과 도출 능력
         # **(자소서 인용 및 첫인상)**
         # 내용...
-        
-        # 1. 현재 GPT 패턴: ### N. **제목** (실제 2025-08-31 구조)
-        current_pattern = r'###\s*(\d+)\.\s*\*\*([^*]+)\*\*\s*\n+(.*?)(?=###\s*\d+\.|---|\n{3,}|$)'
-        current_matches = re.findall(current_pattern, text, re.MULTILINE | re.DOTALL)
-        
-        if current_matches:
-            for number, title, content in current_matches:
-                patterns.append({
-                    'type': 'gpt41_section',
-                    'priority': 1,
-                    'matches': [(number, title.strip(), content.strip())],
-                    'description': f'현재 GPT 볼드 패턴: {title}'
-                })
-            return patterns
-            
-        # 1-2. 현재 GPT 패턴: ### N. 제목 (볼드 없음)
-        simple_pattern = r'###\s*(\d+)\.\s*([^\n]+)\s*\n+(.*?)(?=###\s*\d+\.|---\s*$|$)'
-        simple_matches = re.findall(simple_pattern, text, re.MULTILINE | re.DOTALL)
-        
-        if simple_matches:
-            for number, title, content in simple_matches:
-                patterns.append({
-                    'type': 'gpt41_section',
-                    'priority': 2,
-                    'matches': [(number, title.strip(), content.strip())],
-                    'description': f'현재 GPT 단순 패턴: {title}'
-                })
-            return patterns
-        
-        # 1-2. 첫 번째 항목 특수 처리 (### 1. 이 생략된 경우)
-        # 텍스트가 바로 제목으로 시작하는 경우
-        if text.strip().startswith('중심적 사고'):
-            # "중심적 사고와 실질적 성과 도출 능력" 같은 패턴
-            first_item_pattern = r'^([^\n]+능력)\s*\n+(.*?)(?=###\s*\d+\.|---\s*$|$)'
-            match = re.search(first_item_pattern, text, re.MULTILINE | re.DOTALL)
-            if match:
-                title, content = match.groups()
-                patterns.append({
-                    'type': 'gpt41_section',
-                    'priority': 1,
-                    'matches': [("1", "고객 " + title.strip(), content.strip())],
-                    'description': f'첫 번째 항목 특수 처리: {title}'
-                })
-                return patterns
-        
-        # 2. 이전 GPT 패턴: ### N. **제목**
-        legacy_bold_pattern = r'###\s*(\d+)\.\s*\*\*([^*]+)\*\*\s*\n+(.*?)(?=###\s*\d+\.|---\s*$|$)'
-        legacy_matches = re.findall(legacy_bold_pattern, text, re.MULTILINE | re.DOTALL)
-        
-        if legacy_matches:
-            for number, title, content in legacy_matches:
-                patterns.append({
-                    'type': 'gpt41_section',
-                    'priority': 2,
-                    'matches': [(number, title.strip(), content.strip())],
-                    'description': f'레거시 GPT 볼드 패턴: {title}'
-                })
-            return patterns
-        
-        # 3. 단순 번호 패턴들
-        simple_patterns = [
-            (r'(\d+)\.\s*\*\*([^*]+)\*\*\s*\n+(.*?)(?=\d+\.\s*\*\*|---|\n{3,}|$)', '번호 볼드'),
-            (r'(\d+)\.\s*([^\n]+)\s*\n+(.*?)(?=\d+\.\s*[^\n]|---|\n{3,}|$)', '단순 번호'),
-            (r'(\d+)\)\s*([^\n]+)\s*\n+(.*?)(?=\d+\)|---|\n{3,}|$)', '괄호 번호'),
+        sections, bold_sections = self._numbered_sections(index)
+
+        tiers = [
+            # 1. 현재 GPT 패턴: ### N. **제목**
+            ('gpt_bold_sections', lambda: self._item_spans(index, bold_sections, sections, stop_at_gap=True)),
+            # 1-2. 현재 GPT 패턴: ### N. 제목 (볼드 없음)
+            ('gpt_sections', lambda: self._item_spans(index, sections, sections, stop_at_gap=False)),
+            # 1-3. 첫 번째 항목 특수 처리 (### 1. 이 생략된 경우)
+            ('first_item', lambda: self._first_item_span(index)),
+            # 2. 단순 번호 패턴들: 번호 볼드 → 단순 번호 → 괄호 번호
+            ('numbered_bold', lambda: self._list_item_spans(index, lambda node: node.marker == '.' and node.bold)),
+            ('numbered', lambda: self._list_item_spans(index, lambda node: node.marker == '.')),
+            ('parenthesized', lambda: self._list_item_spans(index, lambda node: node.marker == ')')),
         ]
-        
-        for pattern, desc in simple_patterns:
-            matches = re.findall(pattern, text, re.MULTILINE | re.DOTALL)
-            if matches:
-                patterns.append({
-                    'type': 'legacy_numbered',
-                    'priority': 3,
-                    'matches': matches,
-                    'description': f'{desc} 형식'
-                })
-        
-        return patterns
-    
-    def _clean_content(self, content: str) -> str:
-        """내용 정리 (placeholder 제거하되 실제 내용은 유지)"""
-        if not content:
+
+        for name, detect in tiers:
+            with span('pattern_tier', tier=name) as tier:
+                spans = detect()
+                tier.set(items=len(spans))
+            if spans:
+                return spans
+
+        return []
+
+    @staticmethod
+    def _first_item_span(index: MarkdownIndex) -> List[Tuple[str, str, int, int]]:
+        """텍스트가 바로 "중심적 사고와 실질적 성과 도출 능력" 같은 제목으로 시작하는 경우"""
+        text = index.text
+        if not text.strip().startswith('중심적 사고'):
+            return []
+
+        first_line_start = strip_span(text, 0, len(text))[0]
+        first_line_end = index.line_end(first_line_start)
+        title = text[first_line_start:first_line_end].strip()
+        if not title.endswith('능력') or first_line_end >= len(text):
+            return []
+        return [('1', '고객 ' + title, first_line_end + 1, index.first_after(index.rules, first_line_end))]
+
+    def _list_item_spans(self, index: MarkdownIndex,
+                         predicate: Callable[[Node], bool]) -> List[Tuple[str, str, int, int]]:
+        items = index.select(predicate)
+        return self._item_spans(index, items, items, stop_at_gap=True)
+
+    @staticmethod
+    def _item_spans(index: MarkdownIndex, items: List[Node], boundaries: List[Node],
+                    stop_at_gap: bool) -> List[Tuple[str, str, int, int]]:
+        """
+        항목별 본문 범위 - 다음 경계 항목, 구분선, (stop_at_gap이면) 빈 줄 2개,
+        상위 제목 중 먼저 나오는 곳 직전까지
+          제목 항목: 자기 노드 범위 끝
+          목록 항목: 항목을 감싸는 ### 이상 제목의 범위 끝 (없으면 다음 ### 이상 제목) - #### 소제목에서는 끝나지 않음
+        """
+        text = index.text
+        boundary_starts = [node.start for node in boundaries]
+        sections = [node for node in index.nodes if node.kind == 'heading' and node.level < SUBHEADING_LEVEL]
+        section_starts = [node.start for node in sections]
+
+        spans = []
+        for node in items:
+            if node.kind == 'heading':
+                parent_end = node.end
+            else:
+                enclosing = bisect_left(section_starts, node.start) - 1
+                parent_end = (sections[enclosing].end if enclosing >= 0
+                              else index.first_after(section_starts, node.body_start))
+            end = min(parent_end,
+                      index.first_after(boundary_starts, node.body_start),
+                      index.first_after(index.rules, node.body_start))
+            if stop_at_gap:
+                end = min(end, index.first_after(index.gaps, node.body_start))
+            spans.append((node.number, node.name(text).strip(), node.body_start, max(end, node.body_start)))
+        return spans
+
+    def _clean_content(self, text: str, start: int = 0, end: Optional[int] = None) -> str:
+        """내용 정리 (placeholder 제거하되 실제 내용은 유지) - text[start:end] 범위를 한 번만 복사"""
+        start, end = strip_span(text, start, len(text) if end is None else end)
+        if start >= end:
             return ""
-        
-        # 디버깅을 위한 로그
-        original_length = len(content)
-        
+
+        original_length = end - start
+
         # 빈 placeholder만 제거 (실제 내용이 있는 부분은 유지)
-        # "**자소서 인용 및 첫인상**" 같은 헤더는 제거하되, 
+        # "**자소서 인용 및 첫인상**" 같은 헤더는 제거하되,
         # 그 뒤의 실제 내용은 보존
-        
+
         # 1. placeholder 헤더만 제거하고 실제 내용은 보존
         # GPT가 생성한 실제 구조:
         # #### 1) 자소서 내용 인용과 첫인상
         # #### 2) HR 관점에서 왜 좋은지
         # #### 3) 차별화 포인트와 실무 연결
         # #### 4) 면접 활용 전략
-        
+
         # 가장 간단한 접근: placeholder 헤더만 제거하고 나머지는 모두 보존
         # "#### 1) 자소서 내용 인용과 첫인상" 같은 첫 번째 소제목만 제거
-        content = re.sub(r'^####\s*\d+\)\s*자소서[^\n]*\n+', '', content, count=1)
-        
+        placeholder = self.placeholder_pattern.match(text, start, end)
+        if placeholder:
+            start, end = strip_span(text, placeholder.end(), end)
+
         # 하지만 실제 분석 내용이 시작되는 부분부터는 모두 보존
-        
-        # 2. 연속된 줄바꿈 정리
-        content = re.sub(r'\n{3,}', '\n\n', content)
-        
-        # 3. 앞뒤 공백 제거
-        content = content.strip()
-        
-        # 디버깅 정보 (stderr로 출력) - 실제 내용이 있을 때만
-        if len(content) > 50:
-            import sys
-            print(f"DEBUG: 원본 {original_length}자 → 정리 후 {len(content)}자", file=sys.stderr)
-            print(f"DEBUG: 내용 시작: {content[:150]}...", file=sys.stderr)
-        
+
+        # 2. 연속된 줄바꿈 정리 (앞뒤 공백은 범위에서 이미 제외)
+        content = text[start:end]
+        if text.find('\n\n\n', start, end) != -1:
+            content = self.blank_lines_pattern.sub('\n\n', content)
+
+        event('clean_content', DEBUG, chars=original_length, cleaned_chars=len(content),
+              placeholder_removed=placeholder is not None)
+
         return content
-    
+
     def normalize_korean_spacing(self, text: str) -> str:
         """한글 띄어쓰기 정규화"""
         # 조사 앞 불필요한 띄어쓰기 제거
@@ -265,23 +280,34 @@ class KoreanTextAnalyzer:
         
         return text.strip()
     
-    def detect_section_structure(self, text: str) -> Dict[str, any]:
-        """자소서의 구조 자동 감지"""
+    def detect_section_structure(self, text: str, index: Optional[MarkdownIndex] = None) -> Dict[str, any]:
+        """자소서의 구조 자동 감지 (index: 이미 만든 구조 인덱스 재사용)"""
         structure = {
             'has_numbered_sections': False,
             'section_count': 0,
             'section_titles': [],
             'format_type': 'unknown'  # 'markdown', 'plain', 'mixed'
         }
-        
-        # 마크다운 헤더 체크
-        markdown_headers = re.findall(r'^#{1,3}\s+(.+)$', text, re.MULTILINE)
+
+        if index is None:
+            index = MarkdownIndex(text)
+
+        # 마크다운 헤더 체크 (# ~ ###)
+        markdown_headers = [node.title(text) for node in index.nodes if node.kind == 'heading' and node.level <= 3]
         if markdown_headers:
             structure['format_type'] = 'markdown'
             structure['section_titles'] = markdown_headers
-        
-        # 번호 매기기 체크
-        numbered_sections = re.findall(r'^\d+\.\s*(.+?)[:：]', text, re.MULTILINE)
+
+        # 번호 매기기 체크 (줄 맨 앞 "1. 제목:")
+        numbered_sections = []
+        for node in index.nodes:
+            if node.kind != 'numbered' or not text[node.start].isdigit():
+                continue
+            name_start = NUMBER_PREFIX_PATTERN.match(text, node.title_start, node.title_end).end()
+            colon = self.colon_pattern.search(text, name_start + 1, node.title_end)
+            if colon:
+                numbered_sections.append(text[name_start:colon.start()])
+
         if numbered_sections:
             structure['has_numbered_sections'] = True
             structure['section_count'] = len(numbered_sections)
@@ -290,95 +316,256 @@ class KoreanTextAnalyzer:
             else:
                 structure['format_type'] = 'mixed'
             structure['section_titles'].extend(numbered_sections)
-        
+
         return structure
-    
+
     def smart_split_sections(self, text: str) -> List[Dict[str, str]]:
         """지능형 섹션 분리 (다양한 형식 자동 인식)"""
         sections = []
-        
-        # 우선 구조 감지
-        structure = self.detect_section_structure(text)
-        
+
+        # 우선 구조 감지 (같은 인덱스로 분리까지 처리)
+        with span('markdown_index', chars=len(text)) as indexing:
+            index = MarkdownIndex(text)
+            indexing.set(nodes=len(index.nodes))
+        structure = self.detect_section_structure(text, index)
+
         if structure['format_type'] == 'markdown':
-            # 마크다운 기반 분리
-            pattern = r'^(#{1,3})\s+(.+?)$\n(.*?)(?=^#{1,3}|\Z)'
-            matches = re.findall(pattern, text, re.MULTILINE | re.DOTALL)
-            for level, title, content in matches:
+            # 마크다운 기반 분리: # ~ ### 제목마다, 본문은 다음 제목(수준 무관) 직전까지
+            headings = index.select(lambda node: node.kind == 'heading')
+            heading_starts = [node.start for node in headings]
+            for node in headings:
+                if node.level > 3:
+                    continue
+                end = index.first_after(heading_starts, node.body_start)
                 sections.append({
-                    'level': len(level),
-                    'title': title.strip(),
-                    'content': content.strip()
+                    'level': node.level,
+                    'title': node.title(text),
+                    'content': text[node.body_start:end].strip()
                 })
         else:
             # 일반 텍스트 기반 분리
-            # 빈 줄 2개 이상을 섹션 구분자로 사용
-            parts = re.split(r'\n{2,}', text)
-            for i, part in enumerate(parts):
-                if part.strip():
-                    # 첫 줄을 제목으로 추정
-                    lines = part.strip().split('\n', 1)
-                    title = lines[0] if lines else f'섹션 {i+1}'
-                    content = lines[1] if len(lines) > 1 else ''
-                    
-                    sections.append({
-                        'level': 1,
-                        'title': title.strip(),
-                        'content': content.strip()
-                    })
-        
+            # 빈 줄을 섹션 구분자로 사용 (문단마다 첫 줄을 제목으로 추정)
+            for start, end in index.paragraphs:
+                start, end = strip_span(text, start, end)
+                if start >= end:
+                    continue
+
+                title_end = index.line_end(start)
+                if title_end > end:
+                    title_end = end
+                sections.append({
+                    'level': 1,
+                    'title': text[start:title_end].strip(),
+                    'content': text[title_end:end].strip()
+                })
+
+        event('smart_split_sections', format_type=structure['format_type'], sections=len(sections))
         return sections
 
+class StreamingItemParser:
+    """
+    스트리밍 GPT 응답의 점진 파싱 (### N. **제목** 항목)
+
+    - feed(chunk): 조각을 받아, 다음 ### N. 제목/---/빈 줄 2개/상위 제목이 나와 닫힌 항목만 반환
+    - close(): 응답 끝 - 남은 항목 반환
+    - 메모리에는 아직 닫히지 않은 항목부터의 꼬리만 보관 (마지막 줄이 덜 왔으면 그 줄도)
+    - 새로 완성된 줄만 훑어 열린 항목을 닫을 수 있는 줄(구분선/빈 줄 2개/같거나 상위 제목/### N. 제목)이
+      있을 때만 꼬리 전체를 합쳐 인덱싱 (긴 항목을 한 줄씩 받아도 줄마다 항목 전체를 복사/인덱싱하지 않음)
+    - 모든 조각의 feed 결과 + close 결과 = parse_numbered_items(전체 응답)
+      (### N. **제목** 이 한 번도 없으면 전체를 보관했다가 close()에서 기존 우선순위로 파싱)
+    """
+
+    def __init__(self, analyzer: KoreanTextAnalyzer):
+        self.analyzer = analyzer
+        self._reset()
+
+    def _reset(self):
+        self._sections_seen = False
+        # 이미 훑은 완성된 줄들 (열린 항목 또는 아직 항목이 없던 앞부분), 덜 온 마지막 줄
+        self._lines: List[str] = []
+        self._lines_chars = 0
+        self._last_chars = ''       # 훑은 줄의 마지막 두 글자 (줄 경계에 걸친 빈 줄 2개 확인용)
+        self._partial = ''
+        # 열린 항목의 제목 수준 (열린 항목이 없으면 None)
+        self._open_level = None
+
+    @property
+    def pending(self) -> bool:
+        """아직 반환하지 않은 텍스트가 있는지"""
+        return bool(self._lines or self._partial)
+
+    def feed(self, chunk: str) -> List[Dict[str, str]]:
+        with span('stream_feed', chunk_chars=len(chunk)) as feeding:
+            items = []
+            newline = chunk.rfind('\n')
+            if newline == -1:
+                self._partial += chunk
+            else:
+                completed = self._partial + chunk[:newline + 1]
+                self._partial = chunk[newline + 1:]
+                items = self._drain(completed)
+            feeding.set(items=len(items), tail_chars=self._lines_chars + len(self._partial))
+        return items
+
+    def close(self) -> List[Dict[str, str]]:
+        text = ''.join(self._lines) + self._partial
+        if self._sections_seen:
+            items = self._parse(text, final=True)
+        else:
+            items = self.analyzer.parse_numbered_items(text)
+        self._reset()
+        return items
+
+    def _may_close(self, completed: str) -> bool:
+        """새로 완성된 줄에 열린 항목을 닫거나 새 항목을 여는 줄이 있는지"""
+        if '\n\n\n' in self._last_chars + completed:
+            return True
+
+        region = MarkdownIndex(completed)
+        if region.rules:
+            return True
+        level = self._open_level
+        return any(node.kind == 'heading' and (level is None or node.level <= level
+                                               or (node.level >= 3 and node.marker == '.'))
+                   for node in region.nodes)
+
+    def _drain(self, completed: str) -> List[Dict[str, str]]:
+        """새로 완성된 줄 처리 - 항목이 닫힐 수 있을 때만 꼬리 전체를 인덱싱"""
+        if self._may_close(completed):
+            return self._parse(''.join(self._lines) + completed, final=False)
+
+        if self._sections_seen and self._open_level is None:
+            # 이전 항목은 모두 닫혔고 새 항목은 아직 없음 - 덜 온 마지막 줄만 보관
+            self._lines = []
+            self._lines_chars = 0
+        else:
+            self._lines.append(completed)
+            self._lines_chars += len(completed)
+        self._last_chars = (self._last_chars + completed)[-2:]
+        return []
+
+    def _parse(self, text: str, final: bool) -> List[Dict[str, str]]:
+        """완성된 줄까지 인덱싱해 닫힌 항목 반환, 꼬리는 열린 항목부터로 줄임"""
+        index = MarkdownIndex(text)
+        sections, bold_sections = self.analyzer._numbered_sections(index)
+        if not bold_sections:
+            # 항목이 아직 없으면 보관, 이전 항목이 모두 닫혔으면 버림
+            self._lines = [] if self._sections_seen or not text else [text]
+            self._lines_chars = len(self._lines[0]) if self._lines else 0
+            self._last_chars = text[-2:]
+            return []
+
+        self._sections_seen = True
+        spans = self.analyzer._item_spans(index, bold_sections, sections, stop_at_gap=True)
+
+        closed = []
+        keep_from = len(text)
+        self._open_level = None
+        for node, span in zip(bold_sections, spans):
+            if not final and span[3] >= len(text):
+                keep_from = node.start
+                self._open_level = node.level
+                break
+            closed.append(span)
+
+        items = self.analyzer._items(text, closed)
+        self._lines = [text[keep_from:]] if keep_from < len(text) else []
+        self._lines_chars = len(text) - keep_from
+        self._last_chars = text[-2:]
+        return items
+
+def handle_request(analyzer: KoreanTextAnalyzer, input_data: Dict) -> Dict:
+    """요청 하나 처리 (단일 실행/JSONL 모드 공통, "trace": true/"debug" 이면 계측 기록을 결과에 포함)"""
+    with tracing(input_data.get('trace')) as tracer:
+        return attach_trace(_dispatch(analyzer, input_data), tracer)
+
+def _dispatch(analyzer: KoreanTextAnalyzer, input_data: Dict) -> Dict:
+    text = input_data.get('text', '')
+    action = input_data.get('action', 'parse_numbered_items')
+    
+    if action == 'extract_sections':
+        return {'success': True, 'sections': analyzer.extract_sections(text)}
+    elif action == 'parse_numbered_items':
+        return {'success': True, 'items': analyzer.parse_numbered_items(text)}
+    elif action == 'normalize':
+        return {'success': True, 'text': analyzer.normalize_korean_spacing(text)}
+    elif action == 'detect_structure':
+        return {'success': True, 'structure': analyzer.detect_section_structure(text)}
+    elif action == 'smart_split':
+        return {'success': True, 'sections': analyzer.smart_split_sections(text)}
+    else:
+        return {'success': False, 'error': f'Unknown action: {action}'}
+
+def run_jsonl(analyzer: KoreanTextAnalyzer, input_stream, output_stream):
+    """JSONL 스트리밍 모드: 요청을 한 줄씩 읽어 처리하고 결과를 바로 한 줄씩 출력"""
+    for line in input_stream:
+        if not line.strip():
+            continue
+        
+        try:
+            result = handle_request(analyzer, json.loads(line))
+        except json.JSONDecodeError as e:
+            result = {'success': False, 'error': f'JSON 파싱 오류: {str(e)}'}
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+        
+        output_stream.write(json.dumps(result, ensure_ascii=False) + '\n')
+        output_stream.flush()
+
+def run_stream(analyzer: KoreanTextAnalyzer, input_stream, output_stream):
+    """
+    GPT 응답 스트리밍 모드: {"chunk": "..."} 한 줄마다 새로 닫힌 항목을 한 줄로 출력
+    {"done": true} 이면 남은 항목을 출력하고 다음 응답을 받음 (입력이 끝나면 남은 항목 출력)
+    줄마다 "trace" 플래그로 계측 기록 포함
+    """
+    parser = StreamingItemParser(analyzer)
+    
+    def write(result: Dict):
+        output_stream.write(json.dumps(result, ensure_ascii=False) + '\n')
+        output_stream.flush()
+    
+    for line in input_stream:
+        if not line.strip():
+            continue
+        
+        try:
+            request = json.loads(line)
+            with tracing(request.get('trace')) as tracer:
+                if request.get('done'):
+                    result = {'success': True, 'items': parser.close(), 'done': True}
+                else:
+                    result = {'success': True, 'items': parser.feed(request.get('chunk', ''))}
+                attach_trace(result, tracer)
+        except json.JSONDecodeError as e:
+            result = {'success': False, 'error': f'JSON 파싱 오류: {str(e)}'}
+        except Exception as e:
+            parser = StreamingItemParser(analyzer)
+            result = {'success': False, 'error': str(e)}
+        
+        write(result)
+    
+    if parser.pending:
+        write({'success': True, 'items': parser.close(), 'done': True})
+
 def main():
-    """CLI 인터페이스 - JSON 입력 처리"""
+    """CLI 인터페이스 - JSON 입력 처리 (--jsonl: 줄 단위 스트리밍, --stream: GPT 응답 조각 단위 파싱)"""
     analyzer = KoreanTextAnalyzer()
     
+    if '--jsonl' in sys.argv[1:]:
+        run_jsonl(analyzer, sys.stdin, sys.stdout)
+        return
+    
+    if '--stream' in sys.argv[1:]:
+        run_stream(analyzer, sys.stdin, sys.stdout)
+        return
+    
     try:
         # JSON 입력 받기
         input_data = json.loads(sys.stdin.read())
-        text = input_data.get('text', '')
-        action = input_data.get('action', 'parse_numbered_items')
+        result = handle_request(analyzer, input_data)
+        print(json.dumps(result, ensure_ascii=False))
         
-        if action == 'extract_sections':
-            result = analyzer.extract_sections(text)
-            print(json.dumps({
-                'success': True,
-                'sections': result
-            }, ensure_ascii=False))
-            
-        elif action == 'parse_numbered_items':
-            result = analyzer.parse_numbered_items(text)
-            print(json.dumps({
-                'success': True,
-                'items': result
-            }, ensure_ascii=False))
-            
-        elif action == 'normalize':
-            result = analyzer.normalize_korean_spacing(text)
-            print(json.dumps({
-                'success': True,
-                'text': result
-            }, ensure_ascii=False))
-            
-        elif action == 'detect_structure':
-            result = analyzer.detect_section_structure(text)
-            print(json.dumps({
-                'success': True,
-                'structure': result
-            }, ensure_ascii=False))
-            
-        elif action == 'smart_split':
-            result = analyzer.smart_split_sections(text)
-            print(json.dumps({
-                'success': True,
-                'sections': result
-            }, ensure_ascii=False))
-            
-        else:
-            print(json.dumps({
-                'success': False,
-                'error': f'Unknown action: {action}'
-            }))
+        if not result['success']:
             sys.exit(1)
             
     except json.JSONDecodeError as e:
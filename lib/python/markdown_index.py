@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+GPT 분석 결과(마크다운) 구조 인덱스
+- 텍스트를 한 번 훑어 제목 줄을 노드로 기록 (텍스트는 복사하지 않고 오프셋만)
+- 노드 범위는 다음에 나오는 같거나 상위 수준의 노드 직전까지 → 범위가 중첩되어 트리를 이룸
+- 같은 스캔에서 구분선(---), 간격(빈 줄 2개 이상), 문단(빈 줄로 나뉜 덩어리) 위치도 기록
+
+노드 종류 (level 이 작을수록 상위):
+  heading   ### 제목      level = # 개수 (1~6)
+  bold      **제목**      level 7 (줄 전체가 굵은 글씨)
+  numbered  1. 제목       level 8
+  paren     1) 제목       level 9
+제목 앞 번호는 number/marker 로 따로 기록 (### 1. **제목** → heading, number='1', marker='.', bold=True)
+"""
+
+import re
+from bisect import bisect_left
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+BOLD_LEVEL = 7
+NUMBERED_LEVEL = 8
+PAREN_LEVEL = 9
+
+# 한 줄의 구조 (제목/굵은 제목/번호 항목/구분선), 빈 줄 묶음은 마지막 개행 직전까지 (다음 줄이 이어서 매칭되도록)
+LINE_SYNTAX = r'''
+      [ \t]{0,3}(?P<hashes>\#{1,6})(?:[ \t]+|(?=\d))
+        (?P<title>(?:(?P<number>\d+)(?P<marker>[.)])[ \t]*)?(?P<name>\S[^\n]*?))[ \t\r]*$
+    | [ \t]*(?P<item>(?P<item_number>\d+)(?P<item_marker>[.)])[ \t]*(?P<item_name>\S[^\n]*?))[ \t\r]*$
+    | [ \t]*\*\*(?P<bold>[^*\n]+)\*\*[ \t]*[:：]?[ \t\r]*$
+    | (?P<rule>[ \t]*-{3,}[ \t\r]*)$
+    | (?P<blank>\n*)(?=\n)
+'''
+
+# 개행 리터럴로 시작해 정규식 엔진이 줄 시작만 빠르게 찾아 확인 (본문 글자마다 분기를 시도하지 않음)
+STRUCTURE_PATTERN = re.compile(r'\n(?:' + LINE_SYNTAX + ')', re.MULTILINE | re.VERBOSE)
+FIRST_LINE_PATTERN = re.compile(LINE_SYNTAX, re.MULTILINE | re.VERBOSE)
+
+BOLD_NAME_PATTERN = re.compile(r'\*\*([^*]+)\*\*[ \t]*')
+NUMBER_PREFIX_PATTERN = re.compile(r'(\d+)([.)])[ \t]*')
+
+class Node:
+    """제목 줄 하나 (오프셋만 보관)"""
+
+    __slots__ = ('kind', 'level', 'start', 'end', 'title_start', 'title_end', 'body_start',
+                 'number', 'marker', 'name_start', 'name_end', 'bold')
+
+    def __init__(self, kind: str, level: int, start: int, body_start: int, title_span: Tuple[int, int],
+                 name_span: Tuple[int, int], number: Optional[str] = None, marker: Optional[str] = None,
+                 bold: bool = False):
+        self.kind = kind
+        self.level = level
+        self.start = start                          # 제목 줄 시작
+        self.end = None                             # 노드 범위 끝 (하위 노드 포함)
+        self.body_start = body_start                # 제목 다음 줄 시작
+        self.title_start, self.title_end = title_span  # 제목 (# 제외, 앞뒤 공백 제외)
+        self.name_start, self.name_end = name_span  # 번호 뒤 제목 (굵은 글씨면 ** 안쪽)
+        self.number = number                        # 제목 앞 번호
+        self.marker = marker                        # '.' 또는 ')'
+        self.bold = bold
+
+    def title(self, text: str) -> str:
+        return text[self.title_start:self.title_end]
+
+    def name(self, text: str) -> str:
+        return text[self.name_start:self.name_end]
+
+    def __repr__(self):
+        return (f"Node({self.kind}, level={self.level}, start={self.start}, end={self.end}, "
+                f"number={self.number!r}, marker={self.marker!r}, bold={self.bold})")
+
+class MarkdownIndex:
+    """텍스트 한 번 스캔으로 만든 노드/구분선/간격/문단 오프셋"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.nodes: List[Node] = []
+        self.rules: List[int] = []                    # 구분선 줄 시작
+        self.gaps: List[int] = []                     # 빈 줄 2개 이상이 이어지기 직전 (앞 줄 끝)
+        self.paragraphs: List[Tuple[int, int]] = []   # (첫 줄 시작, 마지막 줄 끝)
+        self._scan()
+
+    def _scan(self):
+        text = self.text
+        length = len(text)
+        open_nodes = []
+        paragraph_start = 0
+
+        for line_start, match in self._structure_lines():
+            kind = match.lastgroup
+
+            if kind == 'blank':
+                # 개행 2개 이상 묶음: 문단 경계, 3개 이상(빈 줄 2개 이상)이면 간격
+                newlines = match.end() - match.start() + 1
+                if match.start() > paragraph_start:
+                    self.paragraphs.append((paragraph_start, match.start()))
+                if newlines >= 3:
+                    self.gaps.append(match.start())
+                paragraph_start = match.end() + 1
+                continue
+
+            if kind == 'rule':
+                self.rules.append(line_start)
+                continue
+
+            node = self._node(match, line_start, min(match.end() + 1, length))
+            while open_nodes and open_nodes[-1].level >= node.level:
+                open_nodes.pop().end = line_start
+            open_nodes.append(node)
+            self.nodes.append(node)
+
+        if paragraph_start < length:
+            self.paragraphs.append((paragraph_start, length))
+        for node in open_nodes:
+            node.end = length
+
+    def _structure_lines(self) -> Iterator[Tuple[int, re.Match]]:
+        """(줄 시작, 매칭) - 첫 줄은 앞에 개행이 없으므로 따로 확인"""
+        if self.text and self.text[0] != '\n':
+            match = FIRST_LINE_PATTERN.match(self.text)
+            if match:
+                yield 0, match
+        for match in STRUCTURE_PATTERN.finditer(self.text):
+            yield match.start() + 1, match
+
+    def _node(self, match: re.Match, start: int, body_start: int) -> Node:
+        if match.lastgroup == 'bold':
+            span = match.span('bold')
+            return Node('bold', BOLD_LEVEL, start, body_start, span, span, bold=True)
+
+        hashes = match.group('hashes')
+        if hashes:
+            kind, level = 'heading', len(hashes)
+            title_span, number, marker, name_span = match.span('title'), *match.group('number', 'marker'), match.span('name')
+        else:
+            number, marker = match.group('item_number', 'item_marker')
+            kind, level = ('numbered', NUMBERED_LEVEL) if marker == '.' else ('paren', PAREN_LEVEL)
+            title_span, name_span = match.span('item'), match.span('item_name')
+
+        # 번호 뒤 제목 전체가 **굵은 글씨** 이면 안쪽만
+        bold = None
+        if self.text.startswith('**', name_span[0]):
+            bold = BOLD_NAME_PATTERN.fullmatch(self.text, *name_span)
+        if bold:
+            name_span = bold.span(1)
+
+        return Node(kind, level, start, body_start, title_span, name_span, number, marker, bool(bold))
+
+    def select(self, predicate: Callable[[Node], bool]) -> List[Node]:
+        return [node for node in self.nodes if predicate(node)]
+
+    def first_after(self, offsets: Sequence[int], position: int, default: Optional[int] = None) -> int:
+        """정렬된 offsets 중 position 이상인 첫 값 (없으면 default, 기본은 텍스트 끝)"""
+        index = bisect_left(offsets, position)
+        if index < len(offsets):
+            return offsets[index]
+        return len(self.text) if default is None else default
+
+    def line_end(self, position: int) -> int:
+        newline = self.text.find('\n', position)
+        return len(self.text) if newline == -1 else newline
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+페이지 스트리밍 분류기
+- 페이지를 생성기에서 하나씩 받아 분류하고, 자소서 페이지 구간이 확정되면 나머지 페이지는 추출하지 않음
+- 구간 확정: 자소서 페이지가 나온 뒤 자소서가 아닌 페이지(resume/unknown)가 TRAILING_PAGES 장 연속
+  (mixed 페이지는 자소서 일부일 수 있어 연속 카운트를 초기화)
+- 자소서가 나오지 않으면 끝까지 스캔 (이력서 뒤에 자소서가 붙는 일반적인 경우는 결과 동일)
+- full_scan=True 이면 항상 모든 페이지를 추출/분류
+- PDF_EARLY_EXIT_PAGES 환경변수로 TRAILING_PAGES 지정
+"""
+
+import os
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+TRAILING_PAGES = int(os.environ.get('PDF_EARLY_EXIT_PAGES', '3'))
+
+class CoverLetterBracket:
+    """페이지 타입을 순서대로 받아 자소서 구간이 끝났는지 판단"""
+
+    def __init__(self, trailing_pages: Optional[int] = None):
+        self.trailing_pages = trailing_pages if trailing_pages is not None else TRAILING_PAGES
+        self.started = False
+        self.trailing = 0
+
+    def update(self, page_type: str) -> bool:
+        """페이지 하나 반영 → 구간이 확정되면 True"""
+        if page_type == 'cover_letter':
+            self.started = True
+            self.trailing = 0
+        elif page_type == 'mixed':
+            self.trailing = 0
+        elif self.started:
+            self.trailing += 1
+        return self.started and self.trailing >= self.trailing_pages
+
+def scan_pages(pages: Iterable, classify: Callable[[object], Dict], full_scan: bool = False,
+               trailing_pages: Optional[int] = None) -> Tuple[List, List[Dict], bool]:
+    """
+    페이지를 순서대로 분류하다 자소서 구간이 확정되면 중단
+
+    Args:
+        pages: 페이지 (생성기면 중단 이후 페이지는 만들어지지 않음)
+        classify: 페이지 → {'type': ..., ...}
+        full_scan: True면 끝까지 스캔
+        trailing_pages: 구간 확정에 필요한 연속 비자소서 페이지 수
+
+    Returns:
+        (스캔한 페이지 목록, 페이지별 분류 결과, 조기 종료 여부)
+    """
+    bracket = CoverLetterBracket(trailing_pages)
+    scanned = []
+    analyses = []
+    stopped = False
+
+    iterator = iter(pages)
+    for page in iterator:
+        analysis = classify(page)
+        scanned.append(page)
+        analyses.append(analysis)
+
+        if not full_scan and bracket.update(analysis['type']):
+            stopped = True
+            break
+
+    # 생성기가 열어 둔 PDF 등 정리
+    if stopped and hasattr(iterator, 'close'):
+        iterator.close()
+
+    return scanned, analyses, stopped
+
+def scan_summary(scanned_count: int, total_pages: Optional[int], stopped: bool,
+                 extracted_count: Optional[int] = None) -> Dict:
+    """
+    결과에 붙일 스캔 통계
+
+    Args:
+        scanned_count: 분류한 페이지 수
+        total_pages: 전체 페이지 수 (모르면 None)
+        stopped: 조기 종료 여부
+        extracted_count: 실제로 추출한 페이지 수 (여러 장씩 미리 추출한 경우, 없으면 scanned_count)
+    """
+    extracted = extracted_count if extracted_count is not None else scanned_count
+    summary = {
+        'pages_scanned': scanned_count,
+        'pages_skipped': max(total_pages - extracted, 0) if total_pages is not None else 0,
+        'early_exit': stopped
+    }
+    if total_pages is not None:
+        summary['total_pages'] = total_pages
+    return summary
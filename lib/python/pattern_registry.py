@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+페이지 분류용 정규식 레지스트리
+- 버킷(점수 구간)별 패턴 목록을 생성 시점에 한 번 컴파일 (re 모듈 내부 캐시에 의존하지 않음)
+- 패턴마다 컴파일된 search로 존재 여부만 확인 (첫 매칭에서 중단, 리터럴 접두어는 빠른 검색)
+  버킷 전체를 교대 패턴 하나로 합치면 sre가 접두어 검색을 못 해 페이지당 2~4배 느려서 합치지 않음
+  (benchmarks/page_classify_bench.py)
+
+예:
+  registry = PatternRegistry({'cover': [r'자\\s*기\\s*소\\s*개\\s*서'], 'resume': [r'이\\s*력\\s*서']},
+                             re.IGNORECASE, limits={'cover': 500})
+  registry.counts(text) → {'cover': 1, 'resume': 0}
+"""
+
+import re
+from typing import Dict, List, Optional, Set
+
+class PatternRegistry:
+    """버킷별 정규식 존재 여부 판정 (컴파일은 한 번)"""
+
+    def __init__(self, buckets: Dict[str, List[str]], flags: int = 0, limits: Optional[Dict[str, int]] = None):
+        """
+        Args:
+            buckets: {버킷: [패턴, ...]}
+            flags: 컴파일 플래그 (모든 패턴 공통)
+            limits: {버킷: 글자 수} - 해당 버킷은 text[:글자 수] 안에서만 검색 (슬라이스 복사 없이 endpos 사용)
+        """
+        self.buckets = {bucket: list(patterns) for bucket, patterns in buckets.items()}
+        self.limits = dict(limits or {})
+        self._compiled = {bucket: [re.compile(pattern, flags) for pattern in patterns]
+                          for bucket, patterns in self.buckets.items()}
+
+    def found(self, text: str) -> Dict[str, Set[int]]:
+        """버킷별로 텍스트에서 발견된 패턴 인덱스"""
+        found = {}
+        for bucket, compiled in self._compiled.items():
+            endpos = min(self.limits.get(bucket, len(text)), len(text))
+            found[bucket] = {index for index, pattern in enumerate(compiled) if pattern.search(text, 0, endpos)}
+        return found
+
+    def counts(self, text: str) -> Dict[str, int]:
+        """버킷별 발견된 패턴 수"""
+        return {bucket: len(indexes) for bucket, indexes in self.found(text).items()}
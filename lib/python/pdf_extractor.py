@@ -3,12 +3,21 @@
 """
 PDF에서 자소서 추출 정확도 향상을 위한 Python 모듈
 PyPDF2, pdfplumber 등 Python PDF 라이브러리 활용
+smart_split은 자소서 구간이 확정되면 나머지 페이지를 분류하지 않음 (page_scanner.py, --full-scan 으로 전체 분류)
 """
 
 import json
 import sys
 import re
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
+
+from instrumentation import attach_trace, span, tracing
+from page_scanner import TRAILING_PAGES, scan_pages, scan_summary
+from pattern_registry import PatternRegistry
+from section_splitter import split_sections
+
+# 섹션 제목으로 볼 줄 종류 (section_splitter.py)
+SECTION_HEADER_KINDS = ('numbered', 'qa', 'underlined', 'title_line')
 
 class PdfCoverLetterExtractor:
     """PDF에서 자소서 영역을 정확히 추출"""
@@ -41,35 +50,36 @@ class PdfCoverLetterExtractor:
             r'경\s*력\s*사\s*항',
             r'자\s*격\s*증'
         ]
+        
+        # 마커를 한 번만 컴파일
+        self.markers = PatternRegistry({
+            'cover_letter': self.cover_letter_markers,
+            'resume': self.resume_markers
+        }, re.IGNORECASE)
+        self.whitespace_pattern = re.compile(r'\s+')
+        self.first_person_pattern = re.compile(r'저는|제가|저의|나는|내가')
+        self.date_pattern = re.compile(r'\d{4}[년\.\-/]\d{1,2}')
     
     def analyze_page_type(self, text: str) -> Dict[str, any]:
         """페이지 타입 분석 (이력서/자소서/혼합)"""
         
         # 텍스트 정규화
-        normalized = re.sub(r'\s+', ' ', text)
+        normalized = self.whitespace_pattern.sub(' ', text)
         
-        # 점수 계산
-        cover_score = 0
-        resume_score = 0
-        
-        # 마커 체크
-        for pattern in self.cover_letter_markers:
-            if re.search(pattern, normalized, re.IGNORECASE):
-                cover_score += 2
-        
-        for pattern in self.resume_markers:
-            if re.search(pattern, normalized, re.IGNORECASE):
-                resume_score += 2
+        # 점수 계산 (마커당 2점)
+        found = self.markers.counts(normalized)
+        cover_score = found['cover_letter'] * 2
+        resume_score = found['resume'] * 2
         
         # 내용 기반 추가 분석
         # 자소서 특징: 긴 문단, 1인칭 표현
         if len(text) > 1000:
-            first_person_count = len(re.findall(r'저는|제가|저의|나는|내가', text))
+            first_person_count = len(self.first_person_pattern.findall(text))
             if first_person_count > 5:
                 cover_score += 3
         
         # 이력서 특징: 짧은 항목, 날짜, 표 형식
-        date_count = len(re.findall(r'\d{4}[년\.\-/]\d{1,2}', text))
+        date_count = len(self.date_pattern.findall(text))
         if date_count > 3:
             resume_score += 2
         
@@ -91,37 +101,27 @@ class PdfCoverLetterExtractor:
         }
     
     def extract_sections(self, text: str) -> List[Dict[str, str]]:
-        """자소서 섹션 추출"""
-        sections = []
-        
-        # 다양한 섹션 패턴
-        section_patterns = [
-            # 번호 + 제목
-            r'(\d+[\.\)]\s*)([가-힣\s]+)[\s\n]+([^0-9]{100,}?)(?=\d+[\.\)]|\Z)',
-            
-            # Q&A 형식
-            r'(Q\d+[\.:]\s*)([^\n]+)[\s\n]+([^Q]{100,}?)(?=Q\d+|\Z)',
-            
-            # 제목만
-            r'([가-힣]{2,10})\s*\n+([^가-힣\d]{100,}?)(?=[가-힣]{2,10}\s*\n|\Z)'
-        ]
-        
-        for pattern in section_patterns:
-            matches = re.finditer(pattern, text, re.MULTILINE | re.DOTALL)
-            for match in matches:
-                if len(match.groups()) >= 2:
-                    title = match.group(1) + (match.group(2) if len(match.groups()) > 2 else '')
-                    content = match.group(-1)
-                    
-                    sections.append({
-                        'title': title.strip(),
-                        'content': content.strip()[:500]  # 처음 500자만
-                    })
-        
-        return sections
+        """자소서 섹션 추출 (번호/Q&A/한글 제목 줄을 줄 단위로 찾아 오프셋으로 분리 - 선형 시간)"""
+        return [{
+            'title': section.title,
+            'content': text[section.start:min(section.end, section.start + 500)]  # 처음 500자만
+        } for section in split_sections(text, SECTION_HEADER_KINDS)]
     
-    def smart_split(self, pages: List[str]) -> Dict[str, any]:
-        """지능형 이력서/자소서 분리"""
+    def smart_split(self, pages: Iterable[str], full_scan: bool = False) -> Dict[str, any]:
+        """
+        지능형 이력서/자소서 분리
+        
+        Args:
+            pages: 페이지 텍스트 (생성기면 구간 확정 이후 페이지는 만들어지지 않음)
+            full_scan: True면 자소서 구간이 확정돼도 모든 페이지 분류
+        """
+        total_pages = len(pages) if hasattr(pages, '__len__') else None
+        with span('classify_pages') as scan:
+            pages, analyses, stopped = scan_pages(pages, self.analyze_page_type, full_scan)
+            scan.set(pages=len(pages), early_exit=stopped)
+        
+        # 조기 종료 시 마지막 비자소서 페이지들(구간 확정에 쓰인 페이지)은 자소서 구간 밖
+        bracket_end = len(pages) - TRAILING_PAGES if stopped else len(pages)
         
         resume_pages = []
         cover_letter_pages = []
@@ -130,10 +130,13 @@ class PdfCoverLetterExtractor:
         transition_point = None
         prev_type = None
         
-        for i, page_text in enumerate(pages):
-            analysis = self.analyze_page_type(page_text)
+        for i, analysis in enumerate(analyses):
             current_type = analysis['type']
             
+            if i >= bracket_end:
+                resume_pages.append(i)
+                continue
+            
             # 이력서 → 자소서 전환 감지
             if prev_type == 'resume' and current_type == 'cover_letter':
                 transition_point = i
@@ -160,7 +163,9 @@ class PdfCoverLetterExtractor:
         ]) if cover_letter_pages else ''
         
         # 섹션 추출
-        sections = self.extract_sections(cover_letter_text) if cover_letter_text else []
+        with span('extract_sections', chars=len(cover_letter_text)) as found:
+            sections = self.extract_sections(cover_letter_text) if cover_letter_text else []
+            found.set(sections=len(sections))
         
         return {
             'has_cover_letter': len(cover_letter_pages) > 0,
@@ -168,39 +173,79 @@ class PdfCoverLetterExtractor:
             'cover_letter_pages': cover_letter_pages,
             'cover_letter_text': cover_letter_text,
             'sections': sections,
-            'confidence': 85 if transition_point else 60
+            'confidence': 85 if transition_point else 60,
+            **scan_summary(len(pages), total_pages, stopped)
         }
 
+def handle_command(extractor, command, payload, full_scan=False):
+    """
+    커맨드 하나 처리 (단일 실행/JSONL 모드 공통)
+    
+    payload: analyze_page/extract_sections는 텍스트, smart_split은 페이지 텍스트 배열
+    full_scan: smart_split 조기 종료 끄기
+    """
+    if command == 'analyze_page':
+        return extractor.analyze_page_type(payload)
+    elif command == 'extract_sections':
+        return extractor.extract_sections(payload)
+    elif command == 'smart_split':
+        return extractor.smart_split(payload, full_scan=full_scan)
+    else:
+        raise ValueError(f'Unknown command: {command}')
+
+def run_jsonl(extractor, default_command, input_stream, output_stream, full_scan=False):
+    """
+    JSONL 스트리밍 모드: 한 줄당 결과 한 줄
+    
+    레코드 형식: {"command": ..., "text": "..."} 또는 {"command": "smart_split", "pages": [...], "full_scan": false}
+    "trace": true|"info"|"debug" 를 붙이면 그 줄 결과에 단계별 소요 시간('trace')을 함께 기록
+    """
+    for line in input_stream:
+        if not line.strip():
+            continue
+        
+        try:
+            record = json.loads(line)
+            if isinstance(record, list):
+                record = {'pages': record}
+            command = record.get('command', default_command)
+            payload = record['pages'] if command == 'smart_split' else record.get('text', '')
+            with tracing(record.get('trace')) as tracer:
+                with span(command):
+                    result = handle_command(extractor, command, payload, record.get('full_scan', full_scan))
+                attach_trace(result, tracer)
+        except Exception as e:
+            result = {'error': str(e)}
+        
+        output_stream.write(json.dumps(result, ensure_ascii=False) + '\n')
+        output_stream.flush()
+
 def main():
-    """CLI 인터페이스"""
-    if len(sys.argv) < 2:
+    """CLI 인터페이스 (--jsonl: 줄 단위 스트리밍, --full-scan: smart_split 조기 종료 끄기)"""
+    args = [arg for arg in sys.argv[1:] if arg not in ('--jsonl', '--full-scan')]
+    jsonl_mode = '--jsonl' in sys.argv[1:]
+    full_scan = '--full-scan' in sys.argv[1:]
+    
+    if not args and not jsonl_mode:
         print(json.dumps({'error': 'No command provided'}))
         sys.exit(1)
     
-    command = sys.argv[1]
+    command = args[0] if args else None
     extractor = PdfCoverLetterExtractor()
     
+    if jsonl_mode:
+        run_jsonl(extractor, command, sys.stdin, sys.stdout, full_scan)
+        return
+    
     try:
-        if command == 'analyze_page':
-            text = sys.stdin.read()
-            result = extractor.analyze_page_type(text)
-            print(json.dumps(result, ensure_ascii=False))
-            
-        elif command == 'extract_sections':
-            text = sys.stdin.read()
-            result = extractor.extract_sections(text)
-            print(json.dumps(result, ensure_ascii=False))
-            
-        elif command == 'smart_split':
+        if command == 'smart_split':
             # JSON 배열로 페이지들 받기
-            pages_json = sys.stdin.read()
-            pages = json.loads(pages_json)
-            result = extractor.smart_split(pages)
-            print(json.dumps(result, ensure_ascii=False))
-            
+            payload = json.loads(sys.stdin.read())
         else:
-            print(json.dumps({'error': f'Unknown command: {command}'}))
-            sys.exit(1)
+            payload = sys.stdin.read()
+        
+        result = handle_command(extractor, command, payload, full_scan)
+        print(json.dumps(result, ensure_ascii=False))
             
     except Exception as e:
         print(json.dumps({'error': str(e)}))
@@ -2,12 +2,29 @@
 # -*- coding: utf-8 -*-
 """
 향상된 PDF 자소서 추출기 - 전문 라이브러리 활용
+- pdfplumber 추출은 페이지 범위를 프로세스 풀에 나눠 병렬 처리 (워커마다 PDF를 따로 열고 페이지 순서대로 합침)
+- PDF_EXTRACT_WORKERS 환경변수 또는 --workers 로 워커 수 지정 (1: 순차 처리)
+- PARALLEL_MIN_PAGES 미만의 작은 파일은 프로세스 생성 비용이 더 커서 순차 처리
+- tiered (PyMuPDF + pdfplumber 모두 설치 시 기본): 1단계로 모든 페이지를 PyMuPDF 텍스트만으로 분류하고,
+  판별이 애매한 페이지(mixed/unknown)만 2단계 pdfplumber 표/글꼴 분석으로 다시 분류
+  결과의 page_tiers 에 페이지별 분류 단계 기록 (text: 1단계, layout: 2단계)
+- 페이지는 생성기로 하나씩 추출/분류하고 자소서 구간이 확정되면 나머지는 추출하지 않음 (page_scanner.py)
+  결과의 pages_skipped 에 건너뛴 페이지 수 기록, --full-scan 이면 모든 페이지 추출
+- 메모리 제한 모드 (--memory-limit MB 또는 PDF_MEMORY_LIMIT_MB): 페이지 텍스트는 분류 직후 스풀 임시 파일로 옮기고
+  오프셋만 유지 (제한을 넘으면 디스크로), 섹션은 full_content 대신 cover_letter_text 안의 오프셋(start/end)만 반환
+- 같은 PDF를 다시 올리면 내용 해시로 페이지별 추출/분류 결과를 캐시에서 읽음 (extraction_cache.py, --no-cache 로 끄기)
+  페이지 텍스트를 디스크에 남기므로 PDF_EXTRACTION_CACHE_PATH/PDF_EXTRACTION_CACHE_TTL_DAYS 를 지정해야 켜짐
 """
 
 import json
+import os
 import sys
 import re
 import base64
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Dict, List, Tuple, Optional
 from pathlib import Path
 
@@ -38,19 +55,148 @@ except ImportError:
     PYMUPDF_AVAILABLE = False
     print("Warning: PyMuPDF not installed", file=sys.stderr)
 
-# 한글 처리 (선택)
-try:
-    from kiwipiepy import Kiwi
-    kiwi = Kiwi()
-    KIWI_AVAILABLE = True
-except ImportError:
-    KIWI_AVAILABLE = False
+# 한글 처리 (선택) - 설치 여부만 확인하고 모델은 로드하지 않음
+from instrumentation import attach_trace, span, tracing
+from kiwi_model import kiwi_available
+from page_scanner import scan_pages, scan_summary
+from extraction_cache import content_hash, open_cache
+from pattern_registry import PatternRegistry
+from section_splitter import keyword_section, split_sections, strip_span
+
+KIWI_AVAILABLE = kiwi_available()
+
+# 추출 방법 (--method 로 지정 가능)
+EXTRACTION_METHODS = ['tiered', 'pdfplumber', 'pymupdf', 'pypdf2']
+
+# 텍스트만으로 판별이 애매해 표/글꼴 분석(2단계)이 필요한 페이지 타입
+AMBIGUOUS_PAGE_TYPES = ('mixed', 'unknown')
+
+# 페이지 데이터에서 계산되는 결과 필드 (캐시에는 페이지만 저장하고 이 필드들은 다시 계산)
+ANALYZED_FIELDS = ('has_resume', 'has_cover_letter', 'resume_pages', 'cover_letter_pages', 'cover_letter_text',
+                   'cover_letter_sections', 'extraction_method', 'confidence', 'memory_bounded')
+
+# 병렬 추출을 시작할 최소 페이지 수
+PARALLEL_MIN_PAGES = int(os.environ.get('PDF_PARALLEL_MIN_PAGES', '8'))
+
+def _default_workers() -> int:
+    """기본 워커 수 (PDF_EXTRACT_WORKERS, 없으면 CPU 수)"""
+    return max(1, int(os.environ.get('PDF_EXTRACT_WORKERS', '0')) or os.cpu_count() or 1)
+
+def _pdfplumber_page_data(page, page_num: int) -> Dict:
+    """pdfplumber 페이지 하나의 텍스트/레이아웃 정보"""
+    # 텍스트 추출
+    text = page.extract_text() or ''
+    
+    # 테이블 추출 (이력서 판별용)
+    tables = page.extract_tables()
+    has_tables = len(tables) > 0 if tables else False
+    
+    # 레이아웃 분석
+    chars = page.chars if hasattr(page, 'chars') else []
+    avg_font_size = sum(c.get('size', 12) for c in chars) / len(chars) if chars else 12
+    
+    # 문자/레이아웃 객체 캐시 해제 (페이지가 많아도 메모리가 쌓이지 않도록)
+    del chars
+    page.flush_cache()
+    
+    return {
+        'page_num': page_num,
+        'text': text,
+        'has_tables': has_tables,
+        'avg_font_size': avg_font_size,
+        'char_count': len(text)
+    }
+
+def _pymupdf_page_data(page, page_num: int) -> Dict:
+    """PyMuPDF 페이지 하나의 텍스트/이미지/링크 정보"""
+    # 텍스트 추출
+    text = page.get_text()
+    
+    # 이미지 개수 (이력서는 보통 증명사진 포함)
+    image_list = page.get_images()
+    has_images = len(image_list) > 0
+    
+    # 링크 추출 (포트폴리오 링크 등)
+    links = page.get_links()
+    has_links = len(links) > 0
+    
+    return {
+        'page_num': page_num,
+        'text': text,
+        'has_images': has_images,
+        'has_links': has_links,
+        'char_count': len(text)
+    }
+
+def _default_memory_limit() -> Optional[int]:
+    """기본 메모리 제한 (PDF_MEMORY_LIMIT_MB, 없으면 제한 없음)"""
+    limit_mb = os.environ.get('PDF_MEMORY_LIMIT_MB')
+    return int(float(limit_mb) * 1024 * 1024) if limit_mb else None
+
+class PageTextStore:
+    """페이지 텍스트 보관소 - 스풀 임시 파일에 이어 쓰고 (오프셋, 길이)로 다시 읽음"""
+    
+    def __init__(self, memory_limit: int):
+        """
+        Args:
+            memory_limit: 메모리에 둘 최대 바이트 (넘으면 디스크 임시 파일로 전환)
+        """
+        self.memory_limit = memory_limit
+        self.size = 0
+        self._file = tempfile.SpooledTemporaryFile(max_size=memory_limit)
+    
+    def put(self, text: str) -> Tuple[int, int]:
+        data = text.encode('utf-8')
+        offset = self.size
+        self._file.seek(offset)
+        self._file.write(data)
+        self.size += len(data)
+        return offset, len(data)
+    
+    def get(self, ref: Tuple[int, int]) -> str:
+        offset, length = ref
+        self._file.seek(offset)
+        return self._file.read(length).decode('utf-8')
+    
+    def close(self):
+        self._file.close()
+
+def _pdfplumber_pages(pdf_path: str, page_indexes: List[int]) -> List[Dict]:
+    """지정한 페이지들 추출 (0부터 시작하는 인덱스, 워커 프로세스에서는 PDF를 따로 열어 실행)"""
+    with pdfplumber.open(pdf_path) as pdf:
+        return [_pdfplumber_page_data(pdf.pages[i], i + 1) for i in page_indexes]
+
+def _split_pages(page_indexes: List[int], workers: int) -> List[List[int]]:
+    """페이지를 연속된 묶음으로 분할 (워커당 2개 - 페이지별 처리 시간 차이 흡수)"""
+    chunks = min(len(page_indexes), workers * 2)
+    bounds = [len(page_indexes) * k // chunks for k in range(chunks + 1)]
+    return [page_indexes[bounds[k]:bounds[k + 1]] for k in range(chunks)]
 
 class EnhancedPdfExtractor:
     """고급 PDF 자소서 추출기"""
     
-    def __init__(self):
-        self.extraction_method = self._select_best_method()
+    def __init__(self, workers: Optional[int] = None, method: Optional[str] = None,
+                 memory_limit: Optional[int] = None, use_cache: bool = True):
+        """
+        Args:
+            workers: 페이지 병렬 추출 워커 수 (None: PDF_EXTRACT_WORKERS 또는 CPU 수, 1: 순차)
+            method: 추출 방법 (None: 사용 가능한 최선의 방법, EXTRACTION_METHODS 중 하나)
+            memory_limit: 페이지 텍스트를 메모리에 둘 최대 바이트 (None: PDF_MEMORY_LIMIT_MB, 없으면 제한 없음)
+            use_cache: PDF 내용 해시 기반 추출 캐시 사용 여부
+        """
+        if method is not None and method not in EXTRACTION_METHODS:
+            raise ValueError(f"Unknown extraction method: {method} (available: {', '.join(EXTRACTION_METHODS)})")
+        self.extraction_method = method or self._select_best_method()
+        self.workers = workers if workers is not None else _default_workers()
+        self.memory_limit = memory_limit if memory_limit is not None else _default_memory_limit()
+        
+        self.use_cache = use_cache
+        
+        # 메모리 제한 모드에서 추출 중인 문서의 페이지 텍스트 보관소
+        self._text_store = None
+        
+        # 마지막으로 분석한 (페이지 데이터, 분류 결과) - 캐시 저장용
+        self._analyzed = None
         
         # 자소서 판별 패턴 (우선순위)
         self.strong_indicators = [
@@ -93,10 +239,22 @@ class EnhancedPdfExtractor:
             r'Experience',
             r'Skills'
         ]
+        
+        # 점수 구간별 패턴을 한 번만 컴파일
+        # strong/resume 패턴에는 ^ $ 가 없어 MULTILINE 을 함께 써도 결과 동일
+        self.patterns = PatternRegistry({
+            'strong': self.strong_indicators,
+            'section': self.section_patterns,
+            'resume': self.resume_indicators
+        }, re.IGNORECASE | re.MULTILINE, limits={'strong': 500})  # 강력한 지표는 상단 500자만
+        self.first_person_pattern = re.compile(r'저는|제가|저의|저에게|제게')
+        self.date_pattern = re.compile(r'\d{4}[\.\-년]\s*\d{1,2}')
     
     def _select_best_method(self):
         """사용 가능한 최선의 추출 방법 선택"""
-        if PDFPLUMBER_AVAILABLE:
+        if PDFPLUMBER_AVAILABLE and PYMUPDF_AVAILABLE:
+            return 'tiered'
+        elif PDFPLUMBER_AVAILABLE:
             return 'pdfplumber'
         elif PYMUPDF_AVAILABLE:
             return 'pymupdf'
@@ -105,108 +263,273 @@ class EnhancedPdfExtractor:
         else:
             return 'fallback'
     
-    def extract_from_file(self, pdf_path: str) -> Dict:
-        """PDF 파일에서 텍스트 추출"""
+    def extract_from_file(self, pdf_path: str, full_scan: bool = False) -> Dict:
+        """
+        PDF 파일에서 텍스트 추출
+        
+        Args:
+            pdf_path: PDF 경로
+            full_scan: True면 자소서 구간이 확정돼도 모든 페이지 추출 (기본은 구간 확정 시 조기 종료)
+        """
         if not Path(pdf_path).exists():
             return {'error': f'File not found: {pdf_path}'}
         
-        if self.extraction_method == 'pdfplumber':
-            return self._extract_with_pdfplumber(pdf_path)
+        cache = open_cache() if self.use_cache else None
+        if self.memory_limit is not None:
+            self._text_store = PageTextStore(self.memory_limit)
+        
+        try:
+            result = None
+            if cache is not None:
+                try:
+                    with span('cache_lookup') as lookup:
+                        key = cache.key(content_hash(pdf_path), self.extraction_method, full_scan)
+                        meta = cache.lookup(key)
+                        lookup.set(hit=meta is not None)
+                    if meta is not None:
+                        result = self._result_from_cache(cache, key, meta)
+                except Exception as e:
+                    # 캐시 조회 실패(잠김/손상 등)는 캐시 없이 추출
+                    print(f"Warning: extraction cache lookup failed ({e})", file=sys.stderr)
+                    result = None
+                    cache.close()
+                    cache = None
+                    if self._text_store is not None:
+                        self._text_store.close()
+                        self._text_store = PageTextStore(self.memory_limit)
+            
+            if result is None:
+                self._analyzed = None
+                with span('extract', method=self.extraction_method) as extract:
+                    result = self._extract(pdf_path, full_scan)
+                    extract.set(pages=result.get('pages_scanned', result.get('total_pages')))
+                if cache is not None and 'error' not in result and self._analyzed is not None:
+                    self._store_in_cache(cache, key, result)
+                result['cache_hit'] = False
+            
+            if self._text_store is not None and 'error' not in result:
+                result['memory_bounded'] = {
+                    'limit_bytes': self.memory_limit,
+                    'spooled_bytes': self._text_store.size,
+                    'spilled_to_disk': self._text_store.size > self.memory_limit
+                }
+            return result
+        finally:
+            self._analyzed = None
+            if self._text_store is not None:
+                self._text_store.close()
+                self._text_store = None
+            if cache is not None:
+                cache.close()
+    
+    def _result_from_cache(self, cache, key: str, meta: Dict) -> Dict:
+        """캐시된 페이지로 결과 재구성 (섹션/신뢰도는 다시 계산)"""
+        pages_data = []
+        page_types = []
+        for page, page_type in cache.iter_pages(key):
+            if self._text_store is not None:
+                page['text_ref'] = self._text_store.put(page.pop('text'))
+            pages_data.append(page)
+            page_types.append(page_type)
+        
+        result = self._analyze_pages(pages_data, page_types)
+        result.update(meta)
+        result['cache_hit'] = True
+        return result
+    
+    def _store_in_cache(self, cache, key: str, result: Dict):
+        """페이지 데이터/분류 결과 저장 (메모리 제한 모드에서도 한 장씩 텍스트를 읽어 기록)"""
+        pages_data, page_types = self._analyzed
+        meta = {field: value for field, value in result.items() if field not in ANALYZED_FIELDS}
+        
+        def pages():
+            for page, page_type in zip(pages_data, page_types):
+                if 'text_ref' in page:
+                    text = self._page_text(page)
+                    page = {field: value for field, value in page.items() if field != 'text_ref'}
+                    page['text'] = text
+                yield page, page_type
+        
+        try:
+            cache.store(key, meta, pages())
+        except Exception as e:
+            # 캐시 저장 실패는 추출 결과에 영향 없음
+            print(f"Warning: extraction cache store failed ({e})", file=sys.stderr)
+    
+    def _extract(self, pdf_path: str, full_scan: bool) -> Dict:
+        """추출 방법별 실행"""
+        if self.extraction_method == 'tiered':
+            return self._extract_tiered(pdf_path, full_scan)
+        elif self.extraction_method == 'pdfplumber':
+            return self._extract_with_pdfplumber(pdf_path, full_scan)
         elif self.extraction_method == 'pymupdf':
-            return self._extract_with_pymupdf(pdf_path)
+            return self._extract_with_pymupdf(pdf_path, full_scan)
         elif self.extraction_method == 'pypdf2':
-            return self._extract_with_pypdf2(pdf_path)
+            return self._extract_with_pypdf2(pdf_path, full_scan)
         else:
             return {'error': 'No PDF library available'}
     
-    def _extract_with_pdfplumber(self, pdf_path: str) -> Dict:
-        """pdfplumber로 추출 (가장 정확)"""
-        pages_data = []
-        
+    def _extract_tiered(self, pdf_path: str, full_scan: bool = False) -> Dict:
+        """단계별 추출 (PyMuPDF 텍스트로 분류 → 애매한 페이지만 pdfplumber 표/글꼴 분석)"""
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for i, page in enumerate(pdf.pages):
-                    # 텍스트 추출
-                    text = page.extract_text() or ''
-                    
-                    # 테이블 추출 (이력서 판별용)
-                    tables = page.extract_tables()
-                    has_tables = len(tables) > 0 if tables else False
-                    
-                    # 레이아웃 분석
-                    chars = page.chars if hasattr(page, 'chars') else []
-                    avg_font_size = sum(c.get('size', 12) for c in chars) / len(chars) if chars else 12
-                    
-                    pages_data.append({
+            started = time.perf_counter()
+            
+            # 1단계: 텍스트만 빠르게 추출해 분류 (자소서 구간이 확정되면 중단)
+            with span('tier', tier='text') as tier:
+                pdf = fitz.open(pdf_path)
+                total_pages = len(pdf)
+                pages_data, page_types, stopped = scan_pages(
+                    ({
                         'page_num': i + 1,
                         'text': text,
-                        'has_tables': has_tables,
-                        'avg_font_size': avg_font_size,
-                        'char_count': len(text)
-                    })
+                        'char_count': len(text),
+                        'tier': 'text'
+                    } for i, text in enumerate(page.get_text() for page in pdf)),
+                    lambda page: self._classify_and_store(page, discard_types=AMBIGUOUS_PAGE_TYPES), full_scan
+                )
+                pdf.close()
+                tier.set(pages=len(pages_data), early_exit=stopped)
+            text_seconds = time.perf_counter() - started
+            
+            # 2단계: 애매한 페이지만 표/글꼴 분석 후 다시 분류
+            # (메모리 제한 모드는 일정 페이지씩 추출해 분류하자마자 보관소로 옮김)
+            ambiguous = [i for i, page_type in enumerate(page_types) if page_type['type'] in AMBIGUOUS_PAGE_TYPES]
+            workers = 0
+            if ambiguous:
+                with span('tier', tier='layout', pages=len(ambiguous)) as tier:
+                    window = len(ambiguous) if self._text_store is None else max(PARALLEL_MIN_PAGES, self.workers * 2)
+                    stats = {'workers': 1, 'extracted': 0}
+                    layout_pages = self._iter_pdfplumber_pages(pdf_path, ambiguous, window, stats)
+                    for i, page in zip(ambiguous, layout_pages):
+                        page['tier'] = 'layout'
+                        pages_data[i] = page
+                        page_types[i] = self._classify_and_store(page)
+                    workers = stats['workers']
+                    tier.set(workers=workers)
+            
+            result = self._analyze_pages(pages_data, page_types)
+            result.update(scan_summary(len(pages_data), total_pages, stopped))
+            result['extraction_workers'] = workers
+            result['page_tiers'] = [page['tier'] for page in pages_data]
+            result['tier_counts'] = {
+                'text': len(pages_data) - len(ambiguous),
+                'layout': len(ambiguous)
+            }
+            result['tier_seconds'] = {
+                'text': round(text_seconds, 4),
+                'layout': round(time.perf_counter() - started - text_seconds, 4)
+            }
+            return result
+            
+        except Exception as e:
+            return {'error': f'tiered extraction failed: {str(e)}'}
+    
+    def _extract_with_pdfplumber(self, pdf_path: str, full_scan: bool = False) -> Dict:
+        """pdfplumber로 추출 (가장 정확)"""
+        try:
+            with pdfplumber.open(pdf_path) as pdf:
+                total_pages = len(pdf.pages)
             
-            return self._analyze_pages(pages_data)
+            # 전체 스캔은 한 번에, 조기 종료/메모리 제한 모드는 일정 페이지씩 (병렬) 추출하며 분류
+            if full_scan and self._text_store is None:
+                window = total_pages
+            else:
+                window = max(PARALLEL_MIN_PAGES, self.workers * 2)
+            stats = {'workers': 1, 'extracted': 0}
+            pages_data, page_types, stopped = scan_pages(
+                self._iter_pdfplumber_pages(pdf_path, list(range(total_pages)), window, stats),
+                self._classify_and_store, full_scan
+            )
+            
+            result = self._analyze_pages(pages_data, page_types)
+            result.update(scan_summary(len(pages_data), total_pages, stopped, stats['extracted']))
+            result['extraction_workers'] = stats['workers']
+            return result
             
         except Exception as e:
             return {'error': f'pdfplumber extraction failed: {str(e)}'}
     
-    def _extract_with_pymupdf(self, pdf_path: str) -> Dict:
-        """PyMuPDF로 추출 (빠름)"""
-        pages_data = []
+    def _iter_pdfplumber_pages(self, pdf_path: str, page_indexes: List[int], window: int, stats: Dict):
+        """pdfplumber 페이지를 window 장씩 추출해 하나씩 반환 (stats에 워커 수/추출 페이지 수 기록)"""
+        for start in range(0, len(page_indexes), window):
+            pages_data, workers = self._extract_pdfplumber_pages(pdf_path, page_indexes[start:start + window])
+            stats['workers'] = max(stats['workers'], workers)
+            stats['extracted'] += len(pages_data)
+            yield from pages_data
+    
+    def _extract_pdfplumber_pages(self, pdf_path: str, page_indexes: List[int]) -> Tuple[List[Dict], int]:
+        """pdfplumber 페이지 추출 (페이지가 많으면 병렬) → (페이지 데이터, 사용한 워커 수)"""
+        workers = min(self.workers, len(page_indexes))
+        if workers > 1 and len(page_indexes) >= PARALLEL_MIN_PAGES:
+            pages_data = self._extract_pdfplumber_parallel(pdf_path, page_indexes, workers)
+            if pages_data is not None:
+                return pages_data, workers
+        
+        # 작은 파일은 순차 처리
+        return _pdfplumber_pages(pdf_path, page_indexes), 1
+    
+    def _extract_pdfplumber_parallel(self, pdf_path: str, page_indexes: List[int], workers: int) -> Optional[List[Dict]]:
+        """페이지 묶음별 병렬 추출 (페이지 순서 유지, 프로세스 풀을 쓸 수 없으면 None)"""
+        chunks = _split_pages(page_indexes, workers)
         
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(_pdfplumber_pages, [pdf_path] * len(chunks), chunks)
+                return [page for chunk in results for page in chunk]
+        except (OSError, BrokenProcessPool) as e:
+            # 프로세스를 만들 수 없는 환경 (rlimit, 샌드박스 등) → 순차 처리
+            print(f"Warning: parallel extraction unavailable ({e}), falling back to sequential", file=sys.stderr)
+            return None
+    
+    def _extract_with_pymupdf(self, pdf_path: str, full_scan: bool = False) -> Dict:
+        """PyMuPDF로 추출 (빠름)"""
         try:
             pdf = fitz.open(pdf_path)
-            
-            for i, page in enumerate(pdf):
-                # 텍스트 추출
-                text = page.get_text()
-                
-                # 이미지 개수 (이력서는 보통 증명사진 포함)
-                image_list = page.get_images()
-                has_images = len(image_list) > 0
-                
-                # 링크 추출 (포트폴리오 링크 등)
-                links = page.get_links()
-                has_links = len(links) > 0
-                
-                pages_data.append({
-                    'page_num': i + 1,
-                    'text': text,
-                    'has_images': has_images,
-                    'has_links': has_links,
-                    'char_count': len(text)
-                })
-            
+            total_pages = len(pdf)
+            pages_data, page_types, stopped = scan_pages(
+                (_pymupdf_page_data(page, i + 1) for i, page in enumerate(pdf)),
+                self._classify_and_store, full_scan
+            )
             pdf.close()
-            return self._analyze_pages(pages_data)
+            
+            result = self._analyze_pages(pages_data, page_types)
+            result.update(scan_summary(len(pages_data), total_pages, stopped))
+            return result
             
         except Exception as e:
             return {'error': f'PyMuPDF extraction failed: {str(e)}'}
     
-    def _extract_with_pypdf2(self, pdf_path: str) -> Dict:
+    def _extract_with_pypdf2(self, pdf_path: str, full_scan: bool = False) -> Dict:
         """PyPDF2로 추출 (기본)"""
-        pages_data = []
-        
         try:
             with open(pdf_path, 'rb') as file:
                 pdf = PyPDF2.PdfReader(file)
+                total_pages = len(pdf.pages)
                 
-                for i, page in enumerate(pdf.pages):
-                    text = page.extract_text()
-                    
-                    pages_data.append({
+                pages_data, page_types, stopped = scan_pages(
+                    ({
                         'page_num': i + 1,
                         'text': text,
                         'char_count': len(text)
-                    })
+                    } for i, text in enumerate(page.extract_text() for page in pdf.pages)),
+                    self._classify_and_store, full_scan
+                )
             
-            return self._analyze_pages(pages_data)
+            result = self._analyze_pages(pages_data, page_types)
+            result.update(scan_summary(len(pages_data), total_pages, stopped))
+            return result
             
         except Exception as e:
             return {'error': f'PyPDF2 extraction failed: {str(e)}'}
     
-    def _analyze_pages(self, pages_data: List[Dict]) -> Dict:
-        """페이지 분석 및 자소서 추출"""
+    def _analyze_pages(self, pages_data: List[Dict], page_types: Optional[List[Dict]] = None) -> Dict:
+        """
+        페이지 분석 및 자소서 추출
+        
+        Args:
+            pages_data: 페이지별 추출 데이터
+            page_types: 이미 계산한 페이지 분류 (없으면 여기서 분류)
+        """
         result = {
             'total_pages': len(pages_data),
             'has_resume': False,
@@ -220,11 +543,11 @@ class EnhancedPdfExtractor:
         }
         
         # 각 페이지 타입 판별
-        page_types = []
-        for page in pages_data:
-            page_type = self._classify_page(page)
-            page_types.append(page_type)
-            
+        if page_types is None:
+            page_types = [self._classify_page(page) for page in pages_data]
+        self._analyzed = (pages_data, page_types)
+        
+        for page, page_type in zip(pages_data, page_types):
             if page_type['type'] == 'resume':
                 result['resume_pages'].append(page['page_num'])
                 result['has_resume'] = True
@@ -234,54 +557,62 @@ class EnhancedPdfExtractor:
         
         # 자소서 텍스트 합치기
         if result['cover_letter_pages']:
-            cover_texts = []
-            for page in pages_data:
-                if page['page_num'] in result['cover_letter_pages']:
-                    cover_texts.append(page['text'])
-            
-            result['cover_letter_text'] = '\n\n'.join(cover_texts)
+            cover_pages = set(result['cover_letter_pages'])
+            result['cover_letter_text'] = '\n\n'.join(
+                self._page_text(page) for page in pages_data if page['page_num'] in cover_pages
+            )
             
-            # 섹션 추출
-            result['cover_letter_sections'] = self._extract_sections(result['cover_letter_text'])
+            # 섹션 추출 (메모리 제한 모드는 섹션 본문을 따로 복사하지 않음)
+            with span('extract_sections', chars=len(result['cover_letter_text'])) as found:
+                result['cover_letter_sections'] = self._extract_sections(result['cover_letter_text'],
+                                                                         keep_full_content=self._text_store is None)
+                found.set(sections=len(result['cover_letter_sections']))
         
         # 신뢰도 계산
         result['confidence'] = self._calculate_confidence(page_types)
         
         return result
     
+    def _classify_and_store(self, page_data: Dict, discard_types: Tuple[str, ...] = ()) -> Dict:
+        """
+        페이지 분류 (메모리 제한 모드면 분류 후 텍스트를 보관소로 옮기고 오프셋만 남김)
+        
+        Args:
+            page_data: 페이지 데이터 (이미 보관소에 있는 페이지는 다시 넣지 않음)
+            discard_types: 보관하지 않고 버릴 페이지 타입 (단계별 추출에서 다시 추출할 애매한 페이지)
+        """
+        page_type = self._classify_page(page_data)
+        if self._text_store is not None and 'text' in page_data:
+            text = page_data.pop('text')
+            if page_type['type'] not in discard_types:
+                page_data['text_ref'] = self._text_store.put(text)
+        return page_type
+    
+    def _page_text(self, page_data: Dict) -> str:
+        """페이지 텍스트 (보관소로 옮겨졌으면 다시 읽음)"""
+        if 'text' in page_data:
+            return page_data['text']
+        return self._text_store.get(page_data['text_ref'])
+    
     def _classify_page(self, page_data: Dict) -> Dict:
         """페이지 타입 분류"""
         text = page_data['text']
         
-        # 점수 계산
-        cover_score = 0
-        resume_score = 0
-        
-        # 강력한 지표 체크
-        for pattern in self.strong_indicators:
-            if re.search(pattern, text[:500], re.IGNORECASE):  # 상단 500자만
-                cover_score += 10
-        
-        # 섹션 패턴 체크
-        for pattern in self.section_patterns:
-            if re.search(pattern, text, re.IGNORECASE | re.MULTILINE):
-                cover_score += 2
-        
-        # 이력서 지표 체크
-        for pattern in self.resume_indicators:
-            if re.search(pattern, text, re.IGNORECASE):
-                resume_score += 3
+        # 점수 계산 (강력한 지표 10점, 섹션 패턴 2점, 이력서 지표 3점 - 패턴당 한 번)
+        found = self.patterns.counts(text)
+        cover_score = found['strong'] * 10 + found['section'] * 2
+        resume_score = found['resume'] * 3
         
         # 추가 분석
         # 1인칭 표현 (자소서 특징)
-        first_person = len(re.findall(r'저는|제가|저의|저에게|제게', text))
+        first_person = len(self.first_person_pattern.findall(text))
         if first_person > 5:
             cover_score += 5
         elif first_person > 2:
             cover_score += 2
         
         # 날짜 패턴 (이력서 특징)
-        dates = len(re.findall(r'\d{4}[\.\-년]\s*\d{1,2}', text))
+        dates = len(self.date_pattern.findall(text))
         if dates > 3:
             resume_score += 3
         
@@ -316,64 +647,58 @@ class EnhancedPdfExtractor:
             'page_num': page_data['page_num']
         }
     
-    def _extract_sections(self, text: str) -> List[Dict]:
-        """자소서 섹션 추출"""
+    def _extract_sections(self, text: str, keep_full_content: bool = True) -> List[Dict]:
+        """
+        자소서 섹션 추출 (번호/Q&A/대괄호/밑줄 제목을 줄 단위로 찾아 오프셋으로 분리 - 선형 시간)
+        
+        Args:
+            text: 자소서 텍스트
+            keep_full_content: False면 full_content 대신 text 안의 본문 오프셋(start/end)만 반환
+        """
         sections = []
-        
-        # 다양한 섹션 패턴으로 시도
-        patterns = [
-            # 1. 번호 + 제목
-            r'(\d+)[\.\)]\s*([가-힣\s]+?)[\s\n]+([^\d]{100,}?)(?=\d+[\.\)]|\Z)',
-            
-            # 2. Q&A 형식
-            r'(Q\d+)[\.:]\s*([^\n]+?)[\s\n]+([^Q]{100,}?)(?=Q\d+|\Z)',
-            
-            # 3. 대괄호 제목
-            r'\[([^\]]+)\]\s*\n+([^\[]{100,}?)(?=\[|\Z)',
-            
-            # 4. 굵은 제목
-            r'^([가-힣]{2,10})\s*\n[-=]+\n+([^\n]{100,}?)(?=^[가-힣]{2,10}\s*\n[-=]|\Z)'
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, text, re.MULTILINE | re.DOTALL)
-            for match in matches:
-                groups = match.groups()
-                if len(groups) >= 2:
-                    title = groups[0] if len(groups) == 2 else f"{groups[0]}. {groups[1]}"
-                    content = groups[-1]
-                    
-                    # 중복 체크
-                    if not any(s['title'] == title for s in sections):
-                        sections.append({
-                            'title': title.strip(),
-                            'content': content.strip()[:1000],  # 처음 1000자
-                            'full_content': content.strip()
-                        })
+        titles = set()
+        for section in split_sections(text):
+            # 중복 체크
+            if section.title not in titles:
+                titles.add(section.title)
+                sections.append(self._section_entry(section.title, text, (section.start, section.end),
+                                                    keep_full_content))
         
         # 섹션이 없으면 키워드 기반 분리
         if not sections and len(text) > 500:
-            sections = self._keyword_based_extraction(text)
+            sections = self._keyword_based_extraction(text, keep_full_content)
         
         return sections
     
-    def _keyword_based_extraction(self, text: str) -> List[Dict]:
+    def _keyword_based_extraction(self, text: str, keep_full_content: bool = True) -> List[Dict]:
         """키워드 기반 섹션 추출"""
         sections = []
         keywords = ['지원동기', '성장과정', '성격', '장점', '단점', '협업', '입사후']
         
         for keyword in keywords:
-            pattern = rf'({keyword}[^\n]*)\n+([^가-힣]*(?:[가-힣][^가-힣]*){20,})'
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                sections.append({
-                    'title': match.group(1).strip(),
-                    'content': match.group(2).strip()[:1000],
-                    'full_content': match.group(2).strip()
-                })
+            found = keyword_section(text, keyword)
+            if found:
+                title, start, end = found
+                sections.append(self._section_entry(title, text, (start, end), keep_full_content))
         
         return sections
     
+    @staticmethod
+    def _section_entry(title: str, text: str, span: Tuple[int, int], keep_full_content: bool) -> Dict:
+        """섹션 항목 (본문은 앞뒤 공백 제외, content는 처음 1000자)"""
+        start, end = strip_span(text, *span)
+        
+        section = {
+            'title': title.strip(),
+            'content': text[start:min(end, start + 1000)]  # 처음 1000자
+        }
+        if keep_full_content:
+            section['full_content'] = text[start:end]
+        else:
+            section['start'] = start
+            section['end'] = end
+        return section
+    
     def _calculate_confidence(self, page_types: List[Dict]) -> float:
         """추출 신뢰도 계산"""
         if not page_types:
@@ -394,34 +719,86 @@ class EnhancedPdfExtractor:
             avg_confidence = sum(max(p['cover_score'], p['resume_score']) for p in page_types) / len(page_types)
             return min(avg_confidence * 5, 70)
 
+def _cache_info(use_cache: bool) -> Dict:
+    """추출 캐시 크기/적중률 (info 커맨드용)"""
+    cache = open_cache() if use_cache else None
+    if cache is None:
+        return {'enabled': False}
+    try:
+        return cache.stats()
+    finally:
+        cache.close()
+
+def _pop_option(args: List[str], name: str) -> Optional[str]:
+    """args에서 '--name 값' 옵션을 꺼냄 (없으면 None)"""
+    if name not in args:
+        return None
+    
+    index = args.index(name)
+    if index + 1 >= len(args):
+        print(json.dumps({'error': f'{name} requires a value'}))
+        sys.exit(1)
+    value = args[index + 1]
+    del args[index:index + 2]
+    return value
+
 def main():
     """CLI 인터페이스"""
     if len(sys.argv) < 2:
-        print(json.dumps({'error': 'Usage: python pdf_extractor_enhanced.py <command> [pdf_path]'}))
+        print(json.dumps({'error': 'Usage: python pdf_extractor_enhanced.py <command> [pdf_path] '
+                                   '[--workers N] [--method tiered|pdfplumber|pymupdf|pypdf2] [--full-scan] '
+                                   '[--memory-limit MB] [--no-cache] [--trace info|debug]'}))
+        sys.exit(1)
+    
+    args = sys.argv[1:]
+    workers = _pop_option(args, '--workers')
+    if workers is not None and not workers.isdigit():
+        print(json.dumps({'error': '--workers requires a number'}))
         sys.exit(1)
+    method = _pop_option(args, '--method')
+    memory_limit = _pop_option(args, '--memory-limit')
+    trace = _pop_option(args, '--trace')
+    use_cache = '--no-cache' not in args
+    if not use_cache:
+        args.remove('--no-cache')
+    full_scan = '--full-scan' in args
+    if full_scan:
+        args.remove('--full-scan')
     
-    command = sys.argv[1]
-    extractor = EnhancedPdfExtractor()
+    command = args[0]
     
     try:
+        extractor = EnhancedPdfExtractor(
+            workers=max(1, int(workers)) if workers else None,
+            method=method,
+            memory_limit=int(float(memory_limit) * 1024 * 1024) if memory_limit else None,
+            use_cache=use_cache
+        )
+        
         if command == 'extract':
-            if len(sys.argv) < 3:
+            if len(args) < 2:
                 print(json.dumps({'error': 'PDF path required'}))
                 sys.exit(1)
             
-            pdf_path = sys.argv[2]
-            result = extractor.extract_from_file(pdf_path)
+            pdf_path = args[1]
+            with tracing(trace) as tracer:
+                result = attach_trace(extractor.extract_from_file(pdf_path, full_scan=full_scan), tracer)
             print(json.dumps(result, ensure_ascii=False, indent=2))
         
         elif command == 'info':
             info = {
                 'extraction_method': extractor.extraction_method,
+                'extraction_methods': EXTRACTION_METHODS,
+                'workers': extractor.workers,
+                'parallel_min_pages': PARALLEL_MIN_PAGES,
+                'memory_limit': extractor.memory_limit,
                 'libraries': {
                     'pypdf2': PYPDF2_AVAILABLE,
                     'pdfplumber': PDFPLUMBER_AVAILABLE,
                     'pymupdf': PYMUPDF_AVAILABLE,
                     'kiwi': KIWI_AVAILABLE
-                }
+                },
+                'extraction_cache': _cache_info(use_cache)
             }
             print(json.dumps(info, ensure_ascii=False, indent=2))
         
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+자소서 섹션 분리 (선형 시간)
+- 줄 단위로 한 번 훑어 섹션 제목 후보를 찾고, 본문은 다음 제목까지 오프셋으로 자름
+- 줄마다 고정된 패턴만 적용하므로 입력 크기에 비례하는 시간 (역추적 폭주 없음)
+
+제목 종류:
+  numbered    1. 지원 동기 / 2) 성장 과정    (번호 뒤 한글로 시작)
+  qa          Q1. 지원 동기를 기술하시오 / Q2: ...
+  bracketed   [지원 동기]                      (대괄호만 있는 줄)
+  underlined  지원동기 + 다음 줄 ---- 또는 ====
+  title_line  지원동기                         (한글 2~10자만 있는 줄)
+"""
+
+import re
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+# 제목으로 볼 최대 줄 길이 (번호로 시작하는 긴 문단은 제목이 아님)
+MAX_HEADER_LENGTH = 150
+
+# 본문 최소 길이 (앞뒤 공백 제외)
+MIN_SECTION_LENGTH = 100
+
+NUMBERED_PATTERN = re.compile(r'\s*(\d{1,2})[.)]\s*([가-힣].*)')
+QA_PATTERN = re.compile(r'\s*(Q\d+)[.:]\s*(.*)')
+BRACKETED_PATTERN = re.compile(r'\s*\[([^\]]+)\]\s*')
+HANGUL_LINE_PATTERN = re.compile(r'\s*([가-힣]{2,10})\s*')
+UNDERLINE_PATTERN = re.compile(r'[-=]+\s*')
+
+HANGUL_PATTERN = re.compile(r'[가-힣]')
+
+DEFAULT_KINDS = ('numbered', 'qa', 'bracketed', 'underlined')
+
+class Header(NamedTuple):
+    start: int          # 제목 줄 시작 오프셋
+    body_start: int     # 본문 시작 오프셋 (제목/밑줄 다음 줄)
+    kind: str
+    title: str
+
+class Section(NamedTuple):
+    title: str
+    start: int          # 본문 시작 (앞뒤 공백 제외)
+    end: int
+
+def iter_lines(text: str) -> Iterator[Tuple[int, int, int]]:
+    """(줄 시작, 줄 끝(개행 제외), 다음 줄 시작)"""
+    position = 0
+    length = len(text)
+    while position < length:
+        newline = text.find('\n', position)
+        if newline == -1:
+            yield position, length, length
+            return
+        yield position, newline, newline + 1
+        position = newline + 1
+
+def find_headers(text: str, kinds: Sequence[str] = DEFAULT_KINDS) -> List[Header]:
+    """섹션 제목 후보 (등장 순서)"""
+    headers = []
+    previous = None  # 밑줄 제목 판정용 직전 줄 (시작, 한글 제목)
+
+    for start, end, next_start in iter_lines(text):
+        if end - start > MAX_HEADER_LENGTH:
+            previous = None
+            continue
+
+        line = text[start:end]
+        header = None
+
+        if 'underlined' in kinds and previous is not None and UNDERLINE_PATTERN.fullmatch(line):
+            header = Header(previous[0], next_start, 'underlined', previous[1])
+        elif 'numbered' in kinds and (match := NUMBERED_PATTERN.fullmatch(line)):
+            header = Header(start, next_start, 'numbered', f"{match.group(1)}. {match.group(2).strip()}")
+        elif 'qa' in kinds and (match := QA_PATTERN.fullmatch(line)):
+            header = Header(start, next_start, 'qa', f"{match.group(1)}. {match.group(2).strip()}")
+        elif 'bracketed' in kinds and (match := BRACKETED_PATTERN.fullmatch(line)):
+            header = Header(start, next_start, 'bracketed', match.group(1).strip())
+
+        hangul_line = HANGUL_LINE_PATTERN.fullmatch(line)
+        if header is None and hangul_line and 'title_line' in kinds:
+            header = Header(start, next_start, 'title_line', hangul_line.group(1))
+
+        if header is not None:
+            # 밑줄 제목은 직전 줄에서 시작 - 같은 줄을 title_line 으로 이미 잡았으면 교체
+            if header.kind == 'underlined' and headers and headers[-1].start == header.start:
+                headers[-1] = header
+            else:
+                headers.append(header)
+
+        previous = (start, hangul_line.group(1)) if hangul_line else None
+
+    return headers
+
+def strip_span(text: str, start: int, end: int) -> Tuple[int, int]:
+    """text[start:end].strip() 과 같은 범위 (복사 없이)"""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+def split_sections(text: str, kinds: Sequence[str] = DEFAULT_KINDS,
+                   min_length: int = MIN_SECTION_LENGTH) -> List[Section]:
+    """제목 사이 본문을 오프셋으로 자른 섹션 (본문이 min_length 미만이면 제외)"""
+    headers = find_headers(text, kinds)
+    sections = []
+    for index, header in enumerate(headers):
+        end = headers[index + 1].start if index + 1 < len(headers) else len(text)
+        start, end = strip_span(text, min(header.body_start, end), end)
+        if end - start >= min_length:
+            sections.append(Section(header.title, start, end))
+    return sections
+
+def keyword_section(text: str, keyword: str, min_hangul: int = 20) -> Optional[Tuple[str, int, int]]:
+    """
+    키워드로 시작하는 제목 줄 다음부터 끝까지를 본문으로 (한글이 min_hangul자 이상일 때)
+
+    이전 정규식 rf'({keyword}[^\\n]*)\\n+([^가-힣]*(?:[가-힣][^가-힣]*){{20,}})' 과 같은 결과
+
+    Returns:
+        (제목 줄, 본문 시작, 본문 끝) 또는 None
+    """
+    position = text.find(keyword)
+    if position == -1:
+        return None
+
+    newline = text.find('\n', position)
+    if newline == -1:
+        return None
+
+    body_start = newline
+    while body_start < len(text) and text[body_start] == '\n':
+        body_start += 1
+
+    hangul_count = 0
+    for _ in HANGUL_PATTERN.finditer(text, body_start):
+        hangul_count += 1
+        if hangul_count >= min_hangul:
+            return text[position:newline], body_start, len(text)
+    return None
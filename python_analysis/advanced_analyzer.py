@@ -8,18 +8,23 @@ from typing import Dict, List, Any, Tuple
 from collections import Counter
 import math
 
-try:
-    from konlpy.tag import Okt
-    KONLPY_AVAILABLE = True
-except ImportError:
-    KONLPY_AVAILABLE = False
+from analysis_context import AnalysisContext
+from keyword_matcher import KeywordMatcher, total_hits
+from morph_backend import get_backend
+
+# 진정성 평가: 숫자/날짜, 구체적 명칭 (영문 고유명사, '~팀/프로젝트/시스템')
+NUMBER_PATTERN = re.compile(r'\d+')
+SPECIFIC_TERM_PATTERN = re.compile(r'[A-Z][A-Za-z]+|[가-힣]+(?:팀|프로젝트|시스템)')
 
 class AdvancedCoverLetterAnalyzer:
     """심층 자소서 분석기"""
     
+    @property
+    def morph(self):
+        """프로세스 공용 형태소 분석 백엔드 (처음 접근할 때 로드)"""
+        return get_backend()
+    
     def __init__(self):
-        self.okt = Okt() if KONLPY_AVAILABLE else None
-        
         # AI 문체 패턴
         self.ai_patterns = [
             r'뿐만 아니라',
@@ -48,15 +53,30 @@ class AdvancedCoverLetterAnalyzer:
             'result': ['결과', '성과', '달성', '향상', '개선', '증가', '감소', '완료']
         }
         
-    def analyze(self, text: str, company: str = None, position: str = None) -> Dict[str, Any]:
+        # 개인 경험 표현
+        self.personal_expressions = ['저는', '제가', '나는', '내가', '저의', '나의']
+        
+        # 위 표현 목록 전체를 한 번에 스캔하는 매처 (부분 문자열 기준 = str.count)
+        self.phrase_scanner = KeywordMatcher({
+            'ai_pattern': self.ai_patterns,
+            'cliche': self.cliche_phrases,
+            'personal': self.personal_expressions,
+            **{f'star_{component}': keywords for component, keywords in self.star_keywords.items()}
+        }, word_boundary=False, ignore_case=False)
+        
+    def analyze(self, text: str, company: str = None, position: str = None,
+                context: AnalysisContext = None) -> Dict[str, Any]:
         """통합 분석 수행"""
+        # 표현 목록 스캔은 한 번만 하고 결과를 각 평가에 전달
+        hits = self.phrase_scanner.scan(text)
+        
         results = {
             'basic_stats': self._analyze_basic_stats(text),
             'readability': self._calculate_readability(text),
-            'keyword_analysis': self._analyze_keywords(text),
-            'ai_detection': self._detect_ai_patterns(text),
-            'star_compliance': self._check_star_compliance(text),
-            'authenticity': self._evaluate_authenticity(text),
+            'keyword_analysis': self._analyze_keywords(text, hits, context),
+            'ai_detection': self._detect_ai_patterns(text, hits),
+            'star_compliance': self._check_star_compliance(text, hits),
+            'authenticity': self._evaluate_authenticity(text, hits),
             'quality_score': 0,
             'suggestions': []
         }
@@ -120,11 +140,14 @@ class AdvancedCoverLetterAnalyzer:
             'complex_word_ratio': round(complex_word_ratio, 2)
         }
     
-    def _analyze_keywords(self, text: str) -> Dict[str, Any]:
+    def _analyze_keywords(self, text: str, hits: Dict = None, context: AnalysisContext = None) -> Dict[str, Any]:
         """키워드 분석"""
-        if KONLPY_AVAILABLE and self.okt:
+        if hits is None:
+            hits = self.phrase_scanner.scan(text)
+        
+        if self.morph.has_model:
             # 명사 추출
-            nouns = self.okt.nouns(text)
+            nouns = (context or AnalysisContext(self.morph)).nouns(text)
             noun_counts = Counter(nouns)
             
             # 상위 10개 키워드
@@ -144,7 +167,7 @@ class AdvancedCoverLetterAnalyzer:
             ]
         
         # 진부한 표현 사용 횟수
-        cliche_count = sum(text.count(phrase) for phrase in self.cliche_phrases)
+        cliche_count = total_hits(hits, 'cliche')
         
         return {
             'top_keywords': top_keywords,
@@ -152,13 +175,17 @@ class AdvancedCoverLetterAnalyzer:
             'keyword_diversity': len(set(text.split())) / max(len(text.split()), 1)
         }
     
-    def _detect_ai_patterns(self, text: str) -> Dict[str, Any]:
+    def _detect_ai_patterns(self, text: str, hits: Dict = None) -> Dict[str, Any]:
         """AI 생성 패턴 탐지"""
+        if hits is None:
+            hits = self.phrase_scanner.scan(text)
+        
         ai_pattern_matches = []
         total_matches = 0
+        pattern_hits = hits.get('ai_pattern', {})
         
         for pattern in self.ai_patterns:
-            matches = len(re.findall(pattern, text))
+            matches = len(pattern_hits.get(pattern, []))
             if matches > 0:
                 ai_pattern_matches.append({'pattern': pattern, 'count': matches})
                 total_matches += matches
@@ -186,12 +213,15 @@ class AdvancedCoverLetterAnalyzer:
         else:
             return '매우 높음'
     
-    def _check_star_compliance(self, text: str) -> Dict[str, Any]:
+    def _check_star_compliance(self, text: str, hits: Dict = None) -> Dict[str, Any]:
         """STAR 기법 준수도 체크"""
+        if hits is None:
+            hits = self.phrase_scanner.scan(text)
+        
         star_scores = {}
         
-        for component, keywords in self.star_keywords.items():
-            count = sum(text.count(keyword) for keyword in keywords)
+        for component in self.star_keywords:
+            count = total_hits(hits, f'star_{component}')
             # 각 구성요소별 점수 (0-100)
             score = min(100, count * 20)
             star_scores[component] = {
@@ -210,16 +240,19 @@ class AdvancedCoverLetterAnalyzer:
             'missing_components': [k for k, v in star_scores.items() if not v['found']]
         }
     
-    def _evaluate_authenticity(self, text: str) -> Dict[str, Any]:
+    def _evaluate_authenticity(self, text: str, hits: Dict = None) -> Dict[str, Any]:
         """진정성 평가"""
+        if hits is None:
+            hits = self.phrase_scanner.scan(text)
+        
         # 구체적 숫자나 날짜 언급
-        numbers = len(re.findall(r'\d+', text))
+        numbers = len(NUMBER_PATTERN.findall(text))
         
         # 구체적 프로젝트명, 기술명 등 (대문자나 영문 포함)
-        specific_terms = len(re.findall(r'[A-Z][A-Za-z]+|[가-힣]+(?:팀|프로젝트|시스템)', text))
+        specific_terms = len(SPECIFIC_TERM_PATTERN.findall(text))
         
         # 개인 경험 표현
-        personal_expressions = len(re.findall(r'저는|제가|나는|내가|저의|나의', text))
+        personal_expressions = total_hits(hits, 'personal')
         
         # 진정성 점수 계산
         text_length = len(text.split())
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+문서별 분석 컨텍스트
+- 같은 텍스트에 대한 형태소 분석(pos)을 한 번만 실행하고 결과를 재사용
+- morphs/nouns는 pos 결과에서 파생 (Okt.morphs, Okt.nouns 와 같은 방식)
+- 요청 하나 동안 가독성/키워드/밀도 계산이 컨텍스트를 공유
+"""
+
+from typing import Dict, List, Tuple
+
+class _TaggedText:
+    """형태소 분석 결과 (토큰/품사를 튜플 두 개로 보관)"""
+
+    __slots__ = ('words', 'tags', '_nouns')
+
+    def __init__(self, pairs: List[Tuple[str, str]]):
+        self.words = tuple(word for word, _ in pairs)
+        self.tags = tuple(tag for _, tag in pairs)
+        self._nouns = None
+
+    def nouns(self, noun_tags) -> Tuple[str, ...]:
+        if self._nouns is None:
+            self._nouns = tuple(word for word, tag in zip(self.words, self.tags) if tag in noun_tags)
+        return self._nouns
+
+class AnalysisContext:
+    """텍스트별 형태소 분석 결과 메모이제이션"""
+
+    def __init__(self, tagger):
+        """
+        Args:
+            tagger: 형태소 분석 백엔드 (morph_backend - pos(text), noun_tags 제공)
+        """
+        self.tagger = tagger
+        self.tagger_calls = 0
+        self._tagged: Dict[str, _TaggedText] = {}
+
+    def _analyze(self, text: str) -> _TaggedText:
+        tagged = self._tagged.get(text)
+        if tagged is None:
+            tagged = _TaggedText(self.tagger.pos(text))
+            self._tagged[text] = tagged
+            self.tagger_calls += 1
+        return tagged
+
+    def pos(self, text: str) -> List[Tuple[str, str]]:
+        """(토큰, 품사) 목록"""
+        tagged = self._analyze(text)
+        return list(zip(tagged.words, tagged.tags))
+
+    def morphs(self, text: str) -> Tuple[str, ...]:
+        """형태소 토큰"""
+        return self._analyze(text).words
+
+    def nouns(self, text: str) -> Tuple[str, ...]:
+        """명사 토큰"""
+        return self._analyze(text).nouns(self.tagger.noun_tags)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+상주 분석 서버
+- rails_integration.py의 커맨드를 Unix 소켓으로 제공
+- 분석기 인스턴스를 미리 로드해 요청마다 인터프리터/import 비용 제거
+- 프로토콜: 줄 단위 JSON (NDJSON)
+- --workers N 지정 시 사전 fork된 워커 풀로 병렬 처리 (worker_pool.py)
+
+요청:  {"id": "abc", "command": "analyze_quality", "data": {"text": "..."}}
+응답:  {"id": "abc", "result": {...}}
+상태:  {"id": "s1", "command": "status"}  (결과 캐시 통계 포함 - 풀 모드는 워커 합계)
+"""
+
+import argparse
+import json
+import os
+import signal
+import socketserver
+import sys
+import threading
+from pathlib import Path
+
+import rails_integration
+from worker_pool import WorkerPool
+
+# Rails tmp/sockets 디렉토리를 기본 위치로 사용
+DEFAULT_SOCKET_PATH = str(Path(__file__).parent.parent / 'tmp' / 'sockets' / 'python_analysis.sock')
+
+class AnalysisRequestHandler(socketserver.StreamRequestHandler):
+    """연결 하나에서 들어오는 요청을 줄 단위로 처리"""
+
+    def handle(self):
+        for raw_line in self.rfile:
+            line = raw_line.strip()
+            if not line:
+                continue
+
+            response = self.server.handle_message(line)
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+class AnalysisServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """분석기를 메모리에 유지하는 Unix 소켓 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, pool: WorkerPool = None):
+        self.socket_path = socket_path
+        self.pool = pool
+        self.requests_served = 0
+        # 분석기 인스턴스는 스레드 안전성을 보장하지 않으므로 실행은 직렬화 (requests_served 갱신도 이 잠금 아래)
+        self._dispatch_lock = threading.Lock()
+
+        Path(socket_path).parent.mkdir(parents=True, exist_ok=True)
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+        super().__init__(socket_path, AnalysisRequestHandler)
+        os.chmod(socket_path, 0o660)
+
+    def handle_message(self, line: bytes) -> dict:
+        """요청 한 줄을 파싱해 커맨드 실행"""
+        try:
+            message = json.loads(line)
+            if not isinstance(message, dict):
+                raise ValueError('request must be a JSON object')
+        except Exception as e:
+            return {'id': None, 'result': rails_integration._error_result(e)}
+
+        request_id = message.get('id')
+        command = message.get('command', '')
+
+        if command == 'ping':
+            return {'id': request_id, 'result': {'success': True, 'pid': os.getpid()}}
+
+        if command == 'status':
+            return {'id': request_id, 'result': self.status()}
+
+        data = message.get('data') or {}
+        if self.pool is not None:
+            result = self.pool.submit(command, data)
+            with self._dispatch_lock:
+                self.requests_served += 1
+        else:
+            with self._dispatch_lock:
+                result = rails_integration.execute_command(command, data)
+                self.requests_served += 1
+
+        return {'id': request_id, 'result': result}
+
+    def status(self) -> dict:
+        """서버/워커 풀 상태"""
+        if self.pool is not None:
+            status = self.pool.status()
+        else:
+            status = {'success': True, 'queue_depth': 0, 'workers': []}
+        status['mode'] = 'pool' if self.pool is not None else 'single'
+        status['requests_served'] = self.requests_served
+        if self.pool is not None:
+            # 풀 모드에서는 워커 프로세스가 캐시를 쓰므로 워커 카운터 합계 + 디스크 누적 통계
+            status['cache'] = self.pool.cache_stats()
+            disk = rails_integration.cache_stats().get('disk')
+            if status['cache']['enabled'] and disk is not None:
+                status['cache']['disk'] = disk
+        else:
+            status['cache'] = rails_integration.cache_stats()
+        return status
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+def serve(argv=None):
+    """서버 실행 (rails_integration.py serve 에서 호출)"""
+    parser = argparse.ArgumentParser(prog='rails_integration.py serve')
+    parser.add_argument('--socket', default=os.environ.get('PYTHON_ANALYSIS_SOCKET', DEFAULT_SOCKET_PATH),
+                        help='Unix 소켓 경로')
+    parser.add_argument('--workers', type=int, default=0,
+                        help='사전 fork할 워커 수 (0이면 서버 프로세스에서 직접 처리)')
+    parser.add_argument('--max-jobs', type=int, default=500,
+                        help='워커 하나가 처리할 최대 작업 수 (초과 시 재시작)')
+    parser.add_argument('--job-timeout', type=float, default=60.0,
+                        help='작업별 타임아웃 (초)')
+    parser.add_argument('--queue-size', type=int, default=64,
+                        help='대기 큐 최대 길이 (초과 시 즉시 거절)')
+    args = parser.parse_args(argv)
+
+    pool = None
+    if args.workers > 0:
+        pool = WorkerPool(args.workers, max_jobs_per_worker=args.max_jobs,
+                          job_timeout=args.job_timeout, queue_size=args.queue_size)
+        pool.start()
+    else:
+        # 분석기 워밍업 (import + 모델 로드를 요청 전에 끝냄)
+        rails_integration.warm_up()
+
+    server = AnalysisServer(args.socket, pool)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    print(f"분석 서버 시작: {args.socket} (pid {os.getpid()})", file=sys.stderr)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if pool is not None:
+            pool.shutdown()
+
+if __name__ == '__main__':
+    serve()
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+자소서 점수 일괄 계산 (numpy 배치)
+- 문서마다 한 번만 훑어 개수 특징(문장/단어 수, 표현 등장 수, 숫자 등)을 뽑아 특징 행렬 (문서 수 × 특징 수) 로 쌓음
+- 세 분석기의 표현 목록은 매처 하나로 합쳐 문서당 스캔 한 번
+- 가독성/STAR/진정성/품질 점수는 행렬 열 단위 배열 연산으로 계산
+- 결과는 문서별 경로와 같은 값/타입:
+    advanced     AdvancedCoverLetterAnalyzer.analyze() 의 readability, ai_detection, star_compliance, authenticity, quality_score
+    interactive  InteractiveAnalyzer.calculate_quality_score()
+    quality      QualityAnalyzer.analyze_only() 의 before_metrics.readability, ai_patterns_detected, improvements 점수
+
+반올림/경계값은 문서별 경로와 똑같이 맞춤:
+  - round(x, 1) 은 파이썬 round 로 (np.round 는 x*10 을 반올림해 마지막 자리가 다를 수 있음)
+    단, QualityAnalyzer 가독성은 문서별 경로도 np.mean 결과(np.float64)를 반올림하므로 np.round
+  - max(0, min(100, x)) 가 경계에 걸리면 정수 경계값 (JSON 출력이 100 / 100.0 으로 달라지지 않도록)
+
+사용법: echo '{"documents": [{"text": "...", "company": "삼성"}]}' | python batch_scorer.py
+"""
+
+import json
+import sys
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from advanced_analyzer import NUMBER_PATTERN, SPECIFIC_TERM_PATTERN, AdvancedCoverLetterAnalyzer
+from analysis_context import AnalysisContext
+from interactive_analyzer import TIMEFRAME_PATTERN, InteractiveAnalyzer
+from keyword_matcher import KeywordMatcher, total_hits
+from quality_analyzer import QualityAnalyzer
+
+STAR_COMPONENTS = ('situation', 'task', 'action', 'result')
+
+# 특징 행렬 열 (문서 하나당 한 행)
+FEATURES = (
+    'words',                  # text.split() 단어 수
+    'complex_words',          # 6글자 이상 단어 수
+    'pieces',                 # text.split('.') 조각 수
+    'nonblank_sentences',     # 공백뿐인 조각을 뺀 문장 수 (advanced)
+    'nonempty_sentences',     # 빈 조각을 뺀 문장 수 (quality)
+    'sentence_words',         # 빈 조각을 뺀 문장들의 단어 수 합 (quality)
+    'tokens',                 # 가독성 토큰 수 (형태소 분석기가 있으면 형태소, 없으면 단어)
+    'token_chars',            # 가독성 토큰 글자 수 합
+    'numbers',                # 숫자 등장 수
+    'specific_terms',         # 구체적 명칭 등장 수
+    'has_timeframe',          # 구체적 시간 표현 여부
+    'ai_phrases',             # AI 문체 표현 등장 수 (advanced)
+    'personal',               # 개인 경험 표현 등장 수
+    *(f'star_{component}' for component in STAR_COMPONENTS),   # STAR 키워드 등장 수 (advanced)
+    'action_verbs',           # 구체적 행동 동사 종류 수 (interactive)
+    'ai_cliches',             # AI 클리셰 종류 수 (interactive)
+    'structure_situation',    # STAR 흐름 표현 여부 (interactive)
+    'structure_action',
+    'structure_result',
+    'star_components',        # STAR 구성요소 발견 수 (quality)
+    'ai_rewrite_patterns',    # 리라이트 대상 AI 패턴 수 (quality)
+    'company_keywords_found', # 기업 인재상 키워드 발견 수 (quality)
+    'company_keywords',       # 기업 인재상 키워드 수 (quality)
+)
+COLUMN = {name: index for index, name in enumerate(FEATURES)}
+
+class BatchScorer:
+    """자소서 여러 건 점수 일괄 계산"""
+
+    def __init__(self, advanced: Optional[AdvancedCoverLetterAnalyzer] = None,
+                 interactive: Optional[InteractiveAnalyzer] = None,
+                 quality: Optional[QualityAnalyzer] = None):
+        self.advanced = advanced or AdvancedCoverLetterAnalyzer()
+        self.interactive = interactive or InteractiveAnalyzer()
+        self.quality = quality or QualityAnalyzer()
+
+        # 세 분석기의 표현 목록을 매처 하나로 (카테고리 이름 앞에 분석기 이름)
+        self.phrase_scanner = KeywordMatcher({
+            f'{name}:{category}': keywords
+            for name, analyzer in (('advanced', self.advanced), ('interactive', self.interactive),
+                                   ('quality', self.quality))
+            for category, keywords in analyzer.phrase_scanner.categories.items()
+        }, word_boundary=False, ignore_case=False)
+
+    def score(self, texts: List[str], companies: Optional[List[str]] = None) -> List[Dict]:
+        """
+        점수 일괄 계산
+
+        Args:
+            texts: 자소서 본문 목록
+            companies: 문서별 기업명 (QualityAnalyzer 키워드 최적화 점수용, 없으면 기본 키워드)
+
+        Returns:
+            입력 순서대로 {'advanced': {...}, 'interactive': {...}, 'quality': {...}}
+        """
+        if not texts:
+            return []
+        companies = companies or [''] * len(texts)
+
+        rows = []
+        ai_patterns = []
+        for text, company in zip(texts, companies):
+            row, detected = self._features(text, company or '')
+            rows.append(row)
+            ai_patterns.append(detected)
+        features = np.array(rows, dtype=np.int64).reshape(len(rows), len(FEATURES))
+
+        advanced = self._advanced_scores(features, ai_patterns)
+        interactive = self._interactive_scores(features)
+        quality = self._quality_scores(features)
+        return [{'advanced': a, 'interactive': i, 'quality': q} for a, i, q in zip(advanced, interactive, quality)]
+
+    def _features(self, text: str, company: str):
+        """문서 하나의 특징 행 + AI 문체 표현별 등장 수 (advanced detected_patterns 용)"""
+        hits = self.phrase_scanner.scan(text)
+        words = text.split()
+        pieces = text.split('.')
+        sentences = [piece for piece in pieces if piece]
+
+        if self.quality.morph.has_model:
+            tokens = [token for token in AnalysisContext(self.quality.morph).morphs(text) if token]
+        else:
+            tokens = words
+
+        ai_hits = hits.get('advanced:ai_pattern', {})
+        detected = [{'pattern': pattern, 'count': len(ai_hits[pattern])}
+                    for pattern in self.advanced.ai_patterns if ai_hits.get(pattern)]
+
+        target_keywords = self._company_keywords(company)
+        found_keywords = hits.get('quality:company_keyword', {})
+        action_verbs = hits.get('interactive:action_verb', {})
+
+        row = (
+            len(words),
+            sum(1 for word in words if len(word) > 5),
+            len(pieces),
+            sum(1 for piece in pieces if piece.strip()),
+            len(sentences),
+            sum(len(sentence.split()) for sentence in sentences),
+            len(tokens),
+            sum(len(token) for token in tokens),
+            len(NUMBER_PATTERN.findall(text)),
+            len(SPECIFIC_TERM_PATTERN.findall(text)),
+            TIMEFRAME_PATTERN.search(text) is not None,
+            sum(item['count'] for item in detected),
+            total_hits(hits, 'advanced:personal'),
+            *(total_hits(hits, f'advanced:star_{component}') for component in STAR_COMPONENTS),
+            sum(1 for verb in self.interactive.action_verbs if verb in action_verbs),
+            len(hits.get('interactive:ai_cliche', {})),
+            'interactive:structure_situation' in hits,
+            'interactive:structure_action' in hits,
+            'interactive:structure_result' in hits,
+            sum(1 for component in self.quality.star_keywords if f'quality:star_{component}' in hits),
+            self.quality.detect_ai_patterns(text),
+            sum(1 for keyword in target_keywords if keyword in found_keywords),
+            len(target_keywords),
+        )
+        return row, detected
+
+    def _company_keywords(self, company: str) -> List[str]:
+        """QualityAnalyzer.analyze_keywords 와 같은 대상 키워드 선택"""
+        for name, keywords in self.quality.company_keywords.items():
+            if name in company:
+                return keywords
+        return self.quality.default_company_keywords
+
+    def _advanced_scores(self, features: np.ndarray, ai_patterns: List[List[Dict]]) -> List[Dict]:
+        """AdvancedCoverLetterAnalyzer 가독성/AI 탐지/STAR/진정성/종합 점수"""
+        column = lambda name: features[:, COLUMN[name]]
+        words = column('words')
+        sentences = column('nonblank_sentences')
+        word_base = np.maximum(words, 1)
+
+        # 가독성 (문장이나 단어가 없으면 평가불가)
+        readable = (sentences > 0) & (words > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            avg_sentence_length = words / sentences
+            complex_word_ratio = column('complex_words') / words
+        readability = np.clip(100 - (avg_sentence_length * 2 + complex_word_ratio * 50), 0, 100)
+        readability_rounded = _round([_bounded(value, 0, 100) for value in readability.tolist()], 1)
+        readability_levels = np.select(
+            [readability >= 80, readability >= 60, readability >= 40, readability >= 20],
+            ['매우 읽기 쉬움', '읽기 쉬움', '보통', '다소 어려움'], '매우 어려움')
+
+        # AI 탐지
+        ai_probability = np.minimum(100, (column('ai_phrases') / word_base) * 1000)
+        ai_rounded = _round([_bounded(value, None, 100) for value in ai_probability.tolist()], 1)
+        ai_levels = np.select([ai_probability < 10, ai_probability < 25, ai_probability < 50, ai_probability < 75],
+                              ['매우 낮음', '낮음', '보통', '높음'], '매우 높음')
+
+        # STAR (구성요소별 등장 수 × 20, 최대 100)
+        star_counts = features[:, [COLUMN[f'star_{component}'] for component in STAR_COMPONENTS]]
+        star_scores = np.minimum(100, star_counts * 20)
+        star_total = star_scores.sum(axis=1) / 4
+        star_rounded = _round(star_total.tolist(), 1)
+
+        # 진정성 (구체성 + 개인 표현 비율)
+        specific_details = column('numbers') + column('specific_terms')
+        specificity = np.minimum(100, specific_details * 10)
+        personal = np.minimum(100, (column('personal') / word_base) * 500)
+        authenticity = (specificity + personal) / 2
+        authenticity_rounded = _round(authenticity.tolist(), 1)
+        authenticity_levels = np.select(
+            [authenticity >= 70, authenticity >= 50, authenticity >= 30, authenticity >= 10],
+            ['매우 진정성 있음', '진정성 있음', '보통', '개선 필요'], '진정성 부족')
+
+        # 종합 품질 (반올림된 항목 점수로 계산 - 문서별 경로와 같음)
+        quality = (np.where(readable, readability_rounded, 0) * 0.25 + (100 - np.array(ai_rounded)) * 0.20
+                   + np.array(star_rounded) * 0.25 + np.array(authenticity_rounded) * 0.30)
+        quality_rounded = _round(quality.tolist(), 1)
+
+        results = []
+        for i in range(len(features)):
+            if readable[i]:
+                readability_result = {
+                    'score': readability_rounded[i],
+                    'level': str(readability_levels[i]),
+                    'avg_sentence_length': round(float(avg_sentence_length[i]), 1),
+                    'complex_word_ratio': round(float(complex_word_ratio[i]), 2)
+                }
+            else:
+                readability_result = {'score': 0, 'level': '평가불가'}
+
+            components = {
+                component: {'score': int(star_scores[i, j]), 'found': bool(star_counts[i, j] > 0)}
+                for j, component in enumerate(STAR_COMPONENTS)
+            }
+            results.append({
+                'readability': readability_result,
+                'ai_detection': {
+                    'ai_probability': ai_rounded[i],
+                    'detected_patterns': ai_patterns[i],
+                    'risk_level': str(ai_levels[i])
+                },
+                'star_compliance': {
+                    'components': components,
+                    'total_score': star_rounded[i],
+                    'has_all_components': all(value['found'] for value in components.values()),
+                    'missing_components': [name for name, value in components.items() if not value['found']]
+                },
+                'authenticity': {
+                    'score': authenticity_rounded[i],
+                    'specific_details': int(specific_details[i]),
+                    'personal_expressions': int(column('personal')[i]),
+                    'level': str(authenticity_levels[i])
+                },
+                'quality_score': quality_rounded[i]
+            })
+        return results
+
+    def _interactive_scores(self, features: np.ndarray) -> List[Dict]:
+        """InteractiveAnalyzer.calculate_quality_score 항목별 점수"""
+        column = lambda name: features[:, COLUMN[name]]
+        words = column('words')
+
+        length = np.select([words < 30, words < 50, words < 150, words < 300], [30.0, 50.0, 80.0, 100.0], 70.0)
+
+        # 숫자 30점 + 시간 표현 20점, 행동 동사는 10점씩 50점을 넘길 때까지 (50점 이상이면 한 개만)
+        base = np.where(column('numbers') > 0, 30.0, 0.0) + np.where(column('has_timeframe') > 0, 20.0, 0.0)
+        verb_limit = np.maximum(1, np.ceil((50 - base) / 10))
+        specificity = np.minimum(base + 10 * np.minimum(column('action_verbs'), verb_limit), 100.0)
+
+        structure = np.where(column('pieces') < 3, 30.0,
+                             40.0 + 20 * (column('structure_situation') + column('structure_action')
+                                          + column('structure_result')))
+        uniqueness = np.maximum(100.0 - 10 * column('ai_cliches'), 0.0)
+        overall = (length + specificity + structure + uniqueness) / 4
+
+        return [{
+            'length': scores[0],
+            'specificity': scores[1],
+            'structure': scores[2],
+            'uniqueness': scores[3],
+            'overall': scores[4]
+        } for scores in np.column_stack([length, specificity, structure, uniqueness, overall]).tolist()]
+
+    def _quality_scores(self, features: np.ndarray) -> List[Dict]:
+        """QualityAnalyzer.analyze_only 가독성/AI 패턴/STAR/키워드 점수"""
+        column = lambda name: features[:, COLUMN[name]]
+
+        # 문서별 경로의 np.mean 과 같은 값 (빈 목록이면 nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            avg_sentence_length = column('sentence_words') / column('nonempty_sentences')
+            avg_word_length = column('token_chars') / column('tokens')
+        readability = 100 - (avg_sentence_length * 2 + avg_word_length * 5)
+        readability_rounded = np.round(readability, 1)
+
+        ai_patterns = column('ai_rewrite_patterns')
+        ai_naturalness = 100 - np.minimum(ai_patterns * 5, 100)
+        structure = column('star_components') * 25
+        optimization = np.rint(np.minimum(100, (column('company_keywords_found') / column('company_keywords')) * 100))
+
+        results = []
+        for i, (score, rounded) in enumerate(zip(readability.tolist(), readability_rounded.tolist())):
+            # max(0, min(100, nan)) 은 100
+            if not score < 100:
+                rounded = 100
+            elif score <= 0:
+                rounded = 0
+            results.append({
+                'readability': {
+                    'score': rounded,
+                    'avg_sentence_length': float(np.round(avg_sentence_length[i], 1)),
+                    'avg_word_length': float(np.round(avg_word_length[i], 1))
+                },
+                'ai_patterns_detected': int(ai_patterns[i]),
+                'ai_naturalness': int(ai_naturalness[i]),
+                'keyword_optimization': int(optimization[i]),
+                'structure_score': int(structure[i])
+            })
+        return results
+
+def _round(values: List[float], digits: int) -> List[float]:
+    """파이썬 round() 로 반올림 (문서별 경로와 같은 자릿수 처리)"""
+    return [round(value, digits) for value in values]
+
+def _bounded(value: float, low, high):
+    """max(low, min(high, value)) 와 같은 값/타입 (경계에 걸리면 정수 경계값)"""
+    if high is not None and not value < high:
+        return high
+    if low is not None and value <= low:
+        return low
+    return value
+
+def main():
+    """CLI: {"documents": [{"text": ..., "company": ...}]} → {"success": true, "scores": [...]}"""
+    try:
+        data = json.loads(sys.stdin.read())
+        documents = data.get('documents', [])
+        scores = BatchScorer().score([document.get('text', '') for document in documents],
+                                     [document.get('company', '') for document in documents])
+        print(json.dumps({'success': True, 'scores': scores}, ensure_ascii=False))
+    except Exception as e:
+        print(json.dumps({'success': False, 'error': str(e)}, ensure_ascii=False))
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
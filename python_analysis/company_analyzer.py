@@ -12,14 +12,9 @@ import json
 import re
 from collections import Counter, defaultdict
 from typing import Dict, List, Tuple, Any, Optional
-import requests
-from bs4 import BeautifulSoup
-import nltk
 from datetime import datetime, timedelta
-from dotenv import load_dotenv
 
-# 환경변수 로드
-load_dotenv()
+from keyword_matcher import get_matcher
 
 class CompanyAnalyzer:
     """기업 분석기 클래스"""
@@ -131,12 +126,7 @@ class CompanyAnalyzer:
             company_data.get('business_areas', '')
         ])
         
-        industry_scores = {}
-        for industry, keywords in self.industry_keywords.items():
-            score = 0
-            for keyword in keywords:
-                score += len(re.findall(rf'\b{re.escape(keyword)}\b', company_text, re.IGNORECASE))
-            industry_scores[industry] = score
+        industry_scores = get_matcher('industry_keywords', self.industry_keywords).counts(company_text)
         
         primary_industry = max(industry_scores.items(), key=lambda x: x[1])[0] if industry_scores else 'general'
         
@@ -154,12 +144,7 @@ class CompanyAnalyzer:
             str(company_data.get('employees', ''))
         ])
         
-        size_scores = {}
-        for size, indicators in self.company_size_indicators.items():
-            score = 0
-            for indicator in indicators:
-                score += len(re.findall(rf'\b{re.escape(indicator)}\b', company_text, re.IGNORECASE))
-            size_scores[size] = score
+        size_scores = get_matcher('company_size_indicators', self.company_size_indicators).counts(company_text)
         
         # 직원 수 기반 분류
         employee_count = company_data.get('employees', '')
@@ -9,26 +9,16 @@ import numpy as np
 import warnings
 warnings.filterwarnings('ignore')
 
-# KoNLPy는 Java가 필요하므로 옵션으로 처리
-KONLPY_AVAILABLE = False
-try:
-    import os
-    # Java 경로 설정
-    os.environ['JAVA_HOME'] = '/opt/homebrew/opt/openjdk@17'
-    os.environ['PATH'] = f"/opt/homebrew/opt/openjdk@17/bin:{os.environ.get('PATH', '')}"
-    
-    from konlpy.tag import Okt
-    KONLPY_AVAILABLE = True
-    # 디버그 메시지는 주석 처리
-    # print("KoNLPy 활성화됨", file=sys.stderr)
-except Exception as e:
-    # print(f"KoNLPy를 사용할 수 없습니다: {e}", file=sys.stderr)
-    KONLPY_AVAILABLE = False
+from analysis_context import AnalysisContext
+from morph_backend import get_backend
 
 class RewriteEnhancer:
+    @property
+    def morph(self):
+        """프로세스 공용 형태소 분석 백엔드 (처음 접근할 때 로드)"""
+        return get_backend()
+    
     def __init__(self):
-        self.okt = Okt() if KONLPY_AVAILABLE else None
-        
         # AI 특유 패턴들
         self.ai_patterns = [
             (r'저는\s+.*?라고\s+생각합니다', ''),  # 불필요한 주관 표현
@@ -68,12 +58,12 @@ class RewriteEnhancer:
         removed_count = len(original) - len(text)
         return text, removed_count
     
-    def calculate_readability(self, text):
+    def calculate_readability(self, text, context=None):
         """한국어 가독성 점수 계산"""
         sentences = text.split('.')
         
-        if self.okt:
-            words = self.okt.morphs(text)
+        if self.morph.has_model:
+            words = (context or AnalysisContext(self.morph)).morphs(text)
         else:
             # KoNLPy 없이 간단한 분리
             words = text.split()
@@ -162,10 +152,10 @@ class RewriteEnhancer:
         
         return text, star_score
     
-    def calculate_keyword_density(self, text, keywords):
+    def calculate_keyword_density(self, text, keywords, context=None):
         """키워드 밀도 계산"""
-        if self.okt:
-            words = self.okt.nouns(text)
+        if self.morph.has_model:
+            words = (context or AnalysisContext(self.morph)).nouns(text)
         else:
             # 간단한 단어 추출 (공백 기준)
             words = [w for w in text.split() if len(w) > 1]
@@ -180,7 +170,7 @@ class RewriteEnhancer:
         
         return round(density, 1)
     
-    def enhance_rewrite(self, data):
+    def enhance_rewrite(self, data, context=None):
         """리라이트 텍스트 품질 향상"""
         try:
             text = data.get('text', '')
@@ -189,9 +179,13 @@ class RewriteEnhancer:
             if not text:
                 return {'error': '텍스트가 없습니다'}
             
+            # 형태소 분석 결과를 텍스트별로 한 번만 계산
+            if context is None and self.morph.has_model:
+                context = AnalysisContext(self.morph)
+            
             # 원본 지표
             before_metrics = {
-                'readability': self.calculate_readability(text),
+                'readability': self.calculate_readability(text, context),
                 'length': len(text),
                 'sentences': len(text.split('.'))
             }
@@ -210,7 +204,7 @@ class RewriteEnhancer:
             
             # 개선 후 지표
             after_metrics = {
-                'readability': self.calculate_readability(text),
+                'readability': self.calculate_readability(text, context),
                 'length': len(text),
                 'sentences': len(text.split('.')),
                 'ai_patterns_removed': ai_removed,
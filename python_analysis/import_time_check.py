@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+콜드 스타트 import 시간 점검
+- python -X importtime 으로 rails_integration 커맨드 하나를 새 프로세스에서 실행
+- 무거운 의존성이 로드되면 실패 (exit 1)
+- --budget-ms 를 주면 전체 import 시간이 예산을 넘어도 실패 (벽시계 시간이라 머신 부하에 따라 흔들리므로 선택 사항)
+
+사용법: python import_time_check.py [--command remove_ai_patterns] [--budget-ms 150]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+SCRIPT_DIR = Path(__file__).parent
+
+# remove_ai_patterns 같은 가벼운 커맨드에서 로드되면 안 되는 모듈
+HEAVY_MODULES = ['numpy', 'nltk', 'bs4', 'requests', 'dotenv', 'konlpy', 'jpype', 'kiwipiepy']
+
+# 자식 프로세스에서 실행할 코드: 커맨드 실행 후 로드된 무거운 모듈 목록 출력
+PROBE_CODE = '''
+import json, sys
+import rails_integration
+rails_integration.execute_command({command!r}, {data!r})
+heavy = sorted({{name.split('.')[0] for name in sys.modules}} & set({heavy!r}))
+print(json.dumps(heavy))
+'''
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """
+    -X importtime 출력 파싱
+
+    Returns:
+        (모듈명, 중첩 깊이, self us, cumulative us) 목록
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # 헤더 줄
+
+        name_field = parts[2]
+        depth = (len(name_field) - len(name_field.lstrip()) - 1) // 2
+        entries.append((name_field.strip(), depth, int(parts[0]), int(parts[1])))
+    return entries
+
+def measure(command: str, data: Dict) -> Dict:
+    """커맨드 하나를 새 인터프리터에서 실행해 import 비용 측정"""
+    code = PROBE_CODE.format(command=command, data=data, heavy=HEAVY_MODULES)
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                          cwd=SCRIPT_DIR, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f'probe failed: {proc.stderr[-2000:]}')
+
+    entries = parse_importtime(proc.stderr)
+    top_level = sorted((e for e in entries if e[1] == 0), key=lambda e: e[3], reverse=True)
+
+    return {
+        'command': command,
+        'total_import_ms': round(sum(e[2] for e in entries) / 1000, 1),
+        'module_count': len(entries),
+        'heavy_modules_loaded': json.loads(proc.stdout.strip().splitlines()[-1]),
+        'top_imports': [{'module': e[0], 'cumulative_ms': round(e[3] / 1000, 1)} for e in top_level[:10]]
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='rails_integration 콜드 스타트 import 예산 점검')
+    parser.add_argument('--command', default='remove_ai_patterns')
+    parser.add_argument('--budget-ms', type=float, default=None, help='전체 import 시간 예산 (생략하면 시간은 보고만 함)')
+    args = parser.parse_args()
+
+    report = measure(args.command, {'text': '또한, 이를 통해 성장할 수 있습니다.'})
+    report['budget_ms'] = args.budget_ms
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+    failures = []
+    if args.budget_ms is not None and report['total_import_ms'] > args.budget_ms:
+        failures.append(f"import time {report['total_import_ms']}ms exceeds budget {args.budget_ms}ms")
+    if report['heavy_modules_loaded']:
+        failures.append(f"heavy modules loaded: {', '.join(report['heavy_modules_loaded'])}")
+
+    if failures:
+        for failure in failures:
+            print(f'FAIL: {failure}', file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
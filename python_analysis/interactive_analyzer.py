@@ -14,6 +14,10 @@ import sys
 from typing import Dict, List, Tuple, Any
 from collections import Counter
 
+from analysis_context import AnalysisContext
+from keyword_matcher import KeywordMatcher
+from morph_backend import get_backend
+
 # numpy는 선택적으로 사용
 try:
     import numpy as np
@@ -21,22 +25,20 @@ try:
 except ImportError:
     USE_NUMPY = False
 
-# 한국어 형태소 분석
-try:
-    from konlpy.tag import Okt
-    USE_KONLPY = True
-except ImportError:
-    USE_KONLPY = False
-    print("Warning: KoNLPy not installed. Using basic analysis.", file=sys.stderr)
+# 구체성 점수: 숫자, 구체적 시간 표현
+NUMBER_PATTERN = re.compile(r'\d+')
+TIMEFRAME_PATTERN = re.compile(r'(년|개월|월|주|일|시간|분기|학기|회)')
 
 class InteractiveAnalyzer:
     """대화형 자소서 답변 분석기"""
     
+    @property
+    def morph(self):
+        """프로세스 공용 형태소 분석 백엔드 (처음 접근할 때 로드)"""
+        return get_backend()
+    
     def __init__(self):
         """초기화"""
-        if USE_KONLPY:
-            self.okt = Okt()
-        
         # 직무별 핵심 역량 키워드
         self.job_competencies = {
             "개발자": ["프로그래밍", "알고리즘", "데이터베이스", "협업", "문제해결", "디버깅", "설계", "테스트"],
@@ -61,6 +63,30 @@ class InteractiveAnalyzer:
             "시너지", "패러다임", "비전", "미션", "핵심가치"
         ]
         
+        # 구조 점수용 STAR 흐름 표현
+        self.structure_keywords = {
+            "situation": ["당시", "때", "상황"],
+            "action": ["수행", "진행", "실행", "했습니다"],
+            "result": ["결과", "성과", "달성"]
+        }
+        
+        # 구체적 행동 동사
+        self.action_verbs = ["개발", "작성", "분석", "설계", "관리", "진행", "수행", "달성"]
+        
+        # 일반 역량
+        self.general_competencies = ["리더십", "소통", "협업", "문제해결", "책임감", "도전", "창의"]
+        
+        # 위 표현 목록 전체를 한 번에 스캔하는 매처 (부분 문자열 기준)
+        self.phrase_scanner = KeywordMatcher({
+            "ai_cliche": self.ai_cliches,
+            "action_verb": self.action_verbs,
+            "example": ["예를", "경우"],
+            "general_competency": self.general_competencies,
+            **{f"star_{component}": keywords for component, keywords in self.star_keywords.items()},
+            **{f"structure_{component}": keywords for component, keywords in self.structure_keywords.items()},
+            **{f"job_{job_type}": competencies for job_type, competencies in self.job_competencies.items()}
+        }, word_boundary=False, ignore_case=False)
+        
     def analyze_response(self, response: str, position: str = None, 
                         conversation_history: List[Dict] = None) -> Dict[str, Any]:
         """
@@ -74,13 +100,16 @@ class InteractiveAnalyzer:
         Returns:
             분석 결과 딕셔너리
         """
+        # 표현 목록 스캔은 한 번만 하고 결과를 각 평가에 전달
+        hits = self.phrase_scanner.scan(response)
+        
         results = {
-            "quality_score": self.calculate_quality_score(response),
-            "specificity": self.check_specificity(response),
-            "star_compliance": self.check_star_compliance(response),
-            "authenticity": self.check_authenticity(response),
+            "quality_score": self.calculate_quality_score(response, hits),
+            "specificity": self.check_specificity(response, hits),
+            "star_compliance": self.check_star_compliance(response, hits),
+            "authenticity": self.check_authenticity(response, hits),
             "keywords": self.extract_keywords(response),
-            "competencies": self.extract_competencies(response, position),
+            "competencies": self.extract_competencies(response, position, hits),
             "improvement_tips": []
         }
         
@@ -95,18 +124,21 @@ class InteractiveAnalyzer:
         
         return results
     
-    def calculate_quality_score(self, response: str) -> Dict[str, float]:
+    def calculate_quality_score(self, response: str, hits: Dict = None) -> Dict[str, float]:
         """
         답변 품질 점수 계산
         
         Returns:
             각 항목별 점수 (0-100)
         """
+        if hits is None:
+            hits = self.phrase_scanner.scan(response)
+        
         scores = {
             "length": self._score_length(response),
-            "specificity": self._score_specificity(response),
-            "structure": self._score_structure(response),
-            "uniqueness": self._score_uniqueness(response)
+            "specificity": self._score_specificity(response, hits),
+            "structure": self._score_structure(response, hits),
+            "uniqueness": self._score_uniqueness(response, hits)
         }
         
         scores["overall"] = sum(scores.values()) / len(scores)
@@ -126,39 +158,44 @@ class InteractiveAnalyzer:
         else:
             return 70.0  # 너무 긴 답변
     
-    def _score_specificity(self, text: str) -> float:
+    def _score_specificity(self, text: str, hits: Dict = None) -> float:
         """구체성 점수"""
+        if hits is None:
+            hits = self.phrase_scanner.scan(text)
+        
         score = 0.0
         
         # 숫자 포함 여부 (기간, 성과 등)
-        if re.search(r'\d+', text):
+        if NUMBER_PATTERN.search(text):
             score += 30
         
         # 구체적 시간 표현
-        time_patterns = r'(년|개월|월|주|일|시간|분기|학기|회)'
-        if re.search(time_patterns, text):
+        if TIMEFRAME_PATTERN.search(text):
             score += 20
         
         # 구체적 행동 동사
-        action_verbs = ["개발", "작성", "분석", "설계", "관리", "진행", "수행", "달성"]
-        for verb in action_verbs:
-            if verb in text:
+        found_verbs = hits.get("action_verb", {})
+        for verb in self.action_verbs:
+            if verb in found_verbs:
                 score += 10
                 if score >= 50:
                     break
         
         return min(score, 100.0)
     
-    def _score_structure(self, text: str) -> float:
+    def _score_structure(self, text: str, hits: Dict = None) -> float:
         """구조 점수 (STAR 기법 등)"""
         sentences = text.split('.')
         if len(sentences) < 3:
             return 30.0
         
+        if hits is None:
+            hits = self.phrase_scanner.scan(text)
+        
         # 순차적 구조 체크
-        has_situation = any(kw in text for kw in ["당시", "때", "상황"])
-        has_action = any(kw in text for kw in ["수행", "진행", "실행", "했습니다"])
-        has_result = any(kw in text for kw in ["결과", "성과", "달성"])
+        has_situation = "structure_situation" in hits
+        has_action = "structure_action" in hits
+        has_result = "structure_result" in hits
         
         score = 40.0
         if has_situation:
@@ -170,34 +207,38 @@ class InteractiveAnalyzer:
         
         return score
     
-    def _score_uniqueness(self, text: str) -> float:
+    def _score_uniqueness(self, text: str, hits: Dict = None) -> float:
         """독창성 점수 (AI 클리셰 회피)"""
-        score = 100.0
+        if hits is None:
+            hits = self.phrase_scanner.scan(text)
         
         # AI 클리셰 체크
-        for cliche in self.ai_cliches:
-            if cliche in text:
-                score -= 10
+        score = 100.0 - 10 * len(hits.get("ai_cliche", {}))
         
         return max(score, 0.0)
     
-    def check_specificity(self, response: str) -> Dict[str, Any]:
+    def check_specificity(self, response: str, hits: Dict = None) -> Dict[str, Any]:
         """구체성 상세 분석"""
+        if hits is None:
+            hits = self.phrase_scanner.scan(response)
+        
         return {
             "has_numbers": bool(re.search(r'\d+', response)),
             "has_timeframe": bool(re.search(r'(년|개월|월|주|일)', response)),
             "has_metrics": bool(re.search(r'(%|퍼센트|증가|감소|향상)', response)),
-            "has_examples": "예를" in response or "경우" in response,
-            "score": self._score_specificity(response)
+            "has_examples": "example" in hits,
+            "score": self._score_specificity(response, hits)
         }
     
-    def check_star_compliance(self, response: str) -> Dict[str, Any]:
+    def check_star_compliance(self, response: str, hits: Dict = None) -> Dict[str, Any]:
         """STAR 기법 준수 여부 체크"""
+        if hits is None:
+            hits = self.phrase_scanner.scan(response)
+        
         compliance = {}
         
-        for component, keywords in self.star_keywords.items():
-            found = any(kw in response for kw in keywords)
-            compliance[component] = found
+        for component in self.star_keywords:
+            compliance[component] = f"star_{component}" in hits
         
         # 전체 준수율
         compliance_rate = sum(compliance.values()) / len(compliance) * 100
@@ -208,15 +249,14 @@ class InteractiveAnalyzer:
             "missing": [k for k, v in compliance.items() if not v]
         }
     
-    def check_authenticity(self, response: str) -> Dict[str, Any]:
+    def check_authenticity(self, response: str, hits: Dict = None) -> Dict[str, Any]:
         """진정성 평가 (AI 티 검사)"""
-        ai_score = 0
-        detected_cliches = []
+        if hits is None:
+            hits = self.phrase_scanner.scan(response)
         
-        for cliche in self.ai_cliches:
-            if cliche in response:
-                ai_score += 1
-                detected_cliches.append(cliche)
+        found_cliches = hits.get("ai_cliche", {})
+        detected_cliches = [cliche for cliche in self.ai_cliches if cliche in found_cliches]
+        ai_score = len(detected_cliches)
         
         # 진정성 점수 (AI 클리셰가 적을수록 높음)
         authenticity_score = max(100 - (ai_score * 15), 0)
@@ -227,11 +267,11 @@ class InteractiveAnalyzer:
             "is_authentic": authenticity_score >= 70
         }
     
-    def extract_keywords(self, response: str) -> List[str]:
+    def extract_keywords(self, response: str, context: AnalysisContext = None) -> List[str]:
         """핵심 키워드 추출"""
-        if USE_KONLPY:
+        if self.morph.has_model:
             # 형태소 분석 사용
-            nouns = self.okt.nouns(response)
+            nouns = (context or AnalysisContext(self.morph)).nouns(response)
             # 2글자 이상 명사만 필터링
             keywords = [noun for noun in nouns if len(noun) >= 2]
         else:
@@ -243,8 +283,11 @@ class InteractiveAnalyzer:
         counter = Counter(keywords)
         return [kw for kw, _ in counter.most_common(10)]
     
-    def extract_competencies(self, response: str, position: str = None) -> Dict[str, Any]:
+    def extract_competencies(self, response: str, position: str = None, hits: Dict = None) -> Dict[str, Any]:
         """역량 추출 및 매칭"""
+        if hits is None:
+            hits = self.phrase_scanner.scan(response)
+        
         found_competencies = []
         
         # 직무별 역량 체크
@@ -252,16 +295,13 @@ class InteractiveAnalyzer:
             # 직무 키워드 매칭
             for job_type, competencies in self.job_competencies.items():
                 if job_type in position:
-                    for comp in competencies:
-                        if comp in response:
-                            found_competencies.append(comp)
+                    found_in_response = hits.get(f"job_{job_type}", {})
+                    found_competencies.extend(comp for comp in competencies if comp in found_in_response)
                     break
         
         # 일반 역량 체크
-        general_competencies = ["리더십", "소통", "협업", "문제해결", "책임감", "도전", "창의"]
-        for comp in general_competencies:
-            if comp in response:
-                found_competencies.append(comp)
+        found_in_response = hits.get("general_competency", {})
+        found_competencies.extend(comp for comp in self.general_competencies if comp in found_in_response)
         
         return {
             "found": list(set(found_competencies)),
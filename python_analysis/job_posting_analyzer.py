@@ -12,17 +12,12 @@ import json
 import re
 from collections import Counter, defaultdict
 from typing import Dict, List, Tuple, Any, Optional
-import requests
-from bs4 import BeautifulSoup
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
-from nltk.tag import pos_tag
-from nltk.chunk import ne_chunk
-from dotenv import load_dotenv
 
-# 환경변수 로드
-load_dotenv()
+from korean_tokenizer import tokenize, count_hangul_words
+from keyword_matcher import get_matcher
+
+# BeautifulSoup 등 무거운 의존성은 실제로 필요한 메서드 안에서 import
+# (rails_integration의 다른 커맨드가 이 모듈 때문에 느려지지 않도록)
 
 class JobPostingAnalyzer:
     """채용공고 분석기 클래스"""
@@ -54,25 +49,6 @@ class JobPostingAnalyzer:
             'sales': ['영업', '세일즈', 'Sales', '비즈니스개발', 'BD', '고객관리'],
             'data': ['데이터', 'Data', '분석', 'Analytics', '데이터사이언스', 'ML', '머신러닝']
         }
-        
-        # NLTK 데이터 다운로드 (필요시)
-        self._download_nltk_data()
-    
-    def _download_nltk_data(self):
-        """NLTK 데이터 다운로드"""
-        try:
-            nltk.data.find('tokenizers/punkt')
-            nltk.data.find('corpora/stopwords')
-            nltk.data.find('taggers/averaged_perceptron_tagger')
-            nltk.data.find('chunkers/maxent_ne_chunker')
-            nltk.data.find('corpora/words')
-        except LookupError:
-            print("NLTK 데이터 다운로드 중...")
-            nltk.download('punkt', quiet=True)
-            nltk.download('stopwords', quiet=True)
-            nltk.download('averaged_perceptron_tagger', quiet=True)
-            nltk.download('maxent_ne_chunker', quiet=True)
-            nltk.download('words', quiet=True)
     
     def analyze_job_posting(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -153,6 +129,7 @@ class JobPostingAnalyzer:
         
         # HTML에서 텍스트 추출
         if job_data.get('html_content'):
+            from bs4 import BeautifulSoup
             soup = BeautifulSoup(job_data['html_content'], 'html.parser')
             content_parts.append(soup.get_text())
         
@@ -160,18 +137,17 @@ class JobPostingAnalyzer:
     
     def _basic_text_analysis(self, text: str) -> Dict[str, Any]:
         """기본 텍스트 분석"""
-        # 문장 및 단어 수
-        sentences = sent_tokenize(text)
-        words = word_tokenize(text.lower())
+        # 문장/단어 오프셋을 한 번에 추출 (영어용 NLTK punkt 대신 한국어 규칙 사용)
+        sentences, words = tokenize(text)
         
-        # 한글 단어만 필터링
-        korean_words = [word for word in words if re.match(r'^[가-힣]+$', word)]
+        # 한글 단어만 카운트
+        korean_words = count_hangul_words(text, words)
         
         return {
             'total_characters': len(text),
             'total_sentences': len(sentences),
             'total_words': len(words),
-            'korean_words': len(korean_words),
+            'korean_words': korean_words,
             'avg_sentence_length': len(words) / len(sentences) if sentences else 0,
             'reading_time_minutes': len(words) / 200  # 평균 읽기 속도 200단어/분
         }
@@ -200,13 +176,8 @@ class JobPostingAnalyzer:
     
     def _analyze_tech_stack(self, text: str) -> Dict[str, Any]:
         """기술 스택 분석"""
-        found_tech = defaultdict(list)
-        
-        for category, keywords in self.tech_keywords.items():
-            for keyword in keywords:
-                # 대소문자 구분 없이 검색
-                if re.search(rf'\b{re.escape(keyword)}\b', text, re.IGNORECASE):
-                    found_tech[category].append(keyword)
+        # 모든 카테고리 키워드를 한 번에 검색 (대소문자 무시)
+        found_tech = get_matcher('tech_keywords', self.tech_keywords).found(text)
         
         # 기술 스택 점수 계산
         tech_score = sum(len(techs) for techs in found_tech.values())
@@ -257,13 +228,7 @@ class JobPostingAnalyzer:
     
     def _classify_job_category(self, text: str) -> str:
         """직무 분류"""
-        category_scores = {}
-        
-        for category, keywords in self.job_categories.items():
-            score = 0
-            for keyword in keywords:
-                score += len(re.findall(rf'\b{re.escape(keyword)}\b', text, re.IGNORECASE))
-            category_scores[category] = score
+        category_scores = get_matcher('job_categories', self.job_categories).counts(text)
         
         if category_scores:
             return max(category_scores.items(), key=lambda x: x[1])[0]
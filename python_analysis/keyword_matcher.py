@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+키워드 사전 매칭 엔진
+- 카테고리별 키워드 목록을 정규식 하나(교대 패턴)로 컴파일해 텍스트를 한 번만 스캔
+- 카테고리/키워드별 등장 횟수와 오프셋 반환 (대소문자 무시, 단어 경계 기준)
+- 컴파일 결과는 모듈 수준에서 캐시
+- keyword_dictionaries.json 이 바뀌면 (mtime 기준) 다시 읽어 기본 사전에 키워드 추가 → 배포 없이 확장
+- word_boundary=False 이면 부분 문자열 모드 (str.count 와 같은 결과, 자소서 표현 목록용)
+- 기호로 끝나는 키워드(C++, C#)는 뒤에 공백/문장부호가 오거나 한글 조사가 바로 붙어도 매칭
+  ("C++ 개발", "C#, Java", "C++개발", "C#으로") - 영문/숫자가 바로 붙으면("C++x") 매칭하지 않음
+
+keyword_dictionaries.json 예:
+  {"tech_keywords": {"languages": ["Elixir"], "ml": ["PyTorch", "TensorFlow"]}}
+"""
+
+import json
+import os
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+DEFAULT_DICTIONARY_PATH = str(Path(__file__).parent / 'keyword_dictionaries.json')
+
+# 기호로 끝나는 키워드의 끝 경계: 단어 문자가 아니거나 한글(조사가 바로 붙는 경우)
+SYMBOL_END_BOUNDARY = r'(?![^\W가-힣])'
+
+# 사전 이름 → (기본 사전, 사전 파일 mtime, 매처)
+_matchers = {}
+
+# 사전 파일 캐시: (경로, mtime, 내용)
+_dictionary_file = (None, None, {})
+
+class KeywordMatcher:
+    """카테고리별 키워드를 한 번의 스캔으로 찾는 매처"""
+
+    def __init__(self, categories: Dict[str, List[str]], word_boundary: bool = True, ignore_case: bool = True):
+        """
+        Args:
+            categories: {카테고리: [키워드, ...]}
+            word_boundary: True면 단어 경계 기준 (\\b), False면 부분 문자열 기준 (str.count)
+            ignore_case: 대소문자 무시 여부
+        """
+        self.categories = {category: list(keywords) for category, keywords in categories.items()}
+        self._normalize = str.lower if ignore_case else str
+
+        # 정규화된 키워드 → 해당 키워드가 속한 (카테고리, 원래 키워드) 목록
+        self._owners = defaultdict(list)
+        for category, keywords in self.categories.items():
+            for keyword in keywords:
+                self._owners[self._normalize(keyword)].append((category, keyword))
+
+        # 긴 키워드부터 시도 → 같은 위치에서 가장 긴 키워드가 잡힘
+        ordered = sorted(self._owners, key=len, reverse=True)
+
+        # 매칭된 키워드 안에 들어 있는 다른 키워드 (오프셋, 키워드) - "도전정신" → (0, "도전"), (2, "정신")
+        # 매칭은 겹치지 않게 진행하므로 포함된 키워드는 이 표로 함께 카운트
+        self._inner = {keyword: self._find_inner(keyword, ordered, word_boundary) for keyword in ordered}
+
+        # 끝부분이 다른 키워드의 앞부분과 겹칠 수 있는 키워드 ("이를 통" + "통해서")
+        # 이런 키워드 뒤에서는 다음 위치부터 다시 검색
+        self._straddles = {keyword for keyword in ordered if self._has_straddle(keyword, ordered, word_boundary)}
+
+        # (?<!\w) (?!\w) 는 \b 와 같지만 C++, C# 처럼 기호로 끝나는 키워드도 매칭
+        # 기호로 끝나는 키워드는 한글 조사가 바로 붙어도 끝 경계로 봄 ("C++개발", "C#으로")
+        if word_boundary:
+            alternation = '|'.join(re.escape(keyword) + (r'(?!\w)' if _is_word_char(keyword[-1]) else SYMBOL_END_BOUNDARY)
+                                   for keyword in ordered)
+            alternation = rf'(?<!\w)(?:{alternation})'
+        else:
+            alternation = '|'.join(re.escape(keyword) for keyword in ordered)
+        self._pattern = re.compile(alternation, re.IGNORECASE if ignore_case else 0) if ordered else None
+
+    @staticmethod
+    def _boundary_ok(keyword: str, start: int, end: int) -> bool:
+        """keyword[start:end] 양끝이 단어 경계인지 (keyword 자체의 양끝은 경계로 간주)"""
+        return ((start == 0 or not _is_word_char(keyword[start - 1])) and
+                (end == len(keyword) or _ends_at_boundary(keyword[start:end], keyword[end])))
+
+    def _find_inner(self, keyword: str, ordered: List[str], word_boundary: bool) -> List[Tuple[int, str]]:
+        inner = []
+        for other in ordered:
+            if other == keyword or len(other) > len(keyword):
+                continue
+            offset = keyword.find(other)
+            while offset != -1:
+                if not word_boundary or self._boundary_ok(keyword, offset, offset + len(other)):
+                    inner.append((offset, other))
+                offset = keyword.find(other, offset + 1)
+        return sorted(inner)
+
+    def _has_straddle(self, keyword: str, ordered: List[str], word_boundary: bool) -> bool:
+        for offset in range(1, len(keyword)):
+            if word_boundary and _is_word_char(keyword[offset - 1]):
+                continue
+            tail = keyword[offset:]
+            if any(len(other) > len(tail) and other.startswith(tail) for other in ordered):
+                return True
+        return False
+
+    def scan(self, text: str) -> Dict[str, Dict[str, List[int]]]:
+        """
+        텍스트 한 번 스캔
+
+        Returns:
+            {카테고리: {키워드: [시작 오프셋, ...]}} (키워드별로 겹치지 않는 등장만)
+        """
+        hits = defaultdict(dict)
+        if self._pattern is None or not text:
+            return hits
+
+        # 키워드별 마지막 매칭 끝 위치 (같은 키워드의 겹치는 매칭 제외 = str.count, re.findall 과 동일)
+        last_end = {}
+
+        search = self._pattern.search
+        position = 0
+        while True:
+            match = search(text, position)
+            if match is None:
+                break
+
+            start = match.start()
+            matched = self._normalize(match.group())
+
+            if matched in self._straddles:
+                # 뒤에 걸친 키워드를 놓치지 않도록 다음 글자부터 재검색 (같은 위치 접두 키워드만 여기서 처리)
+                found = [(0, matched)] + [item for item in self._inner[matched] if item[0] == 0]
+                position = start + 1
+            else:
+                found = [(0, matched)] + self._inner[matched]
+                position = match.end()
+
+            for offset, keyword in found:
+                keyword_start = start + offset
+                if keyword_start < last_end.get(keyword, 0):
+                    continue
+                last_end[keyword] = keyword_start + len(keyword)
+
+                for category, original in self._owners[keyword]:
+                    hits[category].setdefault(original, []).append(keyword_start)
+
+        return hits
+
+    def counts(self, text: str) -> Dict[str, int]:
+        """카테고리별 총 등장 횟수 (모든 카테고리 포함, 사전 순서 유지)"""
+        hits = self.scan(text)
+        return {category: total_hits(hits, category) for category in self.categories}
+
+    def found(self, text: str) -> Dict[str, List[str]]:
+        """카테고리별 발견된 키워드 (발견된 카테고리만, 사전 순서 유지)"""
+        hits = self.scan(text)
+        return {category: [keyword for keyword in keywords if keyword in hits[category]]
+                for category, keywords in self.categories.items() if category in hits}
+
+def total_hits(hits: Dict[str, Dict[str, List[int]]], category: str) -> int:
+    """scan() 결과에서 카테고리 총 등장 횟수"""
+    return sum(len(offsets) for offsets in hits.get(category, {}).values())
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+def _ends_at_boundary(keyword: str, next_char: str) -> bool:
+    """keyword 바로 뒤에 next_char가 와도 끝 경계인지 (SYMBOL_END_BOUNDARY 와 같은 규칙)"""
+    if not _is_word_char(next_char):
+        return True
+    return not _is_word_char(keyword[-1]) and '가' <= next_char <= '힣'
+
+def _load_dictionary_file() -> Tuple[float, Dict]:
+    """사전 파일을 mtime이 바뀐 경우에만 다시 읽음"""
+    global _dictionary_file
+
+    path = os.environ.get('KEYWORD_DICTIONARY_PATH', DEFAULT_DICTIONARY_PATH)
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return None, {}
+
+    cached_path, cached_mtime, content = _dictionary_file
+    if cached_path == path and cached_mtime == mtime:
+        return mtime, content
+
+    try:
+        with open(path, encoding='utf-8') as f:
+            content = json.load(f)
+    except (OSError, ValueError) as e:
+        # 잘못된 파일로 분석이 멈추지 않도록 기본 사전만 사용
+        print(f"키워드 사전 로드 실패 ({path}): {e}", file=sys.stderr)
+        content = {}
+
+    _dictionary_file = (path, mtime, content)
+    return mtime, content
+
+def get_matcher(name: str, defaults: Dict[str, List[str]]) -> KeywordMatcher:
+    """
+    사전 이름별 매처 반환 (캐시됨, 사전 파일이 바뀌면 다시 컴파일)
+
+    Args:
+        name: 사전 이름 (keyword_dictionaries.json 의 최상위 키)
+        defaults: 코드에 정의된 기본 사전
+    """
+    mtime, content = _load_dictionary_file()
+
+    cached = _matchers.get(name)
+    if cached is not None and cached[1] == mtime and cached[0] == defaults:
+        return cached[2]
+
+    categories = {category: list(keywords) for category, keywords in defaults.items()}
+    for category, keywords in (content.get(name) or {}).items():
+        merged = categories.setdefault(category, [])
+        merged.extend(keyword for keyword in keywords if keyword not in merged)
+
+    matcher = KeywordMatcher(categories)
+    _matchers[name] = ({category: list(keywords) for category, keywords in defaults.items()}, mtime, matcher)
+    return matcher
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+한국어 문장/단어 토크나이저 (순수 파이썬)
+- 미리 컴파일한 정규식 하나로 텍스트를 한 번만 훑어 문장과 단어를 동시에 분리
+- 결과는 원문 기준 (시작, 끝) 오프셋 → 부분 문자열을 복사하지 않음
+- 한국어 문장 종결(다. 요. 등), 줄바꿈, 글머리 기호(•, ▶ 등), 번호 목록(1. 2) 가.) 처리
+"""
+
+import re
+from typing import List, Tuple
+
+Span = Tuple[int, int]
+
+# 문장을 중간에서도 끊는 글머리 기호
+BULLET_CHARS = '•▶►■□●○◆◇▪◦※'
+
+TOKEN_PATTERN = re.compile(r'''
+    (?P<word>\w+(?:[.+#'\-]\w+)*[+#]*)                           # 단어 (Node.js, C++, 3.5년 포함)
+  | (?P<stop>[.!?…。]+["'”’)\]]*(?=\s|\Z))                        # 문장 종결 부호 (다. 요. ?! 등)
+  | (?P<break>\n|[''' + BULLET_CHARS + r'''])                    # 줄바꿈 / 글머리 기호
+  | (?P<mark>[^\w\s])                                            # 기타 문장부호
+''', re.VERBOSE)
+
+HANGUL_WORD_PATTERN = re.compile(r'[가-힣]+')
+
+# 문장 시작에 오면 문장에 포함하는 여는 괄호/따옴표
+OPENING_MARKS = frozenset('([{<"\'“‘「『【')
+
+# 번호 목록 표시로 볼 단어 (1. 2) 가. 등 - 문장 첫 단어 바로 뒤에 . 또는 ) 가 오고 이어서 공백)
+ENUMERATOR_PATTERN = re.compile(r'\d{1,2}|[가나다라마바사아자차카타파하]')
+
+def _is_enumerator(text: str, word: Span, sentence_words: int) -> bool:
+    """문장의 유일한 단어가 번호 목록 표시인지"""
+    return sentence_words == 1 and ENUMERATOR_PATTERN.fullmatch(text, *word) is not None
+
+def tokenize(text: str) -> Tuple[List[Span], List[Span]]:
+    """
+    문장/단어 오프셋 추출 (한 번의 선형 스캔)
+
+    Args:
+        text: 원문
+
+    Returns:
+        (문장 스팬 목록, 단어 스팬 목록)
+    """
+    sentences = []
+    words = []
+    sentence_start = None
+    opening_start = None
+    sentence_words = 0
+    last_end = 0
+
+    for match in TOKEN_PATTERN.finditer(text):
+        kind = match.lastgroup
+
+        if kind == 'word':
+            if sentence_start is None:
+                sentence_start = match.start() if opening_start is None else opening_start
+                opening_start = None
+                sentence_words = 0
+            words.append(match.span())
+            sentence_words += 1
+            last_end = match.end()
+
+        elif kind == 'mark':
+            # 문장 앞의 기호(-, * 등)는 제외하고 여는 괄호/따옴표만 포함
+            if sentence_start is not None:
+                if (match.group() == ')' and match.start() == words[-1][1]
+                        and (match.end() == len(text) or text[match.end()].isspace())
+                        and _is_enumerator(text, words[-1], sentence_words)):
+                    # "2) 자바 경험" → 번호는 단어/문장에서 제외
+                    words.pop()
+                    sentence_start = None
+                    continue
+                last_end = match.end()
+            elif opening_start is None and match.group() in OPENING_MARKS:
+                opening_start = match.start()
+
+        elif sentence_start is None:
+            opening_start = None
+
+        else:
+            if kind == 'stop':
+                if _is_enumerator(text, words[-1], sentence_words):
+                    # "1. 자바 경험" → 번호는 단어/문장에서 제외
+                    words.pop()
+                    sentence_start = None
+                    continue
+                last_end = match.end()
+
+            sentences.append((sentence_start, last_end))
+            sentence_start = None
+
+    if sentence_start is not None:
+        sentences.append((sentence_start, last_end))
+
+    return sentences, words
+
+def sentence_spans(text: str) -> List[Span]:
+    """문장 오프셋 목록"""
+    return tokenize(text)[0]
+
+def word_spans(text: str) -> List[Span]:
+    """단어 오프셋 목록"""
+    return tokenize(text)[1]
+
+def count_hangul_words(text: str, words: List[Span]) -> int:
+    """한글로만 된 단어 수 (부분 문자열 생성 없이 원문에서 바로 검사)"""
+    fullmatch = HANGUL_WORD_PATTERN.fullmatch
+    return sum(1 for start, end in words if fullmatch(text, start, end))
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+형태소 분석 백엔드
+- Kiwi(프로세스 내), Okt(KoNLPy, JVM), 정규식 대체 구현을 같은 인터페이스로 제공
+- 프로세스당 한 번만 선택/생성해 모든 분석기가 공유 (워커 하나에 모델 하나)
+- MORPH_BACKEND 환경변수: auto(기본, kiwi → okt → regex 순), kiwi, okt, regex
+
+인터페이스:
+  pos(text) → [(토큰, 품사), ...]
+  noun_tags → 명사로 볼 품사 집합
+  has_model → 실제 형태소 분석기 여부 (False면 분석기는 기존 대체 로직 사용)
+"""
+
+import os
+import re
+import sys
+import threading
+from pathlib import Path
+from typing import List, Tuple
+
+# Kiwi 모델은 lib/python/kiwi_model.py 의 프로세스 공용 인스턴스를 사용 (KIWI_NUM_WORKERS 반영)
+LIB_PYTHON_DIR = str(Path(__file__).resolve().parent.parent / 'lib' / 'python')
+if LIB_PYTHON_DIR not in sys.path:
+    sys.path.append(LIB_PYTHON_DIR)
+
+class KiwiBackend:
+    """kiwipiepy (C++ 구현, JVM 불필요)"""
+
+    name = 'kiwi'
+    has_model = True
+    noun_tags = frozenset({'NNG', 'NNP', 'NNB', 'NR', 'NP'})
+
+    def __init__(self):
+        from kiwi_model import get_kiwi
+        self.kiwi = get_kiwi()
+
+    def pos(self, text: str) -> List[Tuple[str, str]]:
+        return [(token.form, token.tag) for token in self.kiwi.tokenize(text)]
+
+class OktBackend:
+    """KoNLPy Okt (JVM 필요 - JAVA_HOME은 배포 환경에서 설정)"""
+
+    name = 'okt'
+    has_model = True
+    noun_tags = frozenset({'Noun'})
+
+    def __init__(self):
+        from konlpy.tag import Okt
+        self.okt = Okt()
+
+    def pos(self, text: str) -> List[Tuple[str, str]]:
+        return self.okt.pos(text)
+
+class RegexBackend:
+    """형태소 분석기가 없을 때 쓰는 정규식 토큰 분리 (조사 분리 없음)"""
+
+    name = 'regex'
+    has_model = False
+    noun_tags = frozenset({'Noun'})
+
+    TOKEN_PATTERN = re.compile(r'(?P<Noun>[가-힣]+)|(?P<Alpha>[A-Za-z]+)|(?P<Number>\d+)|(?P<Punctuation>[^\w\s])')
+
+    def pos(self, text: str) -> List[Tuple[str, str]]:
+        return [(match.group(), match.lastgroup) for match in self.TOKEN_PATTERN.finditer(text)]
+
+BACKENDS = {
+    'kiwi': KiwiBackend,
+    'okt': OktBackend,
+    'regex': RegexBackend,
+}
+
+# auto 선택 시 시도 순서
+AUTO_ORDER = ['kiwi', 'okt', 'regex']
+
+_backend = None
+_backend_lock = threading.Lock()
+
+def _create_backend(choice: str):
+    if choice != 'auto':
+        if choice not in BACKENDS:
+            raise ValueError(f"Unknown MORPH_BACKEND: {choice} (available: auto, {', '.join(BACKENDS)})")
+        return BACKENDS[choice]()
+
+    for name in AUTO_ORDER:
+        try:
+            return BACKENDS[name]()
+        except Exception as e:
+            print(f"형태소 분석 백엔드 {name} 사용 불가: {e}", file=sys.stderr)
+    return RegexBackend()
+
+def get_backend():
+    """프로세스 공용 형태소 분석 백엔드 (처음 호출할 때 생성)"""
+    global _backend
+
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = _create_backend(os.environ.get('MORPH_BACKEND', 'auto').lower())
+    return _backend
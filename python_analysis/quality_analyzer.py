@@ -4,25 +4,16 @@
 import json
 import sys
 import re
-import numpy as np
-import os
 
-# Java 경로 설정
-os.environ['JAVA_HOME'] = '/opt/homebrew/opt/openjdk@17'
-os.environ['PATH'] = f"/opt/homebrew/opt/openjdk@17/bin:{os.environ.get('PATH', '')}"
+from analysis_context import AnalysisContext
+from keyword_matcher import KeywordMatcher
+from morph_backend import get_backend
 
-# KoNLPy 옵션 처리
-KONLPY_AVAILABLE = False
-try:
-    from konlpy.tag import Okt
-    KONLPY_AVAILABLE = True
-except:
-    KONLPY_AVAILABLE = False
+# numpy, 형태소 분석 모델은 가독성 계산에서만 쓰이므로 처음 필요할 때 로드
+# (remove_ai_patterns 같은 가벼운 커맨드의 콜드 스타트 단축)
 
 class QualityAnalyzer:
     def __init__(self):
-        self.okt = Okt() if KONLPY_AVAILABLE else None
-        
         # AI 특유 패턴들
         self.ai_patterns = [
             (r'저는\s+.*?라고\s+생각합니다', ''),
@@ -36,21 +27,53 @@ class QualityAnalyzer:
             (r'인\s+것\s+같습니다', '입니다'),
             (r'되고자\s+합니다', '되겠습니다'),
         ]
+        
+        # STAR 구성요소 표현
+        self.star_keywords = {
+            'situation': ['상황', '환경', '배경', '당시', '때'],
+            'task': ['과제', '목표', '해결', '문제', '임무'],
+            'action': ['시도', '노력', '실행', '진행', '구체적으로'],
+            'result': ['결과', '성과', '달성', '개선', '%', '배'],
+        }
+        
+        # 기업별 인재상 키워드 (매칭되는 기업이 없으면 기본 키워드)
+        self.company_keywords = {
+            '삼성': ['도전', '혁신', '글로벌', '최고', '책임'],
+            'LG': ['고객가치', '정도경영', '인재', '혁신'],
+            '현대': ['도전정신', '창의', '협력', '글로벌'],
+            'SK': ['행복', '성장', '혁신', '사회적가치'],
+        }
+        self.default_company_keywords = ['도전', '성장', '혁신', '책임', '협력']
+        
+        # STAR/키워드 목록 전체를 한 번에 스캔하는 매처 (부분 문자열 기준)
+        self.phrase_scanner = KeywordMatcher({
+            **{f'star_{component}': keywords for component, keywords in self.star_keywords.items()},
+            'company_keyword': sorted({keyword for keywords in self.company_keywords.values() for keyword in keywords}
+                                      | set(self.default_company_keywords)),
+        }, word_boundary=False, ignore_case=False)
     
-    def analyze_only(self, text, company_name=''):
+    @property
+    def morph(self):
+        """프로세스 공용 형태소 분석 백엔드 (처음 접근할 때 로드)"""
+        return get_backend()
+    
+    def analyze_only(self, text, company_name='', context=None):
         """텍스트 품질만 분석 (변경 없음)"""
         try:
+            # STAR/키워드 표현 스캔 (한 번만)
+            hits = self.phrase_scanner.scan(text)
+            
             # 가독성 분석
-            readability = self.calculate_readability(text)
+            readability = self.calculate_readability(text, context)
             
             # AI 패턴 감지
             ai_patterns_detected = self.detect_ai_patterns(text)
             
             # STAR 구조 점수
-            star_score = self.evaluate_star_structure(text)
+            star_score = self.evaluate_star_structure(text, hits)
             
             # 키워드 분석
-            keyword_info = self.analyze_keywords(text, company_name)
+            keyword_info = self.analyze_keywords(text, company_name, hits)
             
             return {
                 'success': True,
@@ -105,12 +128,14 @@ class QualityAnalyzer:
         except Exception as e:
             return {'error': f'AI 패턴 제거 중 오류: {str(e)}'}
     
-    def calculate_readability(self, text):
+    def calculate_readability(self, text, context=None):
         """한국어 가독성 점수 계산"""
+        import numpy as np
+        
         sentences = text.split('.')
         
-        if self.okt:
-            words = self.okt.morphs(text)
+        if self.morph.has_model:
+            words = (context or AnalysisContext(self.morph)).morphs(text)
         else:
             words = text.split()
         
@@ -138,36 +163,32 @@ class QualityAnalyzer:
             count += len(matches)
         return count
     
-    def evaluate_star_structure(self, text):
+    def evaluate_star_structure(self, text, hits=None):
         """STAR 구조 평가"""
-        has_situation = bool(re.search(r'(상황|환경|배경|당시|때)', text))
-        has_task = bool(re.search(r'(과제|목표|해결|문제|임무)', text))
-        has_action = bool(re.search(r'(시도|노력|실행|진행|구체적으로)', text))
-        has_result = bool(re.search(r'(결과|성과|달성|개선|%|배)', text))
+        if hits is None:
+            hits = self.phrase_scanner.scan(text)
         
-        star_score = sum([has_situation, has_task, has_action, has_result]) * 25
+        found_components = sum(1 for component in self.star_keywords if f'star_{component}' in hits)
+        star_score = found_components * 25
         return star_score
     
-    def analyze_keywords(self, text, company_name):
+    def analyze_keywords(self, text, company_name, hits=None):
         """키워드 분석"""
-        company_keywords = {
-            '삼성': ['도전', '혁신', '글로벌', '최고', '책임'],
-            'LG': ['고객가치', '정도경영', '인재', '혁신'],
-            '현대': ['도전정신', '창의', '협력', '글로벌'],
-            'SK': ['행복', '성장', '혁신', '사회적가치'],
-        }
+        if hits is None:
+            hits = self.phrase_scanner.scan(text)
         
         target_keywords = []
-        for company, keywords in company_keywords.items():
+        for company, keywords in self.company_keywords.items():
             if company in company_name:
                 target_keywords = keywords
                 break
         
         if not target_keywords:
-            target_keywords = ['도전', '성장', '혁신', '책임', '협력']
+            target_keywords = self.default_company_keywords
         
         # 키워드 존재 여부 확인
-        found_keywords = sum(1 for kw in target_keywords if kw in text)
+        found_in_text = hits.get('company_keyword', {})
+        found_keywords = sum(1 for kw in target_keywords if kw in found_in_text)
         optimization_score = min(100, (found_keywords / len(target_keywords)) * 100)
         
         return {
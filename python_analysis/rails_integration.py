@@ -7,13 +7,187 @@ Rails 연동 모듈
 """
 
 import sys
+import io
+import itertools
 import json
 import os
+import time
 from pathlib import Path
-from job_posting_analyzer import JobPostingAnalyzer
-from company_analyzer import CompanyAnalyzer
-from enhance_rewrite import RewriteEnhancer
-from quality_analyzer import QualityAnalyzer
+from typing import Iterator, TextIO, Union
+
+import result_cache
+
+# 지원 커맨드 목록
+COMMANDS = ['analyze_job_posting', 'analyze_company', 'enhance_rewrite', 'analyze_quality', 'remove_ai_patterns',
+            'analyze_advanced', 'score_cover_letters']
+
+# 결과 캐시를 쓰는 커맨드 (같은 입력이면 같은 결과인 점수/텍스트 분석만)
+# analyze_job_posting/analyze_company 결과에는 분석 시각(analysis_date)이 들어가므로 제외
+CACHED_COMMANDS = frozenset({'enhance_rewrite', 'analyze_quality', 'remove_ai_patterns', 'analyze_advanced',
+                             'score_cover_letters'})
+
+# 분석기 (모듈명, 클래스명) - 커맨드가 실제로 쓰는 모듈만 import (콜드 스타트 단축)
+ANALYZERS = {
+    'job_posting': ('job_posting_analyzer', 'JobPostingAnalyzer'),
+    'company': ('company_analyzer', 'CompanyAnalyzer'),
+    'rewrite': ('enhance_rewrite', 'RewriteEnhancer'),
+    'quality': ('quality_analyzer', 'QualityAnalyzer'),
+    'advanced': ('advanced_analyzer', 'AdvancedCoverLetterAnalyzer'),
+    'batch': ('batch_scorer', 'BatchScorer'),
+}
+
+# 워커 풀 forkserver에 미리 import할 모듈 (워커들이 copy-on-write로 공유)
+# worker_preload는 import 시 분석기 인스턴스까지 생성 (형태소 분석 백엔드는 워커에서 생성)
+PRELOAD_MODULES = ['rails_integration'] + [module_name for module_name, _ in ANALYZERS.values()] + ['worker_preload']
+
+# 분석기 인스턴스 캐시 (서버 모드에서 프로세스 수명 동안 재사용)
+_analyzers = {}
+
+def _get_analyzer(name: str):
+    """분석기 모듈을 처음 필요할 때 import하고 인스턴스를 재사용"""
+    analyzer = _analyzers.get(name)
+    if analyzer is None:
+        module_name, class_name = ANALYZERS[name]
+        # importlib.import_module은 -X importtime 리포트에 잡히지 않아 __import__ 사용
+        analyzer_class = getattr(__import__(module_name), class_name)
+        analyzer = analyzer_class()
+        _analyzers[name] = analyzer
+    return analyzer
+
+def warm_up_analyzers():
+    """분석기 인스턴스만 미리 생성 (형태소 분석 백엔드는 건드리지 않으므로 fork 전에 호출해도 안전)"""
+    for name in ANALYZERS:
+        _get_analyzer(name)
+
+def warm_up_backend():
+    """형태소 분석 백엔드 로드 (Kiwi 스레드/Okt JVM - fork 이후 프로세스에서 호출)"""
+    from morph_backend import get_backend
+    get_backend()
+
+def warm_up():
+    """모든 분석기와 형태소 분석 백엔드를 미리 생성 (서버 시작 시 호출)"""
+    warm_up_analyzers()
+    warm_up_backend()
+
+def _analyze_job_posting(job_data: dict) -> dict:
+    analyzer = _get_analyzer('job_posting')
+    
+    # 분석 실행
+    result = analyzer.analyze_job_posting(job_data)
+    
+    # 리포트 생성
+    report = analyzer.generate_analysis_report(result)
+    result['report'] = report
+    return result
+
+def _analyze_company(company_data: dict) -> dict:
+    analyzer = _get_analyzer('company')
+    
+    # 분석 실행
+    result = analyzer.analyze_company(company_data)
+    
+    # 리포트 생성
+    report = analyzer.generate_company_report(result)
+    result['report'] = report
+    return result
+
+def _enhance_rewrite(data: dict) -> dict:
+    return _get_analyzer('rewrite').enhance_rewrite(data)
+
+def _analyze_quality(data: dict) -> dict:
+    return _get_analyzer('quality').analyze_only(
+        data.get('text', ''),
+        data.get('company', '')
+    )
+
+def _remove_ai_patterns(data: dict) -> dict:
+    return _get_analyzer('quality').remove_ai_patterns(data.get('text', ''))
+
+def _analyze_advanced(data: dict) -> dict:
+    return _get_analyzer('advanced').analyze(
+        data.get('text', ''),
+        data.get('company'),
+        data.get('position')
+    )
+
+def _score_cover_letters(data: dict) -> dict:
+    documents = data.get('documents', [])
+    scores = _get_analyzer('batch').score(
+        [document.get('text', '') for document in documents],
+        [document.get('company', '') for document in documents]
+    )
+    return {'success': True, 'scores': scores}
+
+COMMAND_HANDLERS = {
+    'analyze_job_posting': _analyze_job_posting,
+    'analyze_company': _analyze_company,
+    'enhance_rewrite': _enhance_rewrite,
+    'analyze_quality': _analyze_quality,
+    'remove_ai_patterns': _remove_ai_patterns,
+    'analyze_advanced': _analyze_advanced,
+    'score_cover_letters': _score_cover_letters,
+}
+
+def _error_result(e: Exception) -> dict:
+    return {
+        'success': False,
+        'error': str(e),
+        'error_type': type(e).__name__
+    }
+
+def execute_command(command: str, data: dict) -> dict:
+    """
+    커맨드 실행 (CLI/서버 공통 진입점)
+    
+    Args:
+        command: 커맨드 이름
+        data: 파싱된 입력 데이터
+        
+    Returns:
+        분석 결과 딕셔너리 (오류 시 success=False)
+    """
+    handler = COMMAND_HANDLERS.get(command)
+    if handler is None:
+        return {
+            'success': False,
+            'error': f'Unknown command: {command}',
+            'available_commands': COMMANDS
+        }
+    
+    # 같은 (커맨드, 입력, 분석기 버전)이면 캐시된 결과 반환
+    cache = result_cache.get_cache() if command in CACHED_COMMANDS else None
+    key = cache.key(command, data) if cache is not None else None
+    if key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    
+    started = time.perf_counter()
+    try:
+        result = handler(data)
+    except Exception as e:
+        return _error_result(e)
+    
+    # 성공한 결과만 캐시 (오류는 입력을 고쳐 다시 시도할 수 있도록)
+    if key is not None and isinstance(result, dict) and not result.get('error') and result.get('success', True):
+        cache.put(key, command, result, time.perf_counter() - started)
+    return result
+
+def cache_stats() -> dict:
+    """결과 캐시 적중/미스 통계"""
+    cache = result_cache.get_cache()
+    if cache is None:
+        return {'success': True, 'enabled': False}
+    return cache.stats()
+
+def _run_from_rails(command: str, json_input: str) -> str:
+    try:
+        data = json.loads(json_input)
+    except Exception as e:
+        result = _error_result(e)
+    else:
+        result = execute_command(command, data)
+    return json.dumps(result, ensure_ascii=False, indent=2)
 
 def analyze_job_posting_from_rails(json_input: str) -> str:
     """
@@ -25,30 +199,7 @@ def analyze_job_posting_from_rails(json_input: str) -> str:
     Returns:
         JSON 형태의 분석 결과
     """
-    try:
-        # JSON 파싱
-        job_data = json.loads(json_input)
-        
-        # 분석기 초기화
-        analyzer = JobPostingAnalyzer()
-        
-        # 분석 실행
-        result = analyzer.analyze_job_posting(job_data)
-        
-        # 리포트 생성
-        report = analyzer.generate_analysis_report(result)
-        result['report'] = report
-        
-        # JSON 반환
-        return json.dumps(result, ensure_ascii=False, indent=2)
-        
-    except Exception as e:
-        error_result = {
-            'success': False,
-            'error': str(e),
-            'error_type': type(e).__name__
-        }
-        return json.dumps(error_result, ensure_ascii=False, indent=2)
+    return _run_from_rails('analyze_job_posting', json_input)
 
 def analyze_company_from_rails(json_input: str) -> str:
     """
@@ -60,30 +211,7 @@ def analyze_company_from_rails(json_input: str) -> str:
     Returns:
         JSON 형태의 분석 결과
     """
-    try:
-        # JSON 파싱
-        company_data = json.loads(json_input)
-        
-        # 분석기 초기화
-        analyzer = CompanyAnalyzer()
-        
-        # 분석 실행
-        result = analyzer.analyze_company(company_data)
-        
-        # 리포트 생성
-        report = analyzer.generate_company_report(result)
-        result['report'] = report
-        
-        # JSON 반환
-        return json.dumps(result, ensure_ascii=False, indent=2)
-        
-    except Exception as e:
-        error_result = {
-            'success': False,
-            'error': str(e),
-            'error_type': type(e).__name__
-        }
-        return json.dumps(error_result, ensure_ascii=False, indent=2)
+    return _run_from_rails('analyze_company', json_input)
 
 def enhance_rewrite_from_rails(json_input: str) -> str:
     """
@@ -95,97 +223,134 @@ def enhance_rewrite_from_rails(json_input: str) -> str:
     Returns:
         JSON 형태의 향상 결과
     """
-    try:
-        # JSON 파싱
-        data = json.loads(json_input)
-        
-        # 향상기 초기화
-        enhancer = RewriteEnhancer()
-        
-        # 향상 실행
-        result = enhancer.enhance_rewrite(data)
-        
-        # JSON 반환
-        return json.dumps(result, ensure_ascii=False, indent=2)
-        
-    except Exception as e:
-        error_result = {
-            'success': False,
-            'error': str(e),
-            'error_type': type(e).__name__
-        }
-        return json.dumps(error_result, ensure_ascii=False, indent=2)
+    return _run_from_rails('enhance_rewrite', json_input)
 
 def analyze_quality_from_rails(json_input: str) -> str:
     """품질 분석만 수행"""
-    try:
-        data = json.loads(json_input)
-        analyzer = QualityAnalyzer()
-        result = analyzer.analyze_only(
-            data.get('text', ''),
-            data.get('company', '')
-        )
-        return json.dumps(result, ensure_ascii=False, indent=2)
-    except Exception as e:
-        error_result = {
-            'success': False,
-            'error': str(e),
-            'error_type': type(e).__name__
-        }
-        return json.dumps(error_result, ensure_ascii=False, indent=2)
+    return _run_from_rails('analyze_quality', json_input)
 
 def remove_ai_patterns_from_rails(json_input: str) -> str:
     """AI 패턴만 제거"""
-    try:
-        data = json.loads(json_input)
-        analyzer = QualityAnalyzer()
-        result = analyzer.remove_ai_patterns(data.get('text', ''))
-        return json.dumps(result, ensure_ascii=False, indent=2)
-    except Exception as e:
-        error_result = {
-            'success': False,
-            'error': str(e),
-            'error_type': type(e).__name__
-        }
-        return json.dumps(error_result, ensure_ascii=False, indent=2)
+    return _run_from_rails('remove_ai_patterns', json_input)
+
+def analyze_advanced_from_rails(json_input: str) -> str:
+    """심층 자소서 분석 (AdvancedCoverLetterAnalyzer)"""
+    return _run_from_rails('analyze_advanced', json_input)
+
+def score_cover_letters_from_rails(json_input: str) -> str:
+    """자소서 여러 건 점수 일괄 계산 ({"documents": [{"text", "company"}]} → 입력 순서대로 scores)"""
+    return _run_from_rails('score_cover_letters', json_input)
+
+def _iter_batch_records(input_stream: TextIO) -> Iterator[Union[dict, Exception]]:
+    """
+    배치 입력에서 레코드를 순서대로 읽음
+    
+    JSON 배열이면 전체를 파싱하고, 아니면 JSONL로 보고 한 줄씩 읽는다.
+    파싱에 실패한 줄은 예외 객체로 전달해 해당 레코드만 오류 처리한다.
+    """
+    first_line = ''
+    for line in input_stream:
+        if line.strip():
+            first_line = line
+            break
+    
+    if first_line.lstrip().startswith('['):
+        try:
+            records = json.loads(first_line + input_stream.read())
+        except Exception as e:
+            yield e
+            return
+        yield from records
+        return
+    
+    for line in itertools.chain([first_line], input_stream):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except Exception as e:
+            yield e
+
+def _run_batch_from_rails(command: str, input_data: Union[str, TextIO]) -> Iterator[str]:
+    """레코드마다 커맨드를 실행해 입력 순서대로 JSONL 한 줄씩 생성"""
+    if isinstance(input_data, str):
+        input_data = io.StringIO(input_data)
+    
+    for record in _iter_batch_records(input_data):
+        if isinstance(record, Exception):
+            result = _error_result(record)
+        else:
+            result = execute_command(command, record)
+        yield json.dumps(result, ensure_ascii=False)
+
+def analyze_job_posting_batch_from_rails(input_data: Union[str, TextIO]) -> Iterator[str]:
+    """채용공고 여러 건 분석 (JSON 배열 또는 JSONL → JSONL)"""
+    return _run_batch_from_rails('analyze_job_posting', input_data)
+
+def analyze_company_batch_from_rails(input_data: Union[str, TextIO]) -> Iterator[str]:
+    """기업 여러 건 분석 (JSON 배열 또는 JSONL → JSONL)"""
+    return _run_batch_from_rails('analyze_company', input_data)
+
+def enhance_rewrite_batch_from_rails(input_data: Union[str, TextIO]) -> Iterator[str]:
+    """텍스트 여러 건 향상 (JSON 배열 또는 JSONL → JSONL)"""
+    return _run_batch_from_rails('enhance_rewrite', input_data)
+
+def analyze_quality_batch_from_rails(input_data: Union[str, TextIO]) -> Iterator[str]:
+    """품질 분석 여러 건 (JSON 배열 또는 JSONL → JSONL)"""
+    return _run_batch_from_rails('analyze_quality', input_data)
+
+def remove_ai_patterns_batch_from_rails(input_data: Union[str, TextIO]) -> Iterator[str]:
+    """AI 패턴 제거 여러 건 (JSON 배열 또는 JSONL → JSONL)"""
+    return _run_batch_from_rails('remove_ai_patterns', input_data)
+
+def analyze_advanced_batch_from_rails(input_data: Union[str, TextIO]) -> Iterator[str]:
+    """심층 자소서 분석 여러 건 (JSON 배열 또는 JSONL → JSONL)"""
+    return _run_batch_from_rails('analyze_advanced', input_data)
 
 def main():
     """메인 함수 - 커맨드라인에서 호출"""
     if len(sys.argv) < 2:
         print("Usage: python rails_integration.py <command> <json_data>")
-        print("Commands: analyze_job_posting, analyze_company, enhance_rewrite, analyze_quality, remove_ai_patterns")
+        print("       python rails_integration.py <command>_batch < records.jsonl")
+        print("       python rails_integration.py serve [--socket PATH] [--workers N]")
+        print("       python rails_integration.py cache_stats | cache_clear")
+        print(f"Commands: {', '.join(COMMANDS)}")
         sys.exit(1)
     
     command = sys.argv[1]
     
+    # 상주 서버 모드 (Unix 소켓)
+    if command == "serve":
+        from analysis_server import serve
+        serve(sys.argv[2:])
+        return
+    
+    # 결과 캐시 통계/비우기
+    if command in ("cache_stats", "cache_clear"):
+        cache = result_cache.get_cache()
+        if command == "cache_clear" and cache is not None:
+            cache.clear()
+        print(json.dumps(cache_stats(), ensure_ascii=False))
+        return
+    
+    # 배치 모드: <command>_batch (JSON 배열 또는 JSONL 입력 → 입력 순서대로 JSONL 출력)
+    if command.endswith('_batch') and command[:-len('_batch')] in COMMAND_HANDLERS:
+        if len(sys.argv) > 2 and sys.argv[2] != '-':
+            input_data = sys.argv[2]
+        else:
+            input_data = sys.stdin
+        
+        for line in _run_batch_from_rails(command[:-len('_batch')], input_data):
+            print(line, flush=True)
+        return
+    
     # JSON 데이터를 stdin 또는 argv에서 받기
     if len(sys.argv) > 2 and sys.argv[2] != '-':
         json_data = sys.argv[2]
     else:
         json_data = sys.stdin.read()
     
-    if command == "analyze_job_posting":
-        result = analyze_job_posting_from_rails(json_data)
-        print(result)
-    elif command == "analyze_company":
-        result = analyze_company_from_rails(json_data)
-        print(result)
-    elif command == "enhance_rewrite":
-        result = enhance_rewrite_from_rails(json_data)
-        print(result)
-    elif command == "analyze_quality":
-        result = analyze_quality_from_rails(json_data)
-        print(result)
-    elif command == "remove_ai_patterns":
-        result = remove_ai_patterns_from_rails(json_data)
-        print(result)
-    else:
-        error_result = {
-            'success': False,
-            'error': f'Unknown command: {command}',
-            'available_commands': ['analyze_job_posting', 'analyze_company', 'enhance_rewrite', 'analyze_quality', 'remove_ai_patterns']
-        }
-        print(json.dumps(error_result, ensure_ascii=False, indent=2))
+    print(_run_from_rails(command, json_data))
 
 if __name__ == "__main__":
     main()
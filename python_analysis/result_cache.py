@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+분석 결과 캐시
+- 키: (커맨드, 정규화된 입력 JSON, 분석기 버전)의 SHA-256
+- 분석기 버전: ANALYSIS_CODE_VERSION (배포 시 지정, 예: git 커밋) 또는 분석 스크립트 파일의 mtime/크기
+- 1단계: 프로세스 메모리 LRU (엔트리 수 제한)
+- 2단계: SQLite 디스크 캐시 (TTL + 전체 크기 제한, 오래 안 쓴 항목부터 삭제)
+- 적중/미스 횟수와 절약한 계산 시간 집계 (워커 간 누적값은 SQLite에 주기적으로 기록)
+
+환경변수:
+  ANALYSIS_CACHE=0                    캐시 끄기
+  ANALYSIS_CACHE_PATH                 SQLite 파일 경로 (빈 값이면 메모리 캐시만)
+  ANALYSIS_CACHE_MEMORY_ENTRIES       메모리 LRU 엔트리 수 (기본 256)
+  ANALYSIS_CACHE_MAX_MB               디스크 캐시 최대 크기 (기본 256MB)
+  ANALYSIS_CACHE_TTL_HOURS            디스크 캐시 유효 기간 (기본 168시간)
+  ANALYSIS_CODE_VERSION               분석기 버전 (없으면 소스 파일 mtime/크기로 계산)
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from keyword_matcher import DEFAULT_DICTIONARY_PATH
+
+SCRIPT_DIR = Path(__file__).parent
+
+DEFAULT_CACHE_PATH = str(SCRIPT_DIR.parent / 'tmp' / 'cache' / 'python_analysis_cache.sqlite3')
+
+# 누적 카운터를 디스크에 기록하는 주기 (이벤트 수)
+COUNTER_FLUSH_INTERVAL = 32
+
+# 디스크 정리(만료/크기 초과 삭제)를 검사하는 주기 (저장 횟수)
+EVICTION_CHECK_INTERVAL = 64
+
+COUNTER_NAMES = ('memory_hits', 'disk_hits', 'misses', 'stores', 'evictions', 'saved_seconds')
+
+_code_version = None
+
+def code_version() -> str:
+    """분석기 버전 (코드가 바뀌면 이전 결과는 자동으로 무효)
+    콜드 스타트 경로이므로 소스 내용은 읽지 않음: 배포 버전이 없으면 파일 stat 만 사용"""
+    global _code_version
+
+    if _code_version is None:
+        _code_version = os.environ.get('ANALYSIS_CODE_VERSION')
+        if not _code_version:
+            digest = hashlib.sha256()
+            for path in sorted(SCRIPT_DIR.glob('*.py')):
+                stat = path.stat()
+                digest.update(f'{path.name}:{stat.st_mtime_ns}:{stat.st_size}\0'.encode('utf-8'))
+            _code_version = digest.hexdigest()[:16]
+    return _code_version
+
+def _runtime_version() -> str:
+    """결과에 영향을 주는 실행 환경 (형태소 분석 백엔드, 키워드 사전 파일)"""
+    dictionary_path = os.environ.get('KEYWORD_DICTIONARY_PATH', DEFAULT_DICTIONARY_PATH)
+    try:
+        dictionary_mtime = os.stat(dictionary_path).st_mtime
+    except OSError:
+        dictionary_mtime = None
+    return f"{os.environ.get('MORPH_BACKEND', 'auto')}:{dictionary_mtime}"
+
+class ResultCache:
+    """메모리 LRU + SQLite 2단계 결과 캐시"""
+
+    def __init__(self, path: Optional[str], memory_entries: int = 256,
+                 max_bytes: int = 256 * 1024 * 1024, ttl_seconds: float = 7 * 24 * 3600):
+        self.path = path or None
+        self.memory_entries = memory_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        self._conn_pid = None
+        self._stores_since_eviction = 0
+
+        self.counters = dict.fromkeys(COUNTER_NAMES, 0)
+        self._unflushed = dict.fromkeys(COUNTER_NAMES, 0)
+        self._unflushed_events = 0
+
+        if self.path:
+            atexit.register(self.flush_counters)
+
+    def key(self, command: str, data: Any) -> str:
+        """캐시 키 (입력은 키 순서/공백과 무관한 JSON으로 정규화)"""
+        canonical = json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+        material = '\0'.join((command, canonical, code_version(), _runtime_version()))
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """캐시된 결과 (없거나 만료되면 None)"""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                value, compute_seconds = entry
+                self._count('memory_hits', compute_seconds)
+                return json.loads(value)
+
+            row = self._disk_get(key)
+            if row is None:
+                self._count('misses')
+                return None
+
+            value, compute_seconds = row
+            self._memory_put(key, value, compute_seconds)
+            self._count('disk_hits', compute_seconds)
+            return json.loads(value)
+
+    def put(self, key: str, command: str, result: Dict, compute_seconds: float):
+        """결과 저장 (JSON으로 직렬화할 수 없는 결과는 저장하지 않음)"""
+        try:
+            value = json.dumps(result, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return
+
+        with self._lock:
+            self._memory_put(key, value, compute_seconds)
+            self._disk_put(key, command, value, compute_seconds)
+            self._count('stores')
+
+    def stats(self) -> Dict[str, Any]:
+        """적중률/절약 시간 (현재 프로세스 + 디스크 누적)"""
+        with self._lock:
+            lookups = self.counters['memory_hits'] + self.counters['disk_hits'] + self.counters['misses']
+            hits = self.counters['memory_hits'] + self.counters['disk_hits']
+            stats = {
+                'success': True,
+                'enabled': True,
+                'memory_entries': len(self._memory),
+                'memory_capacity': self.memory_entries,
+                'process': {
+                    **self.counters,
+                    'saved_seconds': round(self.counters['saved_seconds'], 3),
+                    'hit_rate': round(hits / lookups, 3) if lookups else 0.0
+                },
+                'disk': self._disk_stats()
+            }
+        return stats
+
+    def clear(self):
+        """메모리/디스크 캐시 비우기"""
+        with self._lock:
+            self._memory.clear()
+            conn = self._connection()
+            if conn is not None:
+                self._execute(conn, 'DELETE FROM results')
+
+    def flush_counters(self):
+        """누적 카운터를 디스크에 기록 (워커 프로세스 간 합산용)"""
+        with self._lock:
+            self._flush_counters()
+
+    def _count(self, name: str, compute_seconds: float = 0.0):
+        self.counters[name] += 1
+        self._unflushed[name] += 1
+        if compute_seconds:
+            self.counters['saved_seconds'] += compute_seconds
+            self._unflushed['saved_seconds'] += compute_seconds
+
+        self._unflushed_events += 1
+        if self._unflushed_events >= COUNTER_FLUSH_INTERVAL:
+            self._flush_counters()
+
+    def _memory_put(self, key: str, value: str, compute_seconds: float):
+        self._memory[key] = (value, compute_seconds)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if not self.path:
+            return None
+
+        # fork된 워커는 부모의 연결을 쓰지 않고 새로 연결
+        if self._conn is None or self._conn_pid != os.getpid():
+            try:
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False, isolation_level=None)
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.execute('PRAGMA synchronous=NORMAL')
+                conn.execute('''CREATE TABLE IF NOT EXISTS results (
+                    key TEXT PRIMARY KEY,
+                    command TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    compute_seconds REAL NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )''')
+                conn.execute('CREATE INDEX IF NOT EXISTS results_accessed_at ON results (accessed_at)')
+                conn.execute('CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value REAL NOT NULL)')
+            except sqlite3.Error as e:
+                # 디스크 캐시를 쓸 수 없으면 메모리 캐시만 사용
+                print(f"분석 캐시 DB 사용 불가 ({self.path}): {e}", file=sys.stderr)
+                self.path = None
+                return None
+
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def _execute(self, conn: sqlite3.Connection, sql: str, params=()):
+        try:
+            return conn.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            print(f"분석 캐시 DB 오류: {e}", file=sys.stderr)
+            return None
+
+    def _disk_get(self, key: str):
+        conn = self._connection()
+        if conn is None:
+            return None
+
+        rows = self._execute(conn, 'SELECT value, compute_seconds, created_at FROM results WHERE key = ?', (key,))
+        if not rows:
+            return None
+
+        value, compute_seconds, created_at = rows[0]
+        now = time.time()
+        if now - created_at > self.ttl_seconds:
+            self._execute(conn, 'DELETE FROM results WHERE key = ?', (key,))
+            return None
+
+        self._execute(conn, 'UPDATE results SET accessed_at = ? WHERE key = ?', (now, key))
+        return value, compute_seconds
+
+    def _disk_put(self, key: str, command: str, value: str, compute_seconds: float):
+        conn = self._connection()
+        if conn is None:
+            return
+
+        now = time.time()
+        self._execute(conn, 'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)',
+                      (key, command, value, len(value.encode('utf-8')), compute_seconds, now, now))
+
+        self._stores_since_eviction += 1
+        if self._stores_since_eviction >= EVICTION_CHECK_INTERVAL:
+            self._stores_since_eviction = 0
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection):
+        """만료 항목 삭제 후, 크기 제한을 넘으면 오래 안 쓴 항목부터 90%까지 삭제"""
+        now = time.time()
+        evicted = self._execute(conn, 'DELETE FROM results WHERE created_at < ? RETURNING key',
+                                (now - self.ttl_seconds,)) or []
+
+        rows = self._execute(conn, 'SELECT COALESCE(SUM(size), 0) FROM results')
+        total = rows[0][0] if rows else 0
+        if total > self.max_bytes:
+            target = self.max_bytes * 0.9
+            victims = []
+            for key, size in self._execute(conn, 'SELECT key, size FROM results ORDER BY accessed_at') or []:
+                if total <= target:
+                    break
+                victims.append((key,))
+                total -= size
+            try:
+                conn.executemany('DELETE FROM results WHERE key = ?', victims)
+            except sqlite3.Error as e:
+                print(f"분석 캐시 DB 오류: {e}", file=sys.stderr)
+                victims = []
+            evicted += victims
+
+        for _ in evicted:
+            self._count('evictions')
+
+    def _flush_counters(self):
+        self._unflushed_events = 0
+        conn = self._connection()
+        if conn is None:
+            return
+
+        deltas = [(name, value) for name, value in self._unflushed.items() if value]
+        if not deltas:
+            return
+        try:
+            conn.executemany('INSERT INTO counters VALUES (?, ?) '
+                             'ON CONFLICT(name) DO UPDATE SET value = value + excluded.value', deltas)
+        except sqlite3.Error as e:
+            print(f"분석 캐시 DB 오류: {e}", file=sys.stderr)
+            return
+        self._unflushed = dict.fromkeys(COUNTER_NAMES, 0)
+
+    def _disk_stats(self) -> Dict[str, Any]:
+        conn = self._connection()
+        if conn is None:
+            return {'enabled': False}
+
+        self._flush_counters()
+        rows = self._execute(conn, 'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results') or [(0, 0)]
+        totals = dict(self._execute(conn, 'SELECT name, value FROM counters') or [])
+        hits = totals.get('memory_hits', 0) + totals.get('disk_hits', 0)
+        lookups = hits + totals.get('misses', 0)
+
+        return {
+            'enabled': True,
+            'path': self.path,
+            'entries': rows[0][0],
+            'bytes': rows[0][1],
+            'max_bytes': self.max_bytes,
+            'ttl_seconds': self.ttl_seconds,
+            'lifetime': {
+                **{name: int(totals.get(name, 0)) for name in COUNTER_NAMES if name != 'saved_seconds'},
+                'saved_seconds': round(totals.get('saved_seconds', 0.0), 3),
+                'hit_rate': round(hits / lookups, 3) if lookups else 0.0
+            }
+        }
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_cache() -> Optional[ResultCache]:
+    """프로세스 공용 결과 캐시 (ANALYSIS_CACHE=0 이면 None)"""
+    global _cache
+
+    if os.environ.get('ANALYSIS_CACHE', '1') == '0':
+        return None
+
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResultCache(
+                    os.environ.get('ANALYSIS_CACHE_PATH', DEFAULT_CACHE_PATH),
+                    memory_entries=int(os.environ.get('ANALYSIS_CACHE_MEMORY_ENTRIES', '256')),
+                    max_bytes=int(float(os.environ.get('ANALYSIS_CACHE_MAX_MB', '256')) * 1024 * 1024),
+                    ttl_seconds=float(os.environ.get('ANALYSIS_CACHE_TTL_HOURS', '168')) * 3600
+                )
+    return _cache
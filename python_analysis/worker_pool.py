@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+분석 워커 풀
+- 분석기 모듈 import + 분석기 인스턴스 생성까지 끝낸 forkserver에서 워커 N개를 미리 fork (copy-on-write 공유)
+  형태소 분석 백엔드(Kiwi 스레드 풀, Okt JVM)만 워커마다 fork 이후 생성
+- 크기 제한이 있는 작업 큐 (가득 차면 즉시 거절 = 백프레셔)
+- 작업별 타임아웃 (초과 시 워커 교체), M개 작업 처리 후 워커 재활용
+- 큐 길이와 워커별 사용률, 워커 결과 캐시 합계를 보고하는 status 제공
+- 워커의 Kiwi 스레드 수는 KIWI_NUM_WORKERS로 고정 (기본 1 - 워커 N개 × 모든 코어 스레드 방지)
+"""
+
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Optional
+
+import rails_integration
+import result_cache
+
+# 워커 준비 완료 대기 시간 (KoNLPy JVM 기동 포함)
+WORKER_READY_TIMEOUT = 120.0
+
+# 워커당 Kiwi 스레드 수 (병렬성은 워커 수로 확보)
+WORKER_KIWI_THREADS = 1
+
+def _worker_main(conn, kiwi_threads: int):
+    """워커 프로세스 루프: (command, data)를 받아 결과를 돌려줌"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    os.environ['KIWI_NUM_WORKERS'] = str(kiwi_threads)
+
+    # 분석기는 forkserver(worker_preload)에서 이미 생성됨 - JVM/스레드를 쓰는 형태소 분석 백엔드만 여기서 생성
+    rails_integration.warm_up_backend()
+    conn.send('ready')
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+
+        command, data = message
+        result = rails_integration.execute_command(command, data)
+        conn.send((result, _cache_counters()))
+
+def _cache_counters() -> Optional[Dict[str, float]]:
+    """워커의 결과 캐시 누적 카운터 (결과와 함께 보내 서버에서 합산)"""
+    cache = result_cache.get_cache()
+    return dict(cache.counters) if cache is not None else None
+
+def _shutting_down_result() -> Dict[str, Any]:
+    return {
+        'success': False,
+        'error': 'Analysis server is shutting down',
+        'error_type': 'ShuttingDown'
+    }
+
+class _Job:
+    """큐에 들어가는 작업 하나"""
+
+    def __init__(self, command: str, data: Dict[str, Any]):
+        self.command = command
+        self.data = data
+        self.result = None
+        self.done = threading.Event()
+
+    def finish(self, result: Dict[str, Any]):
+        self.result = result
+        self.done.set()
+
+class _WorkerSlot:
+    """워커 프로세스 하나와 그 통계"""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.process = None
+        self.conn = None
+        self.started_at = time.monotonic()
+        self.jobs_since_spawn = 0
+        self.total_jobs = 0
+        self.busy_seconds = 0.0
+        self.busy_since = None
+        self.restarts = 0
+        self.timeouts = 0
+        # 디스패치 스레드와 shutdown이 같은 파이프를 동시에 쓰지 않도록
+        self.lock = threading.Lock()
+        # 현재 워커의 캐시 카운터 + 교체된 워커들의 카운터 합
+        self.cache_counters = None
+        self.retired_cache_counters = Counter()
+
+    def utilisation(self, now: float) -> float:
+        busy = self.busy_seconds
+        if self.busy_since is not None:
+            busy += now - self.busy_since
+        elapsed = now - self.started_at
+        return busy / elapsed if elapsed > 0 else 0.0
+
+class WorkerPool:
+    """사전 fork된 분석 워커 풀"""
+
+    def __init__(self, size: int, max_jobs_per_worker: int = 500,
+                 job_timeout: float = 60.0, queue_size: int = 64,
+                 kiwi_threads: int = WORKER_KIWI_THREADS):
+        self.size = size
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.job_timeout = job_timeout
+        self.queue_size = queue_size
+        self.kiwi_threads = kiwi_threads
+
+        self._jobs = queue.Queue(maxsize=queue_size)
+        self._slots = [_WorkerSlot(i) for i in range(size)]
+        self._threads = []
+        self._rejected = 0
+        self._stats_lock = threading.Lock()
+        # shutdown 이후 들어온 작업이 워커 없는 큐에 남지 않도록 종료 여부 확인과 큐 삽입을 함께 잠금
+        self._state_lock = threading.Lock()
+        self._closed = False
+
+        # 분석기 모듈을 forkserver에 미리 import → 워커들이 메모리를 공유
+        self._context = multiprocessing.get_context('forkserver')
+        self._context.set_forkserver_preload(rails_integration.PRELOAD_MODULES)
+
+    def start(self):
+        """워커를 띄우고 슬롯별 디스패치 스레드 시작"""
+        for slot in self._slots:
+            self._spawn(slot)
+
+        for slot in self._slots:
+            thread = threading.Thread(target=self._run_slot, args=(slot,),
+                                      name=f'analysis-worker-{slot.index}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, command: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """작업 실행 후 결과 반환 (큐가 가득 차면 즉시 오류 반환)"""
+        job = _Job(command, data)
+        try:
+            with self._state_lock:
+                if self._closed:
+                    return _shutting_down_result()
+                self._jobs.put_nowait(job)
+        except queue.Full:
+            with self._stats_lock:
+                self._rejected += 1
+            return {
+                'success': False,
+                'error': f'Analysis queue is full ({self.queue_size} pending jobs)',
+                'error_type': 'QueueFull'
+            }
+
+        job.done.wait()
+        return job.result
+
+    def status(self) -> Dict[str, Any]:
+        """큐 길이와 워커별 사용률"""
+        now = time.monotonic()
+        workers = []
+        for slot in self._slots:
+            workers.append({
+                'index': slot.index,
+                'pid': slot.process.pid if slot.process else None,
+                'busy': slot.busy_since is not None,
+                'jobs_since_spawn': slot.jobs_since_spawn,
+                'total_jobs': slot.total_jobs,
+                'restarts': slot.restarts,
+                'timeouts': slot.timeouts,
+                'utilisation': round(slot.utilisation(now), 3)
+            })
+
+        return {
+            'success': True,
+            'queue_depth': self._jobs.qsize(),
+            'queue_capacity': self.queue_size,
+            'rejected_jobs': self._rejected,
+            'max_jobs_per_worker': self.max_jobs_per_worker,
+            'job_timeout': self.job_timeout,
+            'workers': workers
+        }
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """워커들의 결과 캐시 카운터 합계 (교체된 워커 포함)"""
+        totals = Counter()
+        enabled = False
+        for slot in self._slots:
+            totals.update(slot.retired_cache_counters)
+            counters = slot.cache_counters
+            if counters is not None:
+                enabled = True
+                totals.update(counters)
+
+        if not enabled and not totals:
+            return {'success': True, 'enabled': False}
+
+        hits = totals['memory_hits'] + totals['disk_hits']
+        lookups = hits + totals['misses']
+        return {
+            'success': True,
+            'enabled': True,
+            'workers': {
+                **{name: totals[name] for name in result_cache.COUNTER_NAMES},
+                'saved_seconds': round(totals['saved_seconds'], 3),
+                'hit_rate': round(hits / lookups, 3) if lookups else 0.0
+            }
+        }
+
+    def shutdown(self):
+        """워커 종료 (대기 중인 작업은 오류로 끝내고, 실행 중인 작업은 끝날 때까지 기다림)"""
+        with self._state_lock:
+            self._closed = True
+        while True:
+            try:
+                job = self._jobs.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                job.finish(_shutting_down_result())
+
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join(timeout=self.job_timeout + 5)
+
+        for slot in self._slots:
+            with slot.lock:
+                self._stop_worker(slot)
+
+    def _spawn(self, slot: _WorkerSlot):
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(target=_worker_main, args=(child_conn, self.kiwi_threads),
+                                        name=f'analysis-worker-{slot.index}', daemon=True)
+        process.start()
+        child_conn.close()
+
+        slot.process = process
+        slot.conn = parent_conn
+        slot.jobs_since_spawn = 0
+
+        # 워커 워밍업 완료 대기 (작업 타임아웃에 워밍업 시간이 섞이지 않도록)
+        try:
+            ready = parent_conn.poll(WORKER_READY_TIMEOUT) and parent_conn.recv() == 'ready'
+        except (EOFError, OSError):
+            ready = False
+        if not ready:
+            raise RuntimeError(f'analysis worker {slot.index} failed to start')
+
+    def _stop_worker(self, slot: _WorkerSlot, graceful: bool = True):
+        if slot.process is None:
+            return
+
+        if graceful:
+            try:
+                slot.conn.send(None)
+            except (OSError, ValueError):
+                pass
+            slot.process.join(timeout=5)
+
+        if slot.process.is_alive():
+            slot.process.kill()
+            slot.process.join()
+
+        slot.conn.close()
+        slot.process = None
+        slot.conn = None
+        if slot.cache_counters is not None:
+            slot.retired_cache_counters.update(slot.cache_counters)
+            slot.cache_counters = None
+
+    def _replace_worker(self, slot: _WorkerSlot, graceful: bool):
+        self._stop_worker(slot, graceful=graceful)
+        if self._closed:
+            return
+
+        slot.restarts += 1
+        try:
+            self._spawn(slot)
+        except RuntimeError:
+            # 다음 작업에서 다시 시도
+            self._stop_worker(slot, graceful=False)
+
+    def _run_slot(self, slot: _WorkerSlot):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+
+            with slot.lock:
+                job.finish(self._execute(slot, job))
+
+                # M개 처리 후 워커 재활용 (메모리 누수/단편화 방지)
+                if slot.process is not None and slot.jobs_since_spawn >= self.max_jobs_per_worker:
+                    self._replace_worker(slot, graceful=True)
+
+    def _execute(self, slot: _WorkerSlot, job: _Job) -> Dict[str, Any]:
+        if slot.process is None:
+            self._replace_worker(slot, graceful=False)
+            if slot.process is None:
+                return {
+                    'success': False,
+                    'error': f'analysis worker {slot.index} is unavailable',
+                    'error_type': 'WorkerUnavailable'
+                }
+
+        broken = False
+        slot.busy_since = time.monotonic()
+        try:
+            slot.conn.send((job.command, job.data))
+
+            if slot.conn.poll(self.job_timeout):
+                result, slot.cache_counters = slot.conn.recv()
+            else:
+                slot.timeouts += 1
+                broken = True
+                result = {
+                    'success': False,
+                    'error': f'Analysis timed out after {self.job_timeout}s',
+                    'error_type': 'TimeoutError'
+                }
+        except (EOFError, OSError) as e:
+            # 워커 비정상 종료
+            broken = True
+            result = rails_integration._error_result(e)
+        finally:
+            slot.busy_seconds += time.monotonic() - slot.busy_since
+            slot.busy_since = None
+            slot.jobs_since_spawn += 1
+            slot.total_jobs += 1
+
+        if broken:
+            self._replace_worker(slot, graceful=False)
+
+        return result
@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+워커 풀 forkserver 사전 로드 모듈
+- forkserver가 import할 때 분석기 인스턴스(패턴/사전/키워드 매처)를 생성 → fork된 워커들이 copy-on-write로 공유
+- 형태소 분석 백엔드(Kiwi 스레드 풀, Okt JVM)는 fork 후에 안전하지 않으므로 워커마다 따로 생성
+"""
+
+import rails_integration
+
+rails_integration.warm_up_analyzers()
@@ -0,0 +1,54 @@
+require "test_helper"
+require "open3"
+
+class PythonBatchScoringTest < ActiveSupport::TestCase
+  SCRIPTS_PATH = Rails.root.join("python_analysis").to_s
+
+  # 배치 채점 결과를 문서별 분석기 결과와 비교해 다른 문서 수를 출력
+  PARITY_CODE = <<~PYTHON
+    import json, sys
+    from batch_scorer import BatchScorer
+
+    documents = json.load(sys.stdin)
+    scorer = BatchScorer()
+    batch = scorer.score([d["text"] for d in documents], [d["company"] for d in documents])
+
+    mismatches = 0
+    for document, scores in zip(documents, batch):
+        text, company = document["text"], document["company"]
+        advanced = scorer.advanced.analyze(text)
+        quality = scorer.quality.analyze_only(text, company)
+        expected = {
+            "advanced": {key: advanced[key] for key in ("readability", "ai_detection", "star_compliance", "authenticity", "quality_score")},
+            "interactive": scorer.interactive.calculate_quality_score(text),
+            "quality": {
+                "readability": quality["before_metrics"]["readability"],
+                "ai_patterns_detected": quality["ai_patterns_detected"],
+                "ai_naturalness": quality["improvements"]["ai_naturalness"],
+                "keyword_optimization": quality["improvements"]["keyword_optimization"],
+                "structure_score": quality["improvements"]["structure_score"],
+            },
+        }
+        if json.dumps(expected, sort_keys=True) != json.dumps(scores, sort_keys=True):
+            mismatches += 1
+    print(mismatches)
+  PYTHON
+
+  DOCUMENTS = [
+    { text: "저는 당시 팀 프로젝트에서 목표를 세우고 실행하여 3개월 만에 성과를 20% 향상시켰습니다. 이러한 경험을 통해 다양한 문제를 해결했습니다.", company: "삼성전자" },
+    { text: "열정과 도전정신으로 귀사에 기여하겠습니다. 뿐만 아니라 글로벌 시너지를 만들 것입니다.", company: "LG" },
+    { text: "Python과 AWS로 데이터팀 시스템을 설계했습니다.\n\n결과적으로 처리 시간이 절반으로 줄었습니다.", company: "" },
+    { text: "짧은 답변", company: "카카오" },
+    { text: "...", company: "" }
+  ].freeze
+
+  test "batch scores match the per-document analyzers" do
+    skip "python3 not available" unless system("python3", "--version", out: File::NULL, err: File::NULL)
+    skip "numpy not available" unless system("python3", "-c", "import numpy", out: File::NULL, err: File::NULL)
+
+    output, error, status = Open3.capture3("python3", "-c", PARITY_CODE, stdin_data: DOCUMENTS.to_json, chdir: SCRIPTS_PATH)
+
+    assert status.success?, error
+    assert_equal "0", output.strip
+  end
+end
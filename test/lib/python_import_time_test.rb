@@ -0,0 +1,34 @@
+require "test_helper"
+require "open3"
+require "json"
+
+class PythonImportTimeTest < ActiveSupport::TestCase
+  CHECK_SCRIPT = Rails.root.join("python_analysis", "import_time_check.py").to_s
+
+  # 벽시계 시간 예산은 머신 부하에 따라 흔들리므로 PYTHON_IMPORT_BUDGET_MS 를 줄 때만 검사
+  def check(command, budget_ms: ENV["PYTHON_IMPORT_BUDGET_MS"])
+    args = [ "python3", CHECK_SCRIPT, "--command", command ]
+    args += [ "--budget-ms", budget_ms ] if budget_ms.present?
+
+    output, error, status = Open3.capture3(*args)
+    [ JSON.parse(output), error, status ]
+  end
+
+  test "remove_ai_patterns does not load heavy modules" do
+    skip "python3 not available" unless system("python3", "--version", out: File::NULL, err: File::NULL)
+
+    report, error, status = check("remove_ai_patterns", budget_ms: nil)
+
+    assert_empty report["heavy_modules_loaded"]
+    assert status.success?, error
+  end
+
+  test "remove_ai_patterns cold start stays within the import budget" do
+    skip "set PYTHON_IMPORT_BUDGET_MS to check import time" if ENV["PYTHON_IMPORT_BUDGET_MS"].blank?
+    skip "python3 not available" unless system("python3", "--version", out: File::NULL, err: File::NULL)
+
+    report, error, status = check("remove_ai_patterns")
+
+    assert status.success?, "import budget exceeded (#{report["total_import_ms"]}ms):\n#{error}"
+  end
+end
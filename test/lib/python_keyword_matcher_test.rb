@@ -0,0 +1,34 @@
+require "test_helper"
+require "open3"
+require "json"
+
+class PythonKeywordMatcherTest < ActiveSupport::TestCase
+  SCRIPTS_PATH = Rails.root.join("python_analysis").to_s
+
+  FOUND_CODE = <<~PYTHON
+    import json, sys
+    from keyword_matcher import KeywordMatcher
+
+    matcher = KeywordMatcher({"languages": ["Python", "Java", "JavaScript", "C++", "C#", "Go"]})
+    print(json.dumps({text: matcher.found(text).get("languages", []) for text in json.load(sys.stdin)}, ensure_ascii=False))
+  PYTHON
+
+  def found(texts)
+    output, error, status = Open3.capture3("python3", "-c", FOUND_CODE, stdin_data: texts.to_json, chdir: SCRIPTS_PATH)
+    assert status.success?, error
+    JSON.parse(output)
+  end
+
+  test "symbol-terminated keywords match before punctuation and attached Hangul particles" do
+    skip "python3 not available" unless system("python3", "--version", out: File::NULL, err: File::NULL)
+
+    result = found([ "C++개발 경험", "C#, Java 가능", "C#으로 개발", "C++ 개발", "C++x", "JavaScript 개발" ])
+
+    assert_equal [ "C++" ], result["C++개발 경험"]
+    assert_equal [ "Java", "C#" ], result["C#, Java 가능"]
+    assert_equal [ "C#" ], result["C#으로 개발"]
+    assert_equal [ "C++" ], result["C++ 개발"]
+    assert_empty result["C++x"]
+    assert_equal [ "JavaScript" ], result["JavaScript 개발"]
+  end
+end
@@ -0,0 +1,84 @@
+require "test_helper"
+require "open3"
+require "json"
+
+class PythonKoreanTextAnalyzerTest < ActiveSupport::TestCase
+  SCRIPTS_PATH = Rails.root.join("lib", "python").to_s
+
+  PARSE_CODE = <<~PYTHON
+    import json, sys
+    from korean_text_analyzer import KoreanTextAnalyzer
+
+    print(json.dumps(KoreanTextAnalyzer().parse_numbered_items(sys.stdin.read()), ensure_ascii=False))
+  PYTHON
+
+  # 한 줄씩 스트리밍한 결과와 전체 파싱 결과를 함께 출력
+  STREAM_CODE = <<~PYTHON
+    import json, sys
+    from korean_text_analyzer import KoreanTextAnalyzer, StreamingItemParser
+
+    analyzer = KoreanTextAnalyzer()
+    text = sys.stdin.read()
+    parser = StreamingItemParser(analyzer)
+    streamed = [item for line in text.splitlines(keepends=True) for item in parser.feed(line)] + parser.close()
+    print(json.dumps({"streamed": streamed, "parsed": analyzer.parse_numbered_items(text)}, ensure_ascii=False))
+  PYTHON
+
+  # GPT 분석 결과: N. **제목** 아래 #### 1) ~ #### 2) 소제목
+  SUBHEADING_ANALYSIS = <<~TEXT
+    1. **고객 중심적 사고와 실질적 성과 도출 능력**
+    #### 1) 자소서 내용 인용과 첫인상
+    "고객 불만을 분석해 응답 시간을 40% 줄였습니다"라는 문장이 눈에 띕니다.
+    #### 2) HR 관점에서 왜 좋은지
+    수치로 성과를 증명했습니다.
+
+    2. **데이터 기반 문제 해결 역량**
+    #### 1) 자소서 내용 인용과 첫인상
+    로그 분석으로 이탈 원인을 찾았습니다.
+    #### 2) HR 관점에서 왜 좋은지
+    가설과 검증 과정이 분명합니다.
+
+    ## 총평
+    전반적으로 구체적인 자소서입니다.
+  TEXT
+
+  def parse(text, code: PARSE_CODE)
+    output, error, status = Open3.capture3("python3", "-c", code, stdin_data: text, chdir: SCRIPTS_PATH)
+    assert status.success?, error
+    JSON.parse(output)
+  end
+
+  test "numbered items keep their #### sub-headed content" do
+    skip "python3 not available" unless system("python3", "--version", out: File::NULL, err: File::NULL)
+
+    items = parse(SUBHEADING_ANALYSIS)
+
+    assert_equal [ "1", "2" ], items.map { |item| item["number"] }
+    assert_equal "데이터 기반 문제 해결 역량", items[1]["title"]
+    assert_includes items[0]["content"], "응답 시간을 40% 줄였습니다"
+    assert_includes items[0]["content"], "#### 2) HR 관점에서 왜 좋은지"
+    assert_includes items[0]["content"], "수치로 성과를 증명했습니다."
+    assert_includes items[1]["content"], "가설과 검증 과정이 분명합니다."
+    refute_includes items[1]["content"], "총평"
+  end
+
+  test "streaming one line at a time matches the full parse on a long item" do
+    skip "python3 not available" unless system("python3", "--version", out: File::NULL, err: File::NULL)
+
+    body = (1..20_000).map { |i| "프로젝트 #{i}에서 응답 시간을 줄였습니다.\n" }.join
+    text = "### 1. **긴 항목**\n#{body}#### 1) 세부 평가\n마무리\n\n### 2. **짧은 항목**\n끝\n"
+
+    result = parse(text, code: STREAM_CODE)
+
+    assert_equal result["parsed"], result["streamed"]
+    assert_equal [ "1", "2" ], result["streamed"].map { |item| item["number"] }
+  end
+
+  test "streaming one line at a time matches the full parse with #### sub-headings" do
+    skip "python3 not available" unless system("python3", "--version", out: File::NULL, err: File::NULL)
+
+    result = parse(SUBHEADING_ANALYSIS, code: STREAM_CODE)
+
+    assert_equal result["parsed"], result["streamed"]
+  end
+end
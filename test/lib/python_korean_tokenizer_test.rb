@@ -0,0 +1,44 @@
+require "test_helper"
+require "open3"
+require "json"
+
+class PythonKoreanTokenizerTest < ActiveSupport::TestCase
+  SCRIPTS_PATH = Rails.root.join("python_analysis").to_s
+
+  TOKENIZE_CODE = <<~PYTHON
+    import json, sys
+    import korean_tokenizer
+
+    text = sys.stdin.read()
+    sentences, words = korean_tokenizer.tokenize(text)
+    print(json.dumps({
+        "sentences": [text[start:end] for start, end in sentences],
+        "words": [text[start:end] for start, end in words]
+    }, ensure_ascii=False))
+  PYTHON
+
+  def tokenize(text)
+    output, error, status = Open3.capture3("python3", "-c", TOKENIZE_CODE, stdin_data: text, chdir: SCRIPTS_PATH)
+    assert status.success?, error
+    JSON.parse(output)
+  end
+
+  test "drops sentence-initial enumerators written as N. and N)" do
+    skip "python3 not available" unless system("python3", "--version", out: File::NULL, err: File::NULL)
+
+    [ "1. React 개발", "2) React 개발" ].each do |text|
+      result = tokenize(text)
+
+      assert_equal [ "React", "개발" ], result["words"], text
+      assert_equal [ "React 개발" ], result["sentences"], text
+    end
+  end
+
+  test "keeps numbers followed by ) inside a sentence" do
+    skip "python3 not available" unless system("python3", "--version", out: File::NULL, err: File::NULL)
+
+    result = tokenize("경력 2) 이상")
+
+    assert_equal [ "경력", "2", "이상" ], result["words"]
+  end
+end
@@ -0,0 +1,55 @@
+require "test_helper"
+require "open3"
+require "json"
+
+class PythonPdfExtractorTest < ActiveSupport::TestCase
+  SCRIPTS_PATH = Rails.root.join("lib", "python").to_s
+
+  # 자소서 1장 + 애매한(unknown) 페이지 12장 → 12장이 layout 단계로 넘어감
+  # 보관소 크기가 최종 페이지 텍스트(단계별로 한 벌씩) 합과 같아야 함
+  TIERED_CODE = <<~PYTHON
+    import json, os, sys, tempfile
+
+    try:
+        import fitz
+        from pdf_extractor_enhanced import EnhancedPdfExtractor, _pdfplumber_pages
+    except ImportError as e:
+        print(json.dumps({"skipped": str(e)}))
+        sys.exit(0)
+
+    path = os.path.join(tempfile.mkdtemp(), "tiered.pdf")
+    doc = fitz.open()
+    bodies = ["COVER LETTER\\nMotivation " + "I built and shipped services. " * 20]
+    bodies += ["Appendix notes page %d" % n for n in range(12)]
+    for body in bodies:
+        doc.new_page().insert_text((50, 72), body)
+    doc.save(path)
+
+    extractor = EnhancedPdfExtractor(method="tiered", memory_limit=1 << 20, use_cache=False, workers=1)
+    result = extractor.extract_from_file(path, full_scan=True)
+
+    pdf = fitz.open(path)
+    expected = 0
+    for i, tier in enumerate(result["page_tiers"]):
+        text = pdf[i].get_text() if tier == "text" else _pdfplumber_pages(path, [i])[0]["text"]
+        expected += len(text.encode("utf-8"))
+
+    print(json.dumps({
+        "tier_counts": result["tier_counts"],
+        "spooled_bytes": result["memory_bounded"]["spooled_bytes"],
+        "expected_bytes": expected
+    }))
+  PYTHON
+
+  test "tiered extraction stores each page text once in the memory-bounded store" do
+    skip "python3 not available" unless system("python3", "--version", out: File::NULL, err: File::NULL)
+
+    output, error, status = Open3.capture3("python3", "-c", TIERED_CODE, chdir: SCRIPTS_PATH)
+    assert status.success?, error
+    result = JSON.parse(output)
+    skip "PDF libraries not available: #{result["skipped"]}" if result["skipped"]
+
+    assert_equal({ "text" => 1, "layout" => 12 }, result["tier_counts"])
+    assert_equal result["expected_bytes"], result["spooled_bytes"]
+  end
+end
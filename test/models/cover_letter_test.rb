@@ -1,7 +1,23 @@
 require "test_helper"
 
 class CoverLetterTest < ActiveSupport::TestCase
-  # test "the truth" do
-  #   assert true
-  # end
+  # 파이썬 없이 배치 채점 결과만 돌려주는 서비스
+  FakeScoringService = Struct.new(:score) do
+    def score_cover_letters(records)
+      records.map { score }
+    end
+  end
+
+  test "rescore_batch stores scores and touches updated_at" do
+    letter = cover_letters(:one)
+    letter.update_columns(updated_at: 2.days.ago)
+
+    travel_to Time.zone.local(2026, 1, 15, 12, 0, 0) do
+      assert_equal 1, CoverLetter.rescore_batch([ letter ], service: FakeScoringService.new({ "total" => 80 }))
+
+      letter.reload
+      assert_equal 80, letter.deep_analysis_data["scores"]["total"]
+      assert_equal Time.current, letter.updated_at
+    end
+  end
 end